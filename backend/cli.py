@@ -13,6 +13,7 @@ One-command processing:
 import argparse
 import json
 import os
+import re
 import shutil
 import subprocess
 import sys
@@ -20,8 +21,8 @@ import textwrap
 import time
 from pathlib import Path
 
-import questionary
-from questionary import Style
+# questionary pulls in prompt_toolkit (~100ms) — imported inside the
+# interactive flows so scripted runs and `podcli info` start fast.
 from version import VERSION
 
 # Windows streams default to cp1252, which can't encode chars like '→'; podcli is UTF-8.
@@ -76,8 +77,13 @@ from presets import MIN_CLIP_DURATION, MAX_CLIP_DURATION, TARGET_CLIP_DURATION_M
 from services.knowledge_base import is_empty as kb_is_empty, kb_files
 
 
+_JSON_START_RE = re.compile(r"\s*[\[{]")
+
+
 def _parse_json_transcript(raw_text):
-    data = json.loads(raw_text)
+    from utils.jsonio import loads
+
+    data = loads(raw_text)
     if isinstance(data, list):
         return data, [], {}
     return data.get("words", []), data.get("segments", []), data
@@ -519,10 +525,6 @@ def cmd_reel(args):
 
 def cmd_process(args):
     """Full auto pipeline: transcribe → suggest → export."""
-    from services.clip_generator import generate_clip
-    from services.transcript_parser import detect_and_parse
-    from services.audio_analyzer import get_energy_profile
-    from services.audio_events import get_event_profile, is_available as audio_events_available
     from services.encoder import get_encoder_info
     from presets import get_preset, DEFAULT_PRESET, MIN_CLIP_DURATION, MAX_CLIP_DURATION, TARGET_CLIP_DURATION_MIN, TARGET_CLIP_DURATION_MAX
 
@@ -635,8 +637,16 @@ def cmd_process(args):
         config["no_cache"] = True
     if args.quality:
         config["quality"] = args.quality
+    if getattr(args, "jobs", None):
+        config["render_jobs"] = max(1, args.jobs)
     if getattr(args, "allow_ass_fallback", False):
         config["allow_ass_fallback"] = True
+    if getattr(args, "copy_only", False):
+        # Raw previews: nothing is re-encoded, so there is no frame to put a
+        # thumbnail on and no point paying for AI copy on a draft.
+        config["copy_only"] = True
+        config["generate_thumbnails"] = False
+        config["generate_content"] = False
 
     if getattr(args, "fast", False):
         # Fast mode is a draft-render path inspired by Clipify: skip the
@@ -677,6 +687,8 @@ def cmd_process(args):
     print(f"  Quality: {quality}")
     if config.get("fast_mode"):
         print("  Mode:    fast draft")
+    if config.get("copy_only"):
+        print("  Mode:    raw preview (stream copy, no captions or crop)")
     print(f"  Video:   {os.path.basename(video_path)}")
     print()
 
@@ -732,12 +744,15 @@ def cmd_process(args):
             print(f"  [1/4] Skipping transcription ({content_profile.name} profile uses audio/visual signals)")
 
     if args.transcript:
+        from services.transcript_parser import detect_and_parse
+
         print("  [1/4] Loading transcript...")
         with open(args.transcript, "r", encoding="utf-8") as f:
             raw_text = f.read()
 
-        # Detect format
-        if raw_text.strip().startswith("{") or raw_text.strip().startswith("["):
+        # Detect format. Sniff the first non-space character rather than
+        # strip(), which copies a possibly multi-MB word-level JSON twice.
+        if _JSON_START_RE.match(raw_text):
             words, segments, result = _parse_json_transcript(raw_text)
             print(f"         JSON transcript: {len(words)} words")
         else:
@@ -753,6 +768,9 @@ def cmd_process(args):
             result = parsed
             fmt = parsed.get("format", "speaker")
             print(f"         Parsed {fmt}: {len(segments)} segments, {len(words)} words")
+        # Only the parsed words/segments are used from here on; don't keep the
+        # raw text alive through the rest of a long render.
+        del raw_text
 
         if not result.get("face_map"):
             cached_face_map = _cached_face_map(video_path)
@@ -855,17 +873,37 @@ def cmd_process(args):
     events_data = None
     reaction_times = None
     if config.get("energy_boost", True):
-        print("  [2/4] Analyzing audio energy...")
+        # Signals depend only on the audio, so a re-run with another style or
+        # preset reuses the cached profiles instead of decoding the source again.
+        from services.audio_analyzer import get_energy_profile
+        from services.audio_events import get_event_profile, is_available as audio_events_available
+        from services.signal_cache import load_signals, save_signals
+
+        cached_signals = {} if config.get("no_cache", False) else load_signals(video_path)
+        cached_energy = cached_signals.get("energy_data")
+        cached_events = cached_signals.get("events_data")
+        if cached_energy is not None:
+            print("  [2/4] Loaded audio analysis from cache")
+        else:
+            print("  [2/4] Analyzing audio energy...")
         try:
-            profile = get_energy_profile(video_path, segments, wav_path=shared_wav.get())
+            profile = get_energy_profile(
+                video_path, segments,
+                wav_path=None if cached_energy is not None else shared_wav.get(),
+                energy_data=cached_energy,
+            )
             energy_scores = profile["segment_scores"]
             energy_data = profile["energy_data"]
             print(f"         {len(profile['peak_times'])} peak moments found")
         except Exception as e:
             print(f"         Skipped (error: {e})")
-        if audio_events_available():
+        if cached_events is not None or audio_events_available():
             try:
-                reactions = get_event_profile(video_path, segments, wav_path=shared_wav.get())
+                reactions = get_event_profile(
+                    video_path, segments,
+                    wav_path=None if cached_events is not None else shared_wav.get(),
+                    events_data=cached_events,
+                )
                 reaction_scores = reactions["segment_scores"]
                 events_data = reactions["events_data"]
                 reaction_times = reactions["reaction_times"]
@@ -874,6 +912,11 @@ def cmd_process(args):
                     print(f"         {n} laughter/reaction moments found")
             except Exception as e:
                 print(f"         Reactions skipped (error: {e})")
+        save_signals(
+            video_path,
+            energy_data=energy_data if cached_energy is None else None,
+            events_data=events_data if cached_events is None else None,
+        )
     else:
         print("  [2/4] Audio analysis skipped (--no-energy)")
 
@@ -977,6 +1020,8 @@ def cmd_process(args):
         return
 
     # ── Step 4: Export ──
+    from services.clip_generator import generate_clip
+
     # Check if thumbnail generation is enabled
     thumb_dir = os.path.join(output_dir, "thumbnails")
     _thumb_intro_duration = 0.8
@@ -1035,36 +1080,88 @@ def cmd_process(args):
     _skip_review = not config.get("review_each_clip", False) or not sys.stdin.isatty()
     interrupted = False
 
+    def _render(i: int, clip: dict) -> dict:
+        return generate_clip(
+            video_path=video_path,
+            start_second=clip["start_second"],
+            end_second=clip["end_second"],
+            caption_style=config.get("caption_style", "branded"),
+            crop_strategy=config.get("crop_strategy", "face"),
+            format=config.get("format", "vertical"),
+            transcript_words=words,
+            title=clip.get("title", f"clip_{i+1}"),
+            output_dir=output_dir,
+            logo_path=config.get("logo_path") or None,
+            outro_path=config.get("outro_path") or None,
+            intro_path=config.get("intro_path") or None,
+            keep_segments=clip.get("segments"),
+            face_map=face_map,
+            allow_ass_fallback=config.get("allow_ass_fallback", False),
+            use_ass_captions=config.get("use_ass_captions", False),
+        )
+
+    # Without per-clip review nothing interactive sits between renders, so the
+    # encodes run side by side; thumbnails and AI content stay sequential below.
+    from utils.proc import render_concurrency
+
+    jobs = min(config.get("render_jobs") or render_concurrency(), len(clips))
+    prerendered = {}
+
+    if config.get("copy_only"):
+        # One stream-copy ffmpeg run covers every clip; the loop below only
+        # reports the results.
+        from services.clip_generator import export_raw_clips
+
+        print("         Cutting raw previews (stream copy)...")
+        try:
+            prerendered = dict(enumerate(export_raw_clips(video_path, clips, output_dir)))
+        except Exception as e:
+            prerendered = {i: e for i in range(len(clips))}
+
     try:
+        if _skip_review and jobs > 1 and not prerendered:
+            from concurrent.futures import ThreadPoolExecutor, as_completed
+            from utils.proc import render_pool
+
+            print(f"         Rendering {jobs} clips at a time...")
+            pool = ThreadPoolExecutor(max_workers=jobs)
+            try:
+                with render_pool(jobs):
+                    futures = {pool.submit(_render, i, clip): i for i, clip in enumerate(clips)}
+                    for fut in as_completed(futures):
+                        i = futures[fut]
+                        try:
+                            prerendered[i] = fut.result()
+                            print(f"         ✓ Rendered {i+1}/{len(clips)}: {clips[i]['title'][:40]}")
+                        except Exception as e:
+                            prerendered[i] = e
+            except KeyboardInterrupt:
+                results.extend(r for _, r in sorted(prerendered.items()) if isinstance(r, dict))
+                raise
+            finally:
+                pool.shutdown(wait=False, cancel_futures=True)
+
         for i, clip in enumerate(clips):
             ok = False
             result = None
-            with _Spinner(f"Clip {i+1}/{len(clips)}: {clip['title'][:40]}...") as sp:
-                try:
-                    result = generate_clip(
-                        video_path=video_path,
-                        start_second=clip["start_second"],
-                        end_second=clip["end_second"],
-                        caption_style=config.get("caption_style", "branded"),
-                        crop_strategy=config.get("crop_strategy", "face"),
-                        format=config.get("format", "vertical"),
-                        transcript_words=words,
-                        title=clip.get("title", f"clip_{i+1}"),
-                        output_dir=output_dir,
-                        logo_path=config.get("logo_path") or None,
-                        outro_path=config.get("outro_path") or None,
-                        intro_path=config.get("intro_path") or None,
-                        keep_segments=clip.get("segments"),
-                        face_map=face_map,
-                        allow_ass_fallback=config.get("allow_ass_fallback", False),
-                        use_ass_captions=config.get("use_ass_captions", False),
-                    )
-                    results.append(result)
-                    ok = True
-                except Exception as e:
-                    print(f"\n         ✗ {e}")
-                    results.append({"status": "error", "error": str(e)})
+            if i in prerendered:
+                result = prerendered[i]
+                if isinstance(result, Exception):
+                    print(f"         ✗ Clip {i+1}/{len(clips)}: {result}")
+                    results.append({"status": "error", "error": str(result)})
                     continue
+                results.append(result)
+                ok = True
+            else:
+                with _Spinner(f"Clip {i+1}/{len(clips)}: {clip['title'][:40]}...") as sp:
+                    try:
+                        result = _render(i, clip)
+                        results.append(result)
+                        ok = True
+                    except Exception as e:
+                        print(f"\n         ✗ {e}")
+                        results.append({"status": "error", "error": str(e)})
+                        continue
             if ok:
                 print(f"         ✓ Clip {i+1}/{len(clips)}: {result['file_size_mb']}MB")
 
@@ -1255,24 +1352,7 @@ def cmd_process(args):
                     # Re-render
                     with _Spinner(f"Re-rendering clip {i+1}..."):
                         try:
-                            result = generate_clip(
-                                video_path=video_path,
-                                start_second=clip["start_second"],
-                                end_second=clip["end_second"],
-                                caption_style=config.get("caption_style", "branded"),
-                                crop_strategy=config.get("crop_strategy", "face"),
-                                format=config.get("format", "vertical"),
-                                transcript_words=words,
-                                title=clip.get("title", f"clip_{i+1}"),
-                                output_dir=output_dir,
-                                logo_path=config.get("logo_path") or None,
-                                outro_path=config.get("outro_path") or None,
-                                intro_path=config.get("intro_path") or None,
-                                keep_segments=clip.get("segments"),
-                                face_map=face_map,
-                                allow_ass_fallback=config.get("allow_ass_fallback", False),
-                                use_ass_captions=config.get("use_ass_captions", False),
-                            )
+                            result = _render(i, clip)
                             results[-1] = result
                             print(f"         ✓ Re-rendered: {result['file_size_mb']}MB")
                             # Open new version
@@ -1329,16 +1409,24 @@ class _Spinner:
         self._indent = indent
         self._stop = threading.Event()
         self._thread = None
+        self._animate = False
 
     def __enter__(self):
         import threading
         self._stop.clear()
+        # Piped or CI output can't repaint a line; ten frames a second would
+        # just flood the log, so only a terminal gets the animation.
+        self._animate = sys.stdout.isatty()
+        if not self._animate:
+            return self
 
         def _run():
             frames = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
+            out = sys.stdout
             i = 0
             while not self._stop.is_set():
-                print(f"\r{self._indent}{frames[i % len(frames)]}  {self._msg[:55]:<55}", end="", flush=True)
+                out.write(f"\r{self._indent}{frames[i % len(frames)]}  {self._msg[:55]:<55}")
+                out.flush()
                 i += 1
                 self._stop.wait(0.1)
 
@@ -1353,7 +1441,9 @@ class _Spinner:
         self._stop.set()
         if self._thread:
             self._thread.join(timeout=1)
-        print(f"\r{self._indent}{'':60}\r", end="")
+            self._thread = None
+        if self._animate:
+            sys.stdout.write(f"\r{self._indent}{'':60}\r")
 
 
 def _wrap_text(text: str, indent: str) -> str:
@@ -1855,6 +1945,72 @@ def _post_render_loop(
     print()
 
 
+def _keyword_counter(keywords: list[str]):
+    """Build a counter of how many distinct `keywords` occur in a text.
+
+    Equivalent to ``sum(kw in text for kw in keywords)`` but scans the text
+    once: a zero-width lookahead tries every offset in one regex pass, so
+    overlapping hits ("when we were" -> "when we" + "we were") still count.
+    Alternatives are tried longest-first, so a keyword that is a prefix of a
+    longer one is recovered through the substring closure below.
+    """
+    ordered = sorted(set(keywords), key=len, reverse=True)
+    pattern = re.compile("(?=(" + "|".join(re.escape(k) for k in ordered) + "))")
+    contained = {k: frozenset(c for c in ordered if c in k) for k in ordered}
+
+    def count(text: str) -> int:
+        found = set()
+        for m in pattern.finditer(text):
+            hit = m.group(1)
+            if hit not in found:
+                found |= contained[hit]
+        return len(found)
+
+    return count
+
+
+# ── Heuristic clip-scoring signals (compiled once per process) ──
+
+# Strong hooks — things people say right before a great moment
+_HOOK_PHRASES = (
+    "here's the thing", "let me tell you", "the truth is",
+    "what people don't realize", "nobody talks about",
+    "the biggest mistake", "the real reason", "here's what happened",
+    "i'll never forget", "that's when i realized", "the moment i knew",
+    "so here's the secret", "this is the part where", "what i learned",
+    "the one thing", "if i'm being honest", "the hard truth",
+)
+
+# Insight signals — content that teaches or reveals
+_INSIGHT_WORDS = (
+    "because", "actually", "specifically", "the problem is",
+    "most people", "counterintuitive", "the data shows",
+    "what we found", "turns out", "the reason",
+    "in practice", "the trick", "fundamentally",
+)
+
+# Story signals — narrative elements that pull people in
+_STORY_SIGNALS = (
+    "when i", "when we", "i remember", "years ago", "at that point",
+    "we decided", "we were", "i was", "the first time",
+    "that morning", "one day", "back then", "suddenly",
+)
+
+# Clips that reference other parts of the conversation need context
+_CONTEXT_REFS = (
+    "as i said", "like i mentioned", "going back to",
+    "earlier when", "as we discussed", "you said earlier",
+)
+
+_HOOK_RE = re.compile("|".join(re.escape(p) for p in _HOOK_PHRASES))
+_CONTEXT_REF_RE = re.compile("|".join(re.escape(p) for p in _CONTEXT_REFS))
+_count_insights = _keyword_counter(_INSIGHT_WORDS)
+_count_story = _keyword_counter(_STORY_SIGNALS)
+
+# Numbers/specifics — concrete details increase credibility
+_NUMBER_RE = re.compile(r'\$[\d,.]+[mkb]?|\d+%|\d+\.\d+[x×]|\d{2,}', re.IGNORECASE)
+
+
 def _suggest_clips(
     segments: list,
     energy_scores: list | None = None,
@@ -1876,41 +2032,6 @@ def _suggest_clips(
     7. Density — information per second (too sparse = boring)
     """
 
-    # ── Signal keywords by category (weighted differently) ──
-
-    # Strong hooks — things people say right before a great moment
-    HOOK_PHRASES = [
-        "here's the thing", "let me tell you", "the truth is",
-        "what people don't realize", "nobody talks about",
-        "the biggest mistake", "the real reason", "here's what happened",
-        "i'll never forget", "that's when i realized", "the moment i knew",
-        "so here's the secret", "this is the part where", "what i learned",
-        "the one thing", "if i'm being honest", "the hard truth",
-    ]
-
-    # Insight signals — content that teaches or reveals
-    INSIGHT_WORDS = [
-        "because", "actually", "specifically", "the problem is",
-        "most people", "counterintuitive", "the data shows",
-        "what we found", "turns out", "the reason",
-        "in practice", "the trick", "fundamentally",
-    ]
-
-    # Story signals — narrative elements that pull people in
-    STORY_SIGNALS = [
-        "when i", "when we", "i remember", "years ago", "at that point",
-        "we decided", "we were", "i was", "the first time",
-        "that morning", "one day", "back then", "suddenly",
-    ]
-
-    # Numbers/specifics — concrete details increase credibility
-    NUMBER_PATTERN = None
-    try:
-        import re
-        NUMBER_PATTERN = re.compile(r'\$[\d,.]+[mkb]?|\d+%|\d+\.\d+[x×]|\d{2,}', re.IGNORECASE)
-    except Exception:
-        pass
-
     # Sentence boundary detection
     def _is_sentence_start(text):
         """Check if text starts at a sentence boundary."""
@@ -1954,168 +2075,197 @@ def _suggest_clips(
     # Multiple window sizes to catch different moment lengths
     win_sizes = [5, 7, 9, 11, 14]
 
+    # Enumerate candidate spans before scoring anything. Neighbouring windows
+    # of different sizes often snap to the same sentence-bounded span, and a
+    # span's score depends only on its segments, so each is scored once.
+    spans = []
+    seen_spans = set()
     for win_size in win_sizes:
         step = max(1, int(win_size * 0.5))
         for i in range(0, len(segments) - win_size, step):
             # Snap window start and end to sentence boundaries
             snap_start = _find_sentence_boundary_start(segments, i)
             snap_end = _find_sentence_boundary_end(segments, i + win_size - 1)
-
-            win = segments[snap_start : snap_end + 1]
-            if len(win) < 3:
+            if snap_end - snap_start < 2 or (snap_start, snap_end) in seen_spans:
                 continue
+            seen_spans.add((snap_start, snap_end))
 
-            text = " ".join(s.get("text", "") for s in win)
-            start = win[0].get("start", 0)
-            end = win[-1].get("end", 0)
-            dur = end - start
-
+            dur = segments[snap_end].get("end", 0) - segments[snap_start].get("start", 0)
             if dur < min_dur or dur > max_dur:
                 continue
+            spans.append((snap_start, snap_end))
+
+    # Overlapping spans share most of their segments, so each segment's text
+    # is fetched and lowercased once rather than once per span it falls in.
+    from itertools import accumulate
+    from utils.text import truncate_title
+
+    seg_texts = [s.get("text", "") for s in segments]
+    seg_lower = [t.lower() for t in seg_texts]
+    # Word and "!" counts are additive across the joined text, so prefix sums
+    # turn each span's total into a single subtraction.
+    cum_words = list(accumulate((len(t.split()) for t in seg_texts), initial=0))
+    cum_exclaims = list(accumulate((t.count("!") for t in seg_texts), initial=0))
+
+    for snap_start, snap_end in spans:
+        win = segments[snap_start : snap_end + 1]
+        text = " ".join(seg_texts[snap_start : snap_end + 1])
+        start = win[0].get("start", 0)
+        end = win[-1].get("end", 0)
+        dur = end - start
+
+        text_lower = " ".join(seg_lower[snap_start : snap_end + 1])
+        score = 0
+        reasons = []
+
+        # ── 1. Hook strength (0-8 pts) ──
+        # Check if clip opens with a strong hook
+        first_30_chars = " ".join(seg_lower[snap_start : min(snap_start + 3, snap_end + 1)])
+        if _HOOK_RE.search(first_30_chars):
+            score += 5
+            reasons.append("strong_hook")
+
+        # Question as opener
+        first_seg_text = win[0].get("text", "")
+        if "?" in first_seg_text:
+            score += 3
+            reasons.append("question_hook")
+
+        # ── 2. Sentence boundary quality (0-4 pts) ──
+        starts_clean = _is_sentence_start(win[0].get("text", ""))
+        ends_clean = _is_sentence_end(win[-1].get("text", ""))
+        if starts_clean:
+            score += 2
+        if ends_clean:
+            score += 2
+            reasons.append("clean_ending")
+
+        # ── 3. Content signals (0-10 pts) ──
+        insight_count = _count_insights(text_lower)
+        story_count = _count_story(text_lower)
+
+        if insight_count >= 2:
+            score += min(insight_count * 1.5, 5)
+            reasons.append("insightful")
+        if story_count >= 2:
+            score += min(story_count * 1.5, 5)
+            reasons.append("narrative")
+
+        # Exclamation = passion/emphasis
+        exclaim_count = cum_exclaims[snap_end + 1] - cum_exclaims[snap_start]
+        if exclaim_count >= 1:
+            score += min(exclaim_count, 3)
+
+        # ── 4. Specificity — numbers, dollars, percentages (0-4 pts) ──
+        numbers = _NUMBER_RE.findall(text)
+        if numbers:
+            score += min(len(numbers) * 1.5, 4)
+            reasons.append("specific_numbers")
+
+        # ── 5. Speaker dynamics (0-5 pts) ──
+        speakers_in_window = set()
+        speaker_changes = 0
+        prev_speaker = None
+        for s in win:
+            sp = s.get("speaker")
+            if sp:
+                speakers_in_window.add(sp)
+                if prev_speaker and sp != prev_speaker:
+                    speaker_changes += 1
+                prev_speaker = sp
+
+        if len(speakers_in_window) > 1:
+            # Multi-speaker clips are more dynamic
+            score += 2
+            if speaker_changes >= 2:
+                score += min(speaker_changes, 3)
+                reasons.append("dialogue")
+
+        # ── 6. Audio energy (0-6 pts) ──
+        if energy_scores:
+            seg_energies = energy_scores[snap_start : snap_end + 1]
+            if seg_energies:
+                avg_e = sum(seg_energies) / len(seg_energies)
+                max_e = max(seg_energies)
+                # Energy variance = dynamic range (builds tension)
+                variance = sum((e - avg_e) ** 2 for e in seg_energies) / len(seg_energies)
+                energy_score = avg_e * 0.3 + max_e * 0.3 + (variance ** 0.5) * 0.4
+                score += min(energy_score, 6)
+                if max_e > 7:
+                    reasons.append("high_energy")
+
+        # ── 6b. Laughter / reactions (0-6 pts) ──
+        if reaction_scores:
+            seg_reactions = reaction_scores[snap_start : snap_end + 1]
+            if seg_reactions:
+                max_r = max(seg_reactions)
+                score += min(max_r, 6)
+                if max_r > 3:
+                    reasons.append("laughter")
+
+        # ── 7. Density check — penalize sparse/rambling segments ──
+        words_per_sec = (cum_words[snap_end + 1] - cum_words[snap_start]) / max(dur, 1)
+        if words_per_sec < 1.5:
+            score *= 0.7  # Too sparse, probably silence or filler
+        elif words_per_sec > 2.5:
+            score *= 1.1  # Dense = packed with info
+
+        # ── 8. Anti-patterns — penalize weak clips ──
+        # Clips that reference other parts of the conversation
+        if _CONTEXT_REF_RE.search(text_lower):
+            score *= 0.5  # Needs context = bad short
+
+        # Mid-sentence start
+        if not starts_clean:
+            score *= 0.8
+
+        if score < 5:  # Higher threshold = better clips
+            continue
 
-            text_lower = text.lower()
-            score = 0
-            reasons = []
-
-            # ── 1. Hook strength (0-8 pts) ──
-            # Check if clip opens with a strong hook
-            first_30_chars = " ".join(s.get("text", "") for s in win[:3]).lower()
-            for phrase in HOOK_PHRASES:
-                if phrase in first_30_chars:
-                    score += 5
-                    reasons.append("strong_hook")
-                    break
-
-            # Question as opener
-            first_seg_text = win[0].get("text", "")
-            if "?" in first_seg_text:
-                score += 3
-                reasons.append("question_hook")
-
-            # ── 2. Sentence boundary quality (0-4 pts) ──
-            starts_clean = _is_sentence_start(win[0].get("text", ""))
-            ends_clean = _is_sentence_end(win[-1].get("text", ""))
-            if starts_clean:
-                score += 2
-            if ends_clean:
-                score += 2
-                reasons.append("clean_ending")
-
-            # ── 3. Content signals (0-10 pts) ──
-            insight_count = sum(1 for kw in INSIGHT_WORDS if kw in text_lower)
-            story_count = sum(1 for kw in STORY_SIGNALS if kw in text_lower)
-
-            if insight_count >= 2:
-                score += min(insight_count * 1.5, 5)
-                reasons.append("insightful")
-            if story_count >= 2:
-                score += min(story_count * 1.5, 5)
-                reasons.append("narrative")
-
-            # Exclamation = passion/emphasis
-            exclaim_count = text.count("!")
-            if exclaim_count >= 1:
-                score += min(exclaim_count, 3)
-
-            # ── 4. Specificity — numbers, dollars, percentages (0-4 pts) ──
-            if NUMBER_PATTERN:
-                numbers = NUMBER_PATTERN.findall(text)
-                if numbers:
-                    score += min(len(numbers) * 1.5, 4)
-                    reasons.append("specific_numbers")
-
-            # ── 5. Speaker dynamics (0-5 pts) ──
-            speakers_in_window = set()
-            speaker_changes = 0
-            prev_speaker = None
-            for s in win:
-                sp = s.get("speaker")
-                if sp:
-                    speakers_in_window.add(sp)
-                    if prev_speaker and sp != prev_speaker:
-                        speaker_changes += 1
-                    prev_speaker = sp
-
-            if len(speakers_in_window) > 1:
-                # Multi-speaker clips are more dynamic
-                score += 2
-                if speaker_changes >= 2:
-                    score += min(speaker_changes, 3)
-                    reasons.append("dialogue")
-
-            # ── 6. Audio energy (0-6 pts) ──
-            if energy_scores:
-                seg_energies = energy_scores[snap_start : snap_end + 1]
-                if seg_energies:
-                    avg_e = sum(seg_energies) / len(seg_energies)
-                    max_e = max(seg_energies)
-                    # Energy variance = dynamic range (builds tension)
-                    variance = sum((e - avg_e) ** 2 for e in seg_energies) / len(seg_energies)
-                    energy_score = avg_e * 0.3 + max_e * 0.3 + (variance ** 0.5) * 0.4
-                    score += min(energy_score, 6)
-                    if max_e > 7:
-                        reasons.append("high_energy")
-
-            # ── 6b. Laughter / reactions (0-6 pts) ──
-            if reaction_scores:
-                seg_reactions = reaction_scores[snap_start : snap_end + 1]
-                if seg_reactions:
-                    max_r = max(seg_reactions)
-                    score += min(max_r, 6)
-                    if max_r > 3:
-                        reasons.append("laughter")
-
-            # ── 7. Density check — penalize sparse/rambling segments ──
-            words_per_sec = len(text.split()) / max(dur, 1)
-            if words_per_sec < 1.5:
-                score *= 0.7  # Too sparse, probably silence or filler
-            elif words_per_sec > 2.5:
-                score *= 1.1  # Dense = packed with info
-
-            # ── 8. Anti-patterns — penalize weak clips ──
-            # Clips that reference other parts of the conversation
-            if any(ref in text_lower for ref in [
-                "as i said", "like i mentioned", "going back to",
-                "earlier when", "as we discussed", "you said earlier",
-            ]):
-                score *= 0.5  # Needs context = bad short
-
-            # Mid-sentence start
-            if not starts_clean:
-                score *= 0.8
-
-            # ── Build title from the hook ──
-            # Find the first strong sentence as the title
-            title = ""
-            for s in win[:4]:
-                t = s.get("text", "").strip()
-                if t and len(t) > 15:
-                    title = t
-                    break
-            if not title:
-                title = text[:60].strip()
-            from utils.text import truncate_title
-            title = truncate_title(title)
-
-            if score >= 5:  # Higher threshold = better clips
-                clips.append({
-                    "title": title,
-                    "start_second": round(start, 1),
-                    "end_second": round(end, 1),
-                    "duration": round(dur),
-                    "score": round(score, 2),
-                    "reasons": reasons,
-                    "preview": text[:120].strip(),
-                })
+        # ── Build title from the hook ──
+        # Find the first strong sentence as the title
+        title = ""
+        for t in seg_texts[snap_start : min(snap_start + 4, snap_end + 1)]:
+            t = t.strip()
+            if t and len(t) > 15:
+                title = t
+                break
+        if not title:
+            title = text[:60].strip()
+        title = truncate_title(title)
+
+        clips.append({
+            "title": title,
+            "start_second": round(start, 1),
+            "end_second": round(end, 1),
+            "duration": round(dur),
+            "score": round(score, 2),
+            "reasons": reasons,
+            "preview": text[:120].strip(),
+        })
 
     # ── Deduplicate overlapping clips (keep highest score) ──
-    clips.sort(key=lambda c: c["score"], reverse=True)
+    # Kept clips are indexed by start so each candidate only visits the ones
+    # that can reach it: starting before its end, and no earlier than its start
+    # minus the longest kept clip. Candidates come off a heap in score order
+    # (ties by position, as a stable sort would give), so only the candidates
+    # examined before top_n are kept pay for ordering.
+    from bisect import bisect_left, bisect_right
+    import heapq
+
+    ranked = [(-c["score"], i) for i, c in enumerate(clips)]
+    heapq.heapify(ranked)
     selected = []
-    for clip in clips:
+    sel_starts = []
+    by_start = []
+    longest = 0.0
+    while ranked:
+        clip = clips[heapq.heappop(ranked)[1]]
+        lo = bisect_left(sel_starts, clip["start_second"] - longest)
+        hi = bisect_left(sel_starts, clip["end_second"])
         overlap = False
-        for sel in selected:
-            if (clip["start_second"] < sel["end_second"] and
-                clip["end_second"] > sel["start_second"]):
+        for sel in by_start[lo:hi]:
+            if clip["end_second"] > sel["start_second"] and clip["start_second"] < sel["end_second"]:
                 overlap_amt = (min(clip["end_second"], sel["end_second"]) -
                               max(clip["start_second"], sel["start_second"]))
                 if overlap_amt > min(clip["duration"], sel["duration"]) * 0.3:
@@ -2123,6 +2273,10 @@ def _suggest_clips(
                     break
         if not overlap:
             selected.append(clip)
+            idx = bisect_right(sel_starts, clip["start_second"])
+            sel_starts.insert(idx, clip["start_second"])
+            by_start.insert(idx, clip)
+            longest = max(longest, clip["end_second"] - clip["start_second"])
         if len(selected) >= top_n:
             break
 
@@ -2581,7 +2735,7 @@ def cmd_bake_thumbnail(args):
                 from utils.proc import run as proc_run
                 trimmed = os.path.join(work, "trimmed.mp4")
                 proc_run(["ffmpeg", "-y", "-ss", str(args.strip_start), "-i", clip, "-c", "copy",
-                          "-movflags", "+faststart", trimmed], timeout=120, check=False)
+                          "-movflags", "+faststart", trimmed], timeout=120, check=False, output=False)
                 if os.path.exists(trimmed):
                     clip = trimmed
 
@@ -2655,7 +2809,7 @@ def cmd_swap_thumbnail(args):
         "-c", "copy", "-movflags", "+faststart",
         trimmed_path,
     ]
-    result = proc_run(trim_cmd, timeout=60, check=False)
+    result = proc_run(trim_cmd, timeout=60, check=False, output=False)
     if result.returncode != 0:
         print(f"  Failed to trim: {result.stderr[-200:]}", file=sys.stderr)
         sys.exit(1)
@@ -3600,6 +3754,7 @@ def print_help():
     print(f"    {green}--caption-style{reset} {gray}<style>{reset}  branded | hormozi | karaoke | subtle")
     print(f"    {green}--crop{reset} {gray}<strategy>{reset}       speaker | speaker-hardcut | face | center")
     print(f"    {green}--fast{reset}                 Draft mode: tiny Whisper, heuristic clips, low quality")
+    print(f"    {green}--copy-only{reset}            Raw previews: stream-copy cuts, no captions or crop")
     print(f"    {green}--logo{reset} {gray}<asset|path>{reset}     Overlay logo image")
     print(f"    {green}--outro{reset} {gray}<asset|path>{reset}    Append outro video")
     print(f"    {green}--quality{reset} {gray}<level>{reset}       low | medium | high | max")
@@ -3724,6 +3879,9 @@ def _first_run_setup() -> bool:
     """Guided setup on the first interactive run. Skippable, asked once.
     False means the user cancelled: nothing is saved and the caller must not
     treat the run as a success."""
+    import questionary
+    from questionary import Style
+
     accent = "\033[38;2;212;135;74m"
     gray = "\033[38;5;245m"
     green = "\033[38;2;74;222;128m"
@@ -3831,9 +3989,10 @@ def main():
     proc.add_argument("-n", "--top", type=int, help="Number of top clips to export (default: 5)")
     proc.add_argument("-o", "--output", help="Output directory (default: ./clips)")
     proc.add_argument("-p", "--preset", help="Load a saved preset")
-    proc.add_argument("--engine", choices=["whisper-py", "whispercpp", "assemblyai"], help="Transcription engine (default: whisper-py; whispercpp is local; assemblyai uses ASSEMBLYAI_API_KEY)")
+    proc.add_argument("--engine", choices=["whisper-py", "faster-whisper", "whispercpp", "assemblyai"], help="Transcription engine (default: whisper-py; faster-whisper needs the faster-whisper package; whispercpp is local; assemblyai uses ASSEMBLYAI_API_KEY)")
     proc.add_argument("--assemblyai-api-key", help="AssemblyAI API key for --engine assemblyai. Prefer ASSEMBLYAI_API_KEY; command-line secrets can appear in process listings.")
     proc.add_argument("--fast", action="store_true", help="Draft mode: tiny Whisper, heuristic selection, center crop, low quality")
+    proc.add_argument("--copy-only", action="store_true", help="Raw preview mode: stream-copy each clip from the source in one ffmpeg run (keyframe-aligned, no captions or crop)")
     proc.add_argument("--thumbnails", dest="thumbnails", action="store_true", default=None, help="Force thumbnail generation on")
     proc.add_argument("--no-thumbnails", dest="thumbnails", action="store_false", help="Skip thumbnail generation")
     proc.add_argument("--caption-style", choices=["branded", "hormozi", "karaoke", "subtle"])
@@ -3851,6 +4010,7 @@ def main():
     proc.add_argument("--no-resume", action="store_true", help="Ignore cached AI suggestions for this video and regenerate")
     proc.add_argument("--quality", choices=["low", "medium", "high", "max"], help="Output quality (default: high)")
     proc.add_argument("--allow-ass-fallback", action="store_true", help="Use ASS captions if Remotion rendering fails")
+    proc.add_argument("-j", "--jobs", type=int, help="Clips to render concurrently (default: 2 on 8+ cores, else 1; ignored with --review-each)")
     proc.add_argument("--review-each", action="store_true", help="Review each rendered clip interactively")
     proc.add_argument("--post-review", action="store_true", help="Open the post-render review loop after export")
 
@@ -3888,7 +4048,7 @@ def main():
     studio.add_argument("--end", type=float, help="Fragment end (seconds)")
     studio.add_argument("--paragraph", help="Find the fragment by matching this text in the transcript")
     studio.add_argument("--language", help="Transcription language (e.g. es). Auto-detect if omitted.")
-    studio.add_argument("--engine", choices=["whisper-py", "whispercpp", "assemblyai"], help="Transcription engine")
+    studio.add_argument("--engine", choices=["whisper-py", "faster-whisper", "whispercpp", "assemblyai"], help="Transcription engine")
     studio.add_argument("--assemblyai-api-key", help="AssemblyAI API key for --engine assemblyai. Prefer ASSEMBLYAI_API_KEY; command-line secrets can appear in process listings.")
     studio.add_argument("--caption-style", choices=["hormozi", "karaoke", "subtle", "branded"], default="hormozi")
     studio.add_argument("--crop", choices=["center", "face", "speaker", "speaker-hardcut"], default="face")
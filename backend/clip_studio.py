@@ -201,7 +201,7 @@ def main():
     ap.add_argument("--end", type=float, help="Fragment end (seconds)")
     ap.add_argument("--paragraph", help="Find fragment by matching this text in the transcript")
     ap.add_argument("--language", default=None, help="Transcription language (e.g. es). Auto-detect if omitted.")
-    ap.add_argument("--engine", choices=["whisper-py", "whispercpp", "assemblyai"], default=None, help="Transcription engine")
+    ap.add_argument("--engine", choices=["whisper-py", "faster-whisper", "whispercpp", "assemblyai"], default=None, help="Transcription engine")
     ap.add_argument("--caption-style", default="hormozi", choices=["hormozi", "karaoke", "subtle", "branded"])
     ap.add_argument("--crop", default="face", choices=["center", "face", "speaker", "speaker-hardcut"])
     ap.add_argument("--output", default=None, help="Final output path")
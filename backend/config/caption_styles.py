@@ -5,10 +5,57 @@ Each style defines fonts, colors, sizes, and behavior for the
 supported caption types.
 """
 
+import os
 import subprocess
+import time
+from types import MappingProxyType
 from utils.proc import run as proc_run
 import functools
 
+# Priority order: common cross-platform sans-serif fonts
+_FONT_CANDIDATES = (
+    "Arial",
+    "Helvetica",
+    "Liberation Sans",
+    "Noto Sans",
+    "DejaVu Sans",
+    "FreeSans",
+    "sans-serif",  # Generic fallback (ffmpeg/fontconfig may resolve it)
+)
+
+# Installed fonts rarely change, so the fc-list answer is reused across
+# processes for a week rather than re-scanned on every CLI invocation.
+_FONT_CACHE_TTL = 7 * 24 * 3600
+
+
+def _font_cache_path() -> str:
+    from config.paths import paths
+
+    # v2: older builds also cached the Arial fallback from a failed scan.
+    return os.path.join(paths["cache"], "detected-font-v2.txt")
+
+
+def _read_cached_font() -> str | None:
+    path = _font_cache_path()
+    try:
+        if time.time() - os.path.getmtime(path) > _FONT_CACHE_TTL:
+            return None
+        with open(path, encoding="utf-8") as f:
+            name = f.read().strip()
+    except OSError:
+        return None
+    return name if name in _FONT_CANDIDATES else None
+
+
+def _write_cached_font(name: str) -> None:
+    path = _font_cache_path()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(name)
+    except OSError:
+        pass
+
 
 @functools.lru_cache(maxsize=1)
 def _detect_font() -> str:
@@ -16,41 +63,37 @@ def _detect_font() -> str:
     Detect the best available sans-serif font on this system.
     Falls back through a priority list until one is found.
     """
-    # Priority order: common cross-platform sans-serif fonts
-    candidates = [
-        "Arial",
-        "Helvetica",
-        "Liberation Sans",
-        "Noto Sans",
-        "DejaVu Sans",
-        "FreeSans",
-        "sans-serif",  # Generic fallback (ffmpeg/fontconfig may resolve it)
-    ]
+    cached = _read_cached_font()
+    if cached:
+        return cached
 
+    # If fc-list isn't available (macOS without fontconfig), try common ones
+    # Arial is almost always available on macOS/Windows
+    found = _FONT_CANDIDATES[0]
     try:
         result = proc_run(
             ["fc-list", "--format=%{family}\n"],
             timeout=5, check=False,
         )
         if result.returncode == 0:
-            available = set()
+            rank = {name: i for i, name in enumerate(_FONT_CANDIDATES)}
+            best = len(_FONT_CANDIDATES)
             for line in result.stdout.splitlines():
                 # fc-list returns "Family1,Family2" for multi-name fonts
                 for name in line.split(","):
-                    available.add(name.strip())
-
-            for candidate in candidates:
-                if candidate in available:
-                    return candidate
+                    best = min(best, rank.get(name.strip(), best))
+                if best == 0:
+                    break
+            if best < len(_FONT_CANDIDATES):
+                found = _FONT_CANDIDATES[best]
+                # Only a real scan is worth pinning: a failed, timed-out or
+                # missing fc-list falls back to Arial for this process only.
+                _write_cached_font(found)
     except Exception:
         pass
 
-    # If fc-list isn't available (macOS without fontconfig), try common ones
-    # Arial is almost always available on macOS/Windows
-    return candidates[0]
-
+    return found
 
-DETECTED_FONT = _detect_font()
 
 # ASS color format: &HAABBGGRR (hex, alpha-blue-green-red)
 # Note: ASS uses BGR order, NOT RGB!
@@ -58,7 +101,6 @@ DETECTED_FONT = _detect_font()
 STYLES = {
     "hormozi": {
         "description": "Bold, centered, 2-3 words at a time, active word gets color pop",
-        "font_name": DETECTED_FONT,
         "font_size": 80,
         "primary_color": "&H00FFFFFF",       # White (inactive words)
         "active_color": "&H0000FFFF",         # Yellow (active word) — BGR for yellow
@@ -78,7 +120,6 @@ STYLES = {
     },
     "karaoke": {
         "description": "Full sentence visible, words highlight progressively",
-        "font_name": DETECTED_FONT,
         "font_size": 60,
         "primary_color": "&H00808080",         # Gray (unspoken words)
         "active_color": "&H00FFFFFF",           # White (spoken words)
@@ -96,7 +137,6 @@ STYLES = {
     },
     "subtle": {
         "description": "Clean white text at bottom with shadow, professional look",
-        "font_name": DETECTED_FONT,
         "font_size": 52,
         "primary_color": "&H00FFFFFF",         # White
         "active_color": None,                   # No active word highlighting
@@ -114,7 +154,6 @@ STYLES = {
     },
     "branded": {
         "description": "Large bold text, 5-7 words wrapping across 2 lines, dark rounded pill on active word. Clean, no gradient.",
-        "font_name": DETECTED_FONT,
         "font_size": 80,                        # Large bold text for shorts
         "primary_color": "&H00FFFFFF",          # White (all words)
         "active_color": "&H00FFFFFF",           # White text on dark box
@@ -141,10 +180,18 @@ STYLES = {
     },
 }
 
+# The table is constant; read-only views keep a caller from editing a shared
+# style in place. get_style() hands out a mutable copy.
+STYLES = MappingProxyType({name: MappingProxyType(style) for name, style in STYLES.items()})
+
 
 def get_style(name: str) -> dict:
-    """Get a caption style config by name."""
+    """Get a caption style config by name.
+
+    Returns a copy with `font_name` resolved on first use, so importing this
+    module (e.g. for `podcli presets list`) never shells out to fc-list.
+    """
     style = STYLES.get(name)
     if not style:
         raise ValueError(f"Unknown caption style: {name}. Available: {list(STYLES.keys())}")
-    return style
+    return {**style, "font_name": _detect_font()}
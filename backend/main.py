@@ -6,7 +6,6 @@ Reads a JSON task request from stdin, dispatches to the appropriate service,
 and writes a JSON result to stdout. Progress events go to stderr.
 """
 
-import json
 import os
 import sys
 
@@ -27,16 +26,102 @@ try:
     load_dotenv(os.environ.get("PODCLI_ENV_FILE") or os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".env"))
 except ImportError:
     pass
+import atexit
 import threading
 import traceback
 from version import VERSION
+from utils import jsonio
+from utils.proc import render_concurrency as _render_concurrency, render_pool as _render_pool
 
 # Serializes event writes so parallel clip workers can't interleave JSON lines.
 _emit_lock = threading.Lock()
 
 
+def _write_line(stream, line: bytes) -> None:
+    """Write one framed UTF-8 line straight to a std stream's binary buffer.
+
+    JSON is serialized to bytes already, so going through the text layer
+    would only decode it to re-encode it. The text layer is flushed first so
+    anything printed there earlier (tracebacks) still comes out in order.
+    """
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None:  # replaced by a text-only stream (tests, embedding)
+        stream.write(line.decode("utf-8"))
+        stream.flush()
+        return
+    stream.flush()
+    buffer.write(line)
+    buffer.flush()
+
+
+class _ProgressWriter:
+    """Writes progress events to stderr from a daemon thread.
+
+    Pipeline callbacks fire from inside transcription and render loops; a
+    blocking flush there stalls the work whenever the parent is slow to drain
+    the pipe. Events put with coalesce=True (plain percent updates) collapse
+    per (task, stage), newest wins; every other event (clip_complete results)
+    is always written, in order.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._pending: dict = {}
+        self._seq = 0
+        self._busy = False
+        self._thread = None
+
+    def put(self, event: dict, *, coalesce: bool = False) -> None:
+        with self._cond:
+            if coalesce:
+                key = (event["task_id"], event["stage"])
+                self._pending.pop(key, None)
+            else:
+                self._seq += 1
+                key = self._seq
+            self._pending[key] = event
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="podcli-progress", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def flush(self) -> None:
+        """Block until every queued event has been written."""
+        with self._cond:
+            while self._pending or self._busy:
+                self._cond.wait()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                batch = list(self._pending.values())
+                self._pending.clear()
+                self._busy = True
+            try:
+                lines = []
+                for event in batch:
+                    try:
+                        lines.append(jsonio.dumpb(event) + b"\n")
+                    except (TypeError, ValueError):
+                        pass  # one unserializable event must not sink the rest
+                with _emit_lock:
+                    _write_line(sys.stderr, b"".join(lines))
+            except (OSError, ValueError):
+                pass  # parent closed the pipe; progress is best-effort
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+
+_progress = _ProgressWriter()
+atexit.register(_progress.flush)
+
+
 def emit_progress(task_id: str, stage: str, percent: int, message: str, **extra):
-    """Write a progress event to stderr (picked up by TypeScript executor)."""
+    """Queue a progress event for stderr (picked up by TypeScript executor)."""
     event = {
         "task_id": task_id,
         "stage": stage,
@@ -44,12 +129,13 @@ def emit_progress(task_id: str, stage: str, percent: int, message: str, **extra)
         "message": message,
     }
     event.update(extra)
-    with _emit_lock:
-        print(json.dumps(event), file=sys.stderr, flush=True)
+    # Extra fields carry payloads (clip results) that must not be replaced by
+    # a later update; only bare percent updates are safe to merge.
+    _progress.put(event, coalesce=not extra)
 
 
 def emit_result(task_id: str, status: str, data=None, error=None):
-    """Write the final result to stdout."""
+    """Write the final result to stdout, after any progress still queued."""
     result = {
         "task_id": task_id,
         "status": status,
@@ -58,8 +144,9 @@ def emit_result(task_id: str, status: str, data=None, error=None):
         result["data"] = data
     if error is not None:
         result["error"] = error
+    _progress.flush()
     with _emit_lock:
-        print(json.dumps(result), flush=True)
+        _write_line(sys.stdout, jsonio.dumpb(result) + b"\n")
 
 
 def handle_ping(task_id: str, params: dict):
@@ -189,15 +276,6 @@ def handle_create_clip(task_id: str, params: dict):
     emit_result(task_id, "success", data=result)
 
 
-def _render_concurrency() -> int:
-    raw = (os.environ.get("PODCLI_RENDER_CONCURRENCY") or "").strip()
-    if raw:
-        try:
-            return max(1, int(raw))
-        except ValueError:
-            pass
-    return 2 if (os.cpu_count() or 1) >= 8 else 1
-
 
 def handle_batch_clips(task_id: str, params: dict):
     """Create multiple clips with a bounded worker pool."""
@@ -210,6 +288,10 @@ def handle_batch_clips(task_id: str, params: dict):
     results = [None] * total
     completed = 0
     completed_lock = threading.Lock()
+    # Shared by every clip: the word list is the bulk of the request, and the
+    # outro lookup reads the asset registry, so neither is redone per clip.
+    transcript_words = params.get("transcript_words", [])
+    outro_path = asset_store.resolve(params.get("outro_path"))
 
     def render_one(i: int, clip: dict) -> dict:
         emit_progress(
@@ -225,11 +307,11 @@ def handle_batch_clips(task_id: str, params: dict):
             caption_style=clip.get("caption_style", "hormozi"),
             crop_strategy=clip.get("crop_strategy", "face"),
             format=clip.get("format", params.get("format", "vertical")),
-            transcript_words=params.get("transcript_words", []),
+            transcript_words=transcript_words,
             title=clip.get("title", f"clip_{i + 1}"),
             output_dir=params.get("output_dir"),
             logo_path=asset_store.resolve(clip.get("logo_path") or params.get("logo_path")),
-            outro_path=asset_store.resolve(params.get("outro_path")),
+            outro_path=outro_path,
             intro_path=asset_store.resolve(clip.get("intro_path") or params.get("intro_path")),
             clean_fillers=params.get("clean_fillers", True),
             face_map=params.get("face_map"),
@@ -276,12 +358,18 @@ def handle_batch_clips(task_id: str, params: dict):
             clip_result=row,
         )
 
-    workers = min(_render_concurrency(), max(1, total))
+    # max_parallel lets a caller pin the pool, e.g. to 1 on a hardware encoder
+    # with a small session limit; otherwise the host-wide default applies.
+    try:
+        requested = max(1, int(params["max_parallel"])) if params.get("max_parallel") else None
+    except (TypeError, ValueError):
+        requested = None
+    workers = min(requested or _render_concurrency(), max(1, total))
     if workers <= 1:
         for i, clip in enumerate(clips):
             run_and_record(i, clip)
     else:
-        with ThreadPoolExecutor(max_workers=workers) as pool:
+        with _render_pool(workers), ThreadPoolExecutor(max_workers=workers) as pool:
             futures = [pool.submit(run_and_record, i, clip) for i, clip in enumerate(clips)]
             for f in futures:
                 f.result()
@@ -381,6 +469,8 @@ def handle_pack_transcript(task_id: str, params: dict):
 def handle_analyze_energy(task_id: str, params: dict):
     """Analyze audio energy of a video to improve clip scoring."""
     from services.audio_analyzer import get_energy_profile
+    from services.signal_cache import load_signals, save_signals
+    from utils.proc import ProcError
 
     video_path = params.get("video_path", "")
     segments = params.get("segments", [])
@@ -389,11 +479,31 @@ def handle_analyze_energy(task_id: str, params: dict):
         emit_result(task_id, "error", error="video_path is required")
         return
 
-    result = get_energy_profile(
-        video_path=video_path,
-        segments=segments,
-        progress_callback=lambda pct, msg: emit_progress(task_id, "analyzing", pct, msg),
-    )
+    # The curve depends only on the audio, so re-scoring with other segment
+    # bounds reuses the cached profile instead of decoding the video again.
+    cached_energy = load_signals(video_path).get("energy_data") if os.path.exists(video_path) else None
+    progress = lambda pct, msg: emit_progress(task_id, "analyzing", pct, msg)
+    try:
+        result = get_energy_profile(
+            video_path=video_path,
+            segments=segments,
+            progress_callback=progress,
+            energy_data=cached_energy,
+        )
+    except ProcError as e:
+        # No decodable audio (a silent screen recording, or ffmpeg gave up):
+        # every segment scores as flat rather than failing the whole analysis.
+        print(f"Warning: audio energy unavailable: {e}", file=sys.stderr, flush=True)
+        result = get_energy_profile(
+            video_path=video_path, segments=segments,
+            progress_callback=progress, energy_data=[],
+        )
+    if cached_energy is None and result["energy_data"]:
+        save_signals(video_path, energy_data=result["energy_data"])
+    # The per-second curve is an entry per second of audio and callers only
+    # read the scores and peaks, so it stays off the wire unless asked for.
+    if not params.get("include_energy_data", False):
+        result.pop("energy_data", None)
     emit_result(task_id, "success", data=result)
 
 
@@ -950,12 +1060,19 @@ def _maybe_auto_migrate_backend(task_type: str, params: dict) -> None:
 
 def main():
     try:
-        raw = sys.stdin.readline().strip()
+        # Read bytes: the JSON parser decodes UTF-8 itself, so the text layer
+        # would only add a second decode of a possibly huge transcript payload.
+        raw = sys.stdin.buffer.readline().strip()
         if not raw:
             emit_result("unknown", "error", error="Empty input")
             sys.exit(1)
 
-        request = json.loads(raw)
+        try:
+            request = jsonio.loads(raw)
+        except UnicodeDecodeError:
+            # Keep the old errors="replace" tolerance for malformed UTF-8.
+            raw = raw.decode("utf-8", "replace")
+            request = jsonio.loads(raw)
         task_id = request.get("task_id", "unknown")
         task_type = request.get("task_type", "")
         params = request.get("params", {})
@@ -972,7 +1089,7 @@ def main():
     except Exception as e:
         task_id = "unknown"
         try:
-            task_id = json.loads(raw).get("task_id", "unknown")
+            task_id = jsonio.loads(raw).get("task_id", "unknown")
         except Exception:
             pass
         emit_result(task_id, "error", error=f"{type(e).__name__}: {e}\n{traceback.format_exc()}")
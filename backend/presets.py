@@ -8,11 +8,13 @@ A preset is a complete show config: video path, rendering options,
 corrections, output dir — everything needed to run `podcli process --preset myshow`.
 """
 
+import copy
 import os
 import json
 from typing import Optional
 
 from config.paths import paths
+from utils import jsonio
 from services.formats import FORMATS
 
 PRESETS_DIR = os.path.join(paths["home"], "presets")
@@ -57,22 +59,95 @@ DEFAULT_PRESET = {
 }
 
 
+# Parsed preset files keyed by path, tagged with the (mtime_ns, size) they were
+# read at, so repeated lookups skip the parse until the file changes.
+_cache: dict[str, tuple[tuple[int, int], dict]] = {}
+
+
+def _signature(path: str) -> tuple[int, int]:
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _load(path: str, sig: Optional[tuple[int, int]] = None) -> dict:
+    sig = sig or _signature(path)
+    cached = _cache.get(path)
+    if cached is None or cached[0] != sig:
+        cached = (sig, jsonio.load_file(path))
+        _cache[path] = cached
+    # Callers edit the merged config in place (corrections included), so
+    # never hand out the cached objects themselves.
+    return copy.deepcopy(cached[1])
+
+
+# Every preset's parsed contents in one file, so a fresh process can list
+# them with a single read instead of opening each preset. Entries carry the
+# preset file's signature and are only trusted while it still matches, so a
+# hand-edited preset is re-read rather than served stale; a preset that
+# failed to parse is recorded as {"sig", "error"} so it isn't retried (and the
+# index rewritten) on every listing. The leading dot keeps it out of the preset
+# namespace: save_preset() rejects names starting with ".".
+_INDEX_FILE = ".index.json"
+
+
+def _index_path() -> str:
+    return os.path.join(PRESETS_DIR, _INDEX_FILE)
+
+
+def _read_index() -> dict:
+    try:
+        index = jsonio.load_file(_index_path())
+    except (OSError, ValueError):
+        return {}
+    return index if isinstance(index, dict) else {}
+
+
+def _write_index(index: dict) -> None:
+    """Best-effort: a missing or stale index only costs a rescan."""
+    tmp = _index_path() + ".tmp"
+    try:
+        jsonio.dump_file(index, tmp)
+        os.replace(tmp, _index_path())
+    except OSError:
+        pass
+
+
 def list_presets() -> list[dict]:
     """List all saved presets."""
     if not os.path.exists(PRESETS_DIR):
         return []
 
+    index = _read_index()
+    fresh = {}
+    stale = False
     presets = []
     for f in sorted(os.listdir(PRESETS_DIR)):
-        if f.endswith(".json"):
+        if f.endswith(".json") and not f.startswith("."):
             name = f[:-5]
             path = os.path.join(PRESETS_DIR, f)
             try:
-                with open(path, "r", encoding="utf-8") as fh:
-                    data = json.load(fh)
-                    presets.append({"name": name, **data})
+                sig = _signature(path)
+            except OSError:
+                continue
+            entry = index.get(name)
+            known = isinstance(entry, dict) and tuple(entry.get("sig", ())) == sig
+            if known and entry.get("error"):
+                fresh[name] = entry
+                continue
+            if known and isinstance(entry.get("data"), dict):
+                if path not in _cache:
+                    _cache[path] = (sig, entry["data"])
+            else:
+                stale = True
+            try:
+                data = _load(path, sig)
             except (json.JSONDecodeError, IOError):
-                pass
+                fresh[name] = {"sig": list(sig), "error": True}
+                continue
+            presets.append({"name": name, **data})
+            fresh[name] = {"sig": list(sig), "data": _cache[path][1]}
+    if stale or fresh.keys() != index.keys():
+        _write_index(fresh)
     return presets
 
 
@@ -84,8 +159,7 @@ def get_preset(name: str) -> dict:
             return {**DEFAULT_PRESET}
         raise FileNotFoundError(f"Preset not found: {name}")
 
-    with open(path, "r", encoding="utf-8") as f:
-        saved = json.load(f)
+    saved = _load(path)
 
     # Merge with defaults so new keys are always present
     merged = {**DEFAULT_PRESET, **saved, "name": name}
@@ -94,6 +168,8 @@ def get_preset(name: str) -> dict:
 
 def save_preset(name: str, config: dict) -> str:
     """Save a preset to disk. Saves all provided keys."""
+    if not name or name.startswith("."):
+        raise ValueError(f"Invalid preset name: {name!r}")
     os.makedirs(PRESETS_DIR, exist_ok=True)
     path = os.path.join(PRESETS_DIR, f"{name}.json")
 
@@ -104,8 +180,11 @@ def save_preset(name: str, config: dict) -> str:
             continue  # don't store the name inside the file
         to_save[key] = val
 
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(to_save, f, indent=2)
+    jsonio.dump_file(to_save, path, indent=True)
+    _cache.pop(path, None)
+    index = _read_index()
+    index[name] = {"sig": list(_signature(path)), "data": to_save}
+    _write_index(index)
 
     return path
 
@@ -113,7 +192,11 @@ def save_preset(name: str, config: dict) -> str:
 def delete_preset(name: str) -> bool:
     """Delete a preset file."""
     path = os.path.join(PRESETS_DIR, f"{name}.json")
+    _cache.pop(path, None)
     if os.path.exists(path):
         os.remove(path)
+        index = _read_index()
+        if index.pop(name, None) is not None:
+            _write_index(index)
         return True
     return False
@@ -12,11 +12,35 @@ import json
 import re
 from typing import Optional, Callable
 
-from utils.proc import run as proc_run
+import numpy as np
+
+from utils.proc import ProcError, run as proc_run, stream_chunks, stream_lines
 
 
 _ANALYSIS_RATE = 16000
 
+# Windows decoded per pipe read: large enough that the Python loop runs once
+# per minute of audio, small enough to keep memory flat on long episodes.
+_WINDOWS_PER_READ = 60
+
+_EBUR128_RE = re.compile(r"t:\s*(\d+\.?\d*)\s+M:\s*(-?\d+\.?\d*)")
+
+
+def _window_rms_db(pcm: bytes, window_samples: int) -> np.ndarray:
+    """dBFS RMS of each `window_samples` window of s16le PCM.
+
+    A short final window is zero-padded, as ffmpeg's asetnsamples pads its
+    last frame. Digital silence comes out as -inf.
+    """
+    samples = np.frombuffer(pcm, dtype="<i2", count=len(pcm) // 2)
+    short = -len(samples) % window_samples
+    if short:
+        samples = np.concatenate((samples, np.zeros(short, dtype=samples.dtype)))
+    x = samples.astype(np.float64).reshape(-1, window_samples) / 32768.0
+    rms = np.sqrt(np.mean(x * x, axis=1))
+    with np.errstate(divide="ignore"):
+        return 20.0 * np.log10(rms)
+
 
 def extract_audio_energy(
     video_path: str,
@@ -26,50 +50,44 @@ def extract_audio_energy(
     """
     Extract per-window RMS energy levels from a video's audio track.
 
-    Returns list of {time, rms, peak} dicts, one per window.
+    Returns list of {time, rms_db} dicts, one per non-silent window.
     wav_path: optional pre-extracted 16 kHz mono WAV — skips decoding the
     video again when the orchestration layer already extracted the audio.
     """
     input_path = wav_path if wav_path and os.path.exists(wav_path) else video_path
-    # astats' reset counts filter frames, not seconds, so pin the frame size
-    # to exactly one window with asetnsamples and reset every frame.
+    # ffmpeg only decodes; it pipes raw 16 kHz mono PCM and the per-window RMS
+    # (what astats would report) is computed here, a window per row, instead
+    # of ffmpeg printing text metadata for Python to re-parse.
     # (-vn skips video decoding, the main bottleneck on long podcasts.)
     window_samples = max(1, int(_ANALYSIS_RATE * window_sec))
     cmd = [
-        "ffmpeg",
+        "ffmpeg", "-v", "error",
         "-i", input_path,
         "-vn",
-        "-af", f"aresample={_ANALYSIS_RATE},asetnsamples=n={window_samples},"
-               f"astats=metadata=1:reset=1,"
-               f"ametadata=print:key=lavfi.astats.Overall.RMS_level:file=-",
-        "-f", "null", "-",
+        "-ac", "1", "-ar", str(_ANALYSIS_RATE),
+        "-f", "s16le", "-",
     ]
 
-    result = proc_run(cmd, timeout=600, check=False)
-
-    # Parse the ametadata output from stdout
-    # Format: "frame:N    pts:N    pts_time:N.N\nlavfi.astats.Overall.RMS_level=N.N"
     energy_data = []
-    lines = (result.stdout or "").split("\n")
-
-    current_time = None
-    for line in lines:
-        line = line.strip()
-        pts_match = re.search(r'pts_time:(\d+\.?\d*)', line)
-        if pts_match:
-            current_time = float(pts_match.group(1))
-
-        rms_match = re.search(r'RMS_level=(-?\d+\.?\d*)', line)
-        if rms_match and current_time is not None:
-            rms_db = float(rms_match.group(1))
-            energy_data.append({
-                "time": round(current_time, 2),
-                "rms_db": round(rms_db, 2),
-            })
-            current_time = None
+    window = 0
+    chunk_size = window_samples * 2 * _WINDOWS_PER_READ
+    try:
+        for chunk in stream_chunks(cmd, timeout=600, chunk_size=chunk_size):
+            levels = _window_rms_db(chunk, window_samples)
+            for k, rms_db in enumerate(levels.tolist()):
+                if rms_db != float("-inf"):
+                    energy_data.append({
+                        "time": round((window + k) * window_samples / _ANALYSIS_RATE, 2),
+                        "rms_db": round(rms_db, 2),
+                    })
+            window += len(levels)
+    except ProcError as exc:
+        if exc.returncode == -1:
+            raise  # a timed-out decode is truncated; never pass it off as complete
+        energy_data = []  # decode failed (e.g. no PCM path); try ebur128 instead
 
     if not energy_data:
-        # Fallback: use volumedetect for a simpler analysis
+        # Fallback: use ebur128 loudness for a simpler analysis
         return _fallback_energy(input_path)
 
     return energy_data
@@ -99,12 +117,10 @@ def _fallback_energy(video_path: str) -> list[dict]:
         "-af", "ebur128=peak=true",
         "-f", "null", "-",
     ]
-    result = proc_run(cmd, timeout=600, check=False)
-
     energy_data = []
     # Parse ebur128 output from stderr: "t: N.N   M: -N.N S: -N.N"
-    for line in (result.stderr or "").split("\n"):
-        m = re.search(r't:\s*(\d+\.?\d*)\s+M:\s*(-?\d+\.?\d*)', line)
+    for line in stream_lines(cmd, timeout=600, stderr=True):
+        m = _EBUR128_RE.search(line)
         if m:
             energy_data.append({
                 "time": round(float(m.group(1)), 2),
@@ -114,6 +130,28 @@ def _fallback_energy(video_path: str) -> list[dict]:
     return energy_data
 
 
+# Levels are reported to 0.01 dB, so scoring holds them as int16 hundredths
+# of a dB: exact, half the width of float32, and +/-327 dB covers any real
+# level (out-of-range values such as -inf saturate and read as silence).
+_CDB = 100
+_SILENCE_CDB = -60 * _CDB
+
+
+def _energy_arrays(energy_data: list[dict]) -> tuple[np.ndarray, np.ndarray]:
+    """Split {time, rms_db} records into time-sorted parallel arrays.
+
+    The list of dicts stays the wire/cache format; scoring works on the
+    arrays so per-segment lookups are a binary search plus a slice. Levels
+    come back as int16 centi-dB (see _CDB).
+    """
+    times = np.fromiter((e["time"] for e in energy_data), dtype=np.float64, count=len(energy_data))
+    rms = np.fromiter((e["rms_db"] for e in energy_data), dtype=np.float64, count=len(energy_data))
+    limits = np.iinfo(np.int16)
+    rms_cdb = np.rint(np.clip(rms * _CDB, limits.min, limits.max)).astype(np.int16)
+    order = np.argsort(times, kind="stable")
+    return times[order], rms_cdb[order]
+
+
 def compute_energy_scores(
     energy_data: list[dict],
     segments: list[dict],
@@ -127,51 +165,64 @@ def compute_energy_scores(
     if not energy_data:
         return [0.0] * len(segments)
 
-    # Build time→rms lookup
-    rms_values = [e["rms_db"] for e in energy_data]
-    if not rms_values:
-        return [0.0] * len(segments)
+    times, rms = _energy_arrays(energy_data)
 
     # Filter out silence (-inf or very low values)
-    valid_rms = [r for r in rms_values if r > -60]
-    if not valid_rms:
+    voiced = rms > _SILENCE_CDB
+    valid_rms = rms[voiced]
+    if not valid_rms.size:
         return [0.0] * len(segments)
 
-    mean_rms = sum(valid_rms) / len(valid_rms)
-    std_rms = max((sum((r - mean_rms) ** 2 for r in valid_rms) / len(valid_rms)) ** 0.5, 0.1)
-
-    scores = []
-    for seg in segments:
-        seg_start = seg.get("start", 0)
-        seg_end = seg.get("end", 0)
-
-        # Get energy values within this segment's time range
-        seg_rms = [
-            e["rms_db"] for e in energy_data
-            if seg_start <= e["time"] <= seg_end and e["rms_db"] > -60
-        ]
-
-        if not seg_rms:
-            scores.append(0.0)
-            continue
-
-        # Average RMS for segment
-        avg_rms = sum(seg_rms) / len(seg_rms)
-        # Peak RMS (most energetic moment)
-        peak_rms = max(seg_rms)
-
-        # Z-score: how many std devs above mean
-        z_avg = (avg_rms - mean_rms) / std_rms
-        z_peak = (peak_rms - mean_rms) / std_rms
-
-        # Combine: weight peak more (catches laughs, emphasis)
-        raw_score = z_avg * 0.4 + z_peak * 0.6
-
-        # Normalize to 0-10 range (clamp)
-        score = max(0, min(10, (raw_score + 1) * 3))
-        scores.append(round(score, 2))
+    mean_rms = float(valid_rms.mean()) / _CDB
+    std_rms = max(float(valid_rms.std()) / _CDB, 0.1)
+    if not segments:
+        return []
 
-    return scores
+    # Every segment at once: each [start, end] (inclusive) maps to a slice of
+    # the non-silent samples, and reduceat over the interleaved slice bounds
+    # yields every slice's sum and peak in one pass. The padding element
+    # keeps a slice ending at the last sample addressable.
+    valid_times = times[voiced]
+    starts = np.fromiter((seg.get("start", 0) for seg in segments), dtype=np.float64, count=len(segments))
+    ends = np.fromiter((seg.get("end", 0) for seg in segments), dtype=np.float64, count=len(segments))
+    lo = np.searchsorted(valid_times, starts, side="left")
+    hi = np.maximum(np.searchsorted(valid_times, ends, side="right"), lo)
+    counts = hi - lo
+    nonempty = counts > 0
+
+    padded = np.append(valid_rms, 0)
+    bounds = np.column_stack((lo, hi)).ravel()
+    sums = np.add.reduceat(padded, bounds, dtype=np.int64)[::2] / _CDB
+    peaks = np.maximum.reduceat(padded, bounds)[::2] / _CDB
+
+    # Z-scores: how many std devs above mean; weight peak more (catches
+    # laughs, emphasis), then normalize to the 0-10 range (clamp)
+    avg = np.divide(sums, counts, out=np.zeros_like(sums), where=nonempty)
+    z_avg = (avg - mean_rms) / std_rms
+    z_peak = (peaks - mean_rms) / std_rms
+    raw_score = z_avg * 0.4 + z_peak * 0.6
+    scores = np.clip((raw_score + 1) * 3, 0, 10)
+    return [round(float(sc), 2) if ok else 0.0 for sc, ok in zip(scores, nonempty)]
+
+
+def _peak_times(energy_data: list[dict]) -> list[float]:
+    """Times of the loudest 10% of windows, loudest first.
+
+    Only the top slice is ordered: a partition finds the cut-off level in
+    linear time, and ties at the cut-off go to the earlier records, as a
+    stable descending sort of the whole profile would.
+    """
+    n = len(energy_data)
+    if not n:
+        return []
+    k = max(1, n // 10)
+    rms = np.fromiter((e["rms_db"] for e in energy_data), dtype=np.float64, count=n)
+    cutoff = np.partition(rms, n - k)[n - k]
+    above = np.flatnonzero(rms > cutoff)
+    at = np.flatnonzero(rms == cutoff)[: k - above.size]
+    top = np.concatenate((above, at))
+    top = top[np.lexsort((top, -rms[top]))]
+    return [energy_data[i]["time"] for i in top.tolist()]
 
 
 def get_energy_profile(
@@ -179,29 +230,28 @@ def get_energy_profile(
     segments: list[dict],
     progress_callback: Optional[Callable] = None,
     wav_path: str = None,
+    energy_data: Optional[list[dict]] = None,
 ) -> dict:
     """
     Full pipeline: extract energy data and score all segments.
 
+    energy_data: a previously extracted profile (e.g. from the signal cache);
+    when given, the audio is not decoded again and only the scoring runs.
+
     Returns {energy_data, segment_scores, mean_rms, peak_times}
     """
     if progress_callback:
         progress_callback(0, "Analyzing audio energy...")
 
-    energy_data = extract_audio_energy(video_path, wav_path=wav_path)
+    if energy_data is None:
+        energy_data = extract_audio_energy(video_path, wav_path=wav_path)
 
     if progress_callback:
         progress_callback(70, "Scoring segments by energy...")
 
     segment_scores = compute_energy_scores(energy_data, segments)
 
-    # Find peak moments (top 10% loudest)
-    if energy_data:
-        sorted_by_rms = sorted(energy_data, key=lambda e: e["rms_db"], reverse=True)
-        top_count = max(1, len(sorted_by_rms) // 10)
-        peak_times = [e["time"] for e in sorted_by_rms[:top_count]]
-    else:
-        peak_times = []
+    peak_times = _peak_times(energy_data)
 
     if progress_callback:
         progress_callback(100, "Audio analysis complete")
@@ -116,7 +116,7 @@ def _read_waveform_16k_mono(video_path: str, wav_path: Optional[str] = None) ->
             "-vn", "-ar", "16000", "-ac", "1",
             "-f", "wav", tmp.name, "-loglevel", "error",
         ]
-        result = proc_run(cmd, timeout=600, check=False)
+        result = proc_run(cmd, timeout=600, check=False, output=False)
         if result.returncode != 0:
             return None
         try:
@@ -254,21 +254,26 @@ def get_event_profile(
     progress_callback: Optional[Callable] = None,
     reaction_threshold: float = REACTION_THRESHOLD,
     wav_path: Optional[str] = None,
+    events_data: Optional[list[dict]] = None,
 ) -> dict:
     """
     Full pipeline: detect audio events and score all segments.
 
+    events_data: a previously extracted profile (e.g. from the signal cache);
+    when given, YAMNet is not run again and only the scoring runs.
+
     Returns {events_data, segment_scores, reaction_times} where reaction_times are the
     timestamps of frames whose reaction level clears reaction_threshold — the anchors a
     reaction-based detector expands backwards from.
     """
-    if not is_available():
+    if events_data is None and not is_available():
         return {"events_data": [], "segment_scores": [0.0] * len(segments), "reaction_times": []}
 
     if progress_callback:
         progress_callback(0, "Detecting laughter and reactions...")
 
-    events_data = extract_audio_events(video_path, wav_path=wav_path)
+    if events_data is None:
+        events_data = extract_audio_events(video_path, wav_path=wav_path)
 
     if progress_callback:
         progress_callback(70, "Scoring segments by reaction...")
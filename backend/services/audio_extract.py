@@ -36,7 +36,7 @@ def extract_wav_16k_mono(
         wav_path,
     ]
     try:
-        result = proc_run(cmd, timeout=timeout, check=False)
+        result = proc_run(cmd, timeout=timeout, check=False, output=False)
         if result.returncode != 0:
             raise RuntimeError(f"Audio extraction failed: {(result.stderr or '')[-300:]}")
     except Exception:
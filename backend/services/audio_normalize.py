@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import json
 
+from services.encoder import get_audio_encode_flags
 from services.media_probe import FFMPEG_TIMEOUT
 from utils.proc import run as proc_run
 
@@ -25,10 +26,45 @@ def normalize_audio(
     Falls back to a single-pass loudnorm when measurement is missing
     or returns −inf (silent / very short clips).
     """
-    # First pass: measure current loudness.
-    measure_cmd = [
+    af_filter = loudnorm_filter(input_path, target_lufs)
+
+    cmd = [
         "ffmpeg", "-y",
         "-i", input_path,
+        "-af", af_filter,
+        "-c:v", "copy",
+        *get_audio_encode_flags(),
+        "-movflags", "+faststart",
+        output_path,
+    ]
+    result = proc_run(cmd, timeout=FFMPEG_TIMEOUT, check=False, output=False)
+    if result.returncode != 0:
+        raise RuntimeError(f"FFmpeg normalize failed: {result.stderr[-500:]}")
+    return output_path
+
+
+def loudnorm_filter(
+    input_path: str,
+    target_lufs: float = -14.0,
+    input_range: tuple[float, float] | None = None,
+) -> str:
+    """Measure input_path and return the loudnorm `-af` filter for the second pass.
+
+    Split out of normalize_audio so a pass that already re-encodes the clip
+    can apply the correction itself instead of remuxing the file again.
+    input_range (start_second, end_second) measures just that span, for a
+    pass that reads its clip straight from the source.
+    """
+    seek = []
+    if input_range:
+        start, end = input_range
+        seek = ["-ss", str(start), "-t", str(end - start)]
+    # First pass: measure current loudness. Only the audio is decoded; the
+    # video would otherwise be decoded in full just to be thrown away.
+    measure_cmd = [
+        "ffmpeg", "-y", "-hide_banner", "-nostats",
+        *seek, "-i", input_path,
+        "-vn", "-sn", "-dn",
         "-af", f"loudnorm=I={target_lufs}:TP=-1.5:LRA=11:print_format=json",
         "-f", "null", "-",
     ]
@@ -50,22 +86,7 @@ def normalize_audio(
     else:
         # Single-pass fallback.
         af_filter = f"loudnorm=I={target_lufs}:TP=-1.5:LRA=11"
-
-    cmd = [
-        "ffmpeg", "-y",
-        "-i", input_path,
-        "-af", af_filter,
-        "-c:v", "copy",
-        "-c:a", "aac",
-        "-b:a", "192k",
-        "-ar", "44100",
-        "-movflags", "+faststart",
-        output_path,
-    ]
-    result = proc_run(cmd, timeout=FFMPEG_TIMEOUT, check=False)
-    if result.returncode != 0:
-        raise RuntimeError(f"FFmpeg normalize failed: {result.stderr[-500:]}")
-    return output_path
+    return af_filter
 
 
 def _parse_loudnorm_stats(stderr: str) -> dict | None:
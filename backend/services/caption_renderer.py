@@ -7,6 +7,10 @@ Supports styles: Hormozi, Karaoke, Subtle, and Branded.
 
 import os
 import sys
+import tempfile
+import threading
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -16,9 +20,22 @@ from utils.timing_utils import seconds_to_ass
 
 def generate_ass_header(style: dict, play_res_x: int = 1080, play_res_y: int = 1920) -> str:
     """Generate the ASS file header with style definitions."""
-    bold_val = -1 if style["bold"] else 0
-    border_style = style.get("border_style", 1)
+    return _ass_header(
+        style["font_name"], style["font_size"], style["primary_color"],
+        style["outline_color"], style["back_color"], -1 if style["bold"] else 0,
+        style.get("border_style", 1), style["outline_width"], style["shadow_depth"],
+        style["alignment"], style["margin_v"], play_res_x, play_res_y,
+    )
+
 
+@lru_cache(maxsize=32)
+def _ass_header(
+    font_name, font_size, primary_color, outline_color, back_color, bold_val,
+    border_style, outline_width, shadow_depth, alignment, margin_v,
+    play_res_x, play_res_y,
+) -> str:
+    # Keyed on the style fields themselves: style dicts are fresh copies from
+    # get_style() on every call, so their identity never repeats.
     return f"""[Script Info]
 Title: Podcast Clip Captions
 ScriptType: v4.00+
@@ -29,7 +46,7 @@ ScaledBorderAndShadow: yes
 
 [V4+ Styles]
 Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding
-Style: Default,{style["font_name"]},{style["font_size"]},{style["primary_color"]},{style["primary_color"]},{style["outline_color"]},{style["back_color"]},{bold_val},0,0,0,100,100,0,0,{border_style},{style["outline_width"]},{style["shadow_depth"]},{style["alignment"]},40,40,{style["margin_v"]},1
+Style: Default,{font_name},{font_size},{primary_color},{primary_color},{outline_color},{back_color},{bold_val},0,0,0,100,100,0,0,{border_style},{outline_width},{shadow_depth},{alignment},40,40,{margin_v},1
 
 [Events]
 Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
@@ -41,6 +58,14 @@ def generate_branded_header(style: dict, play_res_x: int = 1080, play_res_y: int
     Generate ASS header for branded style.
     Uses BrandedNormal style: bold white text with inline box overrides on active word.
     """
+    return _branded_header(
+        style["font_name"], style["font_size"], style["alignment"], style["margin_v"],
+        play_res_x, play_res_y,
+    )
+
+
+@lru_cache(maxsize=32)
+def _branded_header(font_name, font_size, alignment, margin_v, play_res_x, play_res_y) -> str:
     return f"""[Script Info]
 Title: Podcast Clip Captions (Branded)
 ScriptType: v4.00+
@@ -51,7 +76,7 @@ ScaledBorderAndShadow: yes
 
 [V4+ Styles]
 Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding
-Style: BrandedNormal,{style["font_name"]},{style["font_size"]},&H00FFFFFF,&H00FFFFFF,&H90000000,&H00000000,-1,0,0,0,100,100,2,0,1,1,1,{style["alignment"]},60,60,{style["margin_v"]},1
+Style: BrandedNormal,{font_name},{font_size},&H00FFFFFF,&H00FFFFFF,&H90000000,&H00000000,-1,0,0,0,100,100,2,0,1,1,1,{alignment},60,60,{margin_v},1
 
 [Events]
 Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
@@ -59,6 +84,13 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 
 
 MIN_WORD_DURATION = 0.05  # 50ms minimum per word
+_WRITE_BATCH = 1024  # events per UTF-8 encode + write
+
+# Adjacent events share boundaries (a branded pill ends exactly where the next
+# word starts), so the same timestamps get formatted over and over. Keyed on
+# the exact float: rounding the key could land on the other side of a
+# centisecond.
+_ass_time = lru_cache(maxsize=4096)(seconds_to_ass)
 
 
 def _sanitize_words(words: list[dict]) -> list[dict]:
@@ -70,12 +102,15 @@ def _sanitize_words(words: list[dict]) -> list[dict]:
     """
     cleaned = []
     for w in words:
-        text = (w.get("word") or "").strip()
+        raw = w.get("word") or ""
+        text = raw.strip()
         if not text:
             continue
 
-        start = float(w.get("start", 0))
-        end = float(w.get("end", 0))
+        raw_start = w.get("start", 0)
+        raw_end = w.get("end", 0)
+        start = float(raw_start)
+        end = float(raw_end)
 
         # Ensure end > start with minimum duration
         if end <= start:
@@ -83,7 +118,12 @@ def _sanitize_words(words: list[dict]) -> list[dict]:
         elif (end - start) < MIN_WORD_DURATION:
             end = start + MIN_WORD_DURATION
 
-        cleaned.append({**w, "word": text, "start": start, "end": end})
+        # The renderers only read words, so one that needs no fixing is passed
+        # through as-is instead of copied.
+        if text == raw and end == raw_end and type(raw_start) is float and type(raw_end) is float:
+            cleaned.append(w)
+        else:
+            cleaned.append({**w, "word": text, "start": start, "end": end})
 
     return cleaned
 
@@ -93,6 +133,7 @@ def render_captions(
     caption_style: str,
     output_path: str,
     time_offset: float = 0.0,
+    style: Optional[dict] = None,
 ) -> str:
     """
     Generate an ASS subtitle file from word-level timestamps.
@@ -102,36 +143,81 @@ def render_captions(
         caption_style: "hormozi", "karaoke", "subtle", or "branded"
         output_path: Where to write the .ass file
         time_offset: Subtract this from all timestamps (for clip segments)
+        style: Already-resolved get_style(caption_style) config, if the caller
+            has one; looked up here otherwise
 
     Returns:
         Path to the generated .ass file
     """
+    if style is None:
+        style = get_style(caption_style)
     words = _sanitize_words(words)
     if not words:
         # Write empty subtitle file rather than crashing
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(generate_ass_header(get_style(caption_style)))
+        _write_utf8(output_path, [generate_ass_header(style)])
         return output_path
 
-    style = get_style(caption_style)
-
     if caption_style == "hormozi":
-        content = _render_hormozi(words, style, time_offset)
+        lines = _render_hormozi(words, style, time_offset)
     elif caption_style == "karaoke":
-        content = _render_karaoke(words, style, time_offset)
+        lines = _render_karaoke(words, style, time_offset)
     elif caption_style == "subtle":
-        content = _render_subtle(words, style, time_offset)
+        lines = _render_subtle(words, style, time_offset)
     elif caption_style == "branded":
-        content = _render_branded(words, style, time_offset)
+        lines = _render_branded(words, style, time_offset)
     else:
         raise ValueError(f"Unknown style: {caption_style}")
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(content)
+    # The renderers yield the header and then one newline-terminated event at
+    # a time, so a long clip never holds the whole file as a single string.
+    _write_utf8(output_path, _terminated(lines))
 
     return output_path
 
 
+def _write_utf8(path: str, lines: Iterable[str]) -> None:
+    """Write lines to a binary file, encoding a batch of events at a time
+    instead of one encode per line through a text wrapper. Newlines are
+    written as-is (LF), which libass reads on every platform.
+
+    The lines come from a generator, so the file is built beside `path` and
+    only moved into place once it is complete; a renderer that raises
+    mid-stream leaves no truncated subtitle behind for the burn to pick up.
+    """
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=os.path.basename(path) + ".", suffix=".tmp",
+        dir=os.path.dirname(os.path.abspath(path)),
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            batch: list[str] = []
+            for line in lines:
+                batch.append(line)
+                if len(batch) >= _WRITE_BATCH:
+                    f.write("".join(batch).encode("utf-8"))
+                    batch.clear()
+            if batch:
+                f.write("".join(batch).encode("utf-8"))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _terminated(lines: Iterator[str]) -> Iterator[str]:
+    """Pass the renderer's lines through, ending a header with no events in
+    the blank line the joined `header + "\n".join(events) + "\n"` form had."""
+    count = 0
+    for line in lines:
+        count += 1
+        yield line
+    if count <= 1:
+        yield "\n"
+
+
 CAPTION_GAP_FILL_MAX = 0.4  # seconds
 CHUNK_BREAK_GAP = 0.8  # seconds of silence that forces a new caption chunk
 _TERMINAL_PUNCTUATION = (".", "?", "!")
@@ -144,7 +230,11 @@ def _chunk_words(words: list[dict], chunk_size: int) -> list[list[dict]]:
     so a chunk also breaks after terminal punctuation, on a speaker change,
     or across an inter-word gap longer than CHUNK_BREAK_GAP.
     """
-    chunks: list[list[dict]] = []
+    return list(_iter_chunks(words, chunk_size))
+
+
+def _iter_chunks(words: list[dict], chunk_size: int) -> Iterator[list[dict]]:
+    """Lazy form of _chunk_words; never yields an empty chunk."""
     current: list[dict] = []
     for w in words:
         if current:
@@ -157,45 +247,49 @@ def _chunk_words(words: list[dict], chunk_size: int) -> list[list[dict]]:
             )
             sentence_break = str(prev.get("word", "")).strip().endswith(_TERMINAL_PUNCTUATION)
             if len(current) >= chunk_size or gap_break or speaker_break or sentence_break:
-                chunks.append(current)
+                yield current
                 current = []
         current.append(w)
     if current:
-        chunks.append(current)
-    return chunks
+        yield current
+
 
+def _chunk_spans(
+    words: list[dict], chunk_size: int, offset: float,
+) -> Iterator[tuple[list[dict], float, float]]:
+    """Yield (chunk, start, end) in clip time for every caption chunk.
 
-def _hold_through_gap(chunks: list[list[dict]], idx: int, end: float, offset: float) -> float:
-    """Extend a chunk's end toward the next chunk's start so a pause on a chunk
-    boundary doesn't blank the screen. Capped, and never overlaps the next chunk."""
-    for j in range(idx + 1, len(chunks)):
-        if chunks[j]:
-            next_start = max(0, chunks[j][0]["start"] - offset)
+    The end is held toward the next chunk's start so a pause on a chunk
+    boundary doesn't blank the screen — capped, and never overlapping the
+    next chunk. Chunks are produced one ahead of the caller, not all up front.
+    """
+    chunks = _iter_chunks(words, chunk_size)
+    chunk = next(chunks, None)
+    while chunk is not None:
+        following = next(chunks, None)
+        start = max(0, chunk[0]["start"] - offset)
+        end = max(0, chunk[-1]["end"] - offset)
+        if following is not None:
+            next_start = max(0, following[0]["start"] - offset)
             if next_start > end:
-                return min(next_start, end + CAPTION_GAP_FILL_MAX)
-            return end
-    return end
+                end = min(next_start, end + CAPTION_GAP_FILL_MAX)
+        yield chunk, start, end
+        chunk = following
 
 
-def _render_hormozi(words: list[dict], style: dict, offset: float) -> str:
+def _render_hormozi(words: list[dict], style: dict, offset: float) -> Iterator[str]:
     """
     Hormozi style: Show 2-3 words at a time, smooth karaoke-fill highlight.
     Uses \\kf tags for progressive word fill — 1 Dialogue per chunk, no flashing.
     """
-    header = generate_ass_header(style)
-    events = []
+    yield generate_ass_header(style)
+    ass_time = _ass_time
     chunk_size = style["words_per_chunk"]
     uppercase = style["uppercase"]
+    # \c = active (filled) color, \2c = inactive (unfilled) color
+    color_prefix = f"{{\\c{style['active_color']}\\2c{style['primary_color']}}}"
 
-    chunks = _chunk_words(words, chunk_size)
-
-    for idx, chunk in enumerate(chunks):
-        if not chunk:
-            continue
-
-        chunk_start = max(0, chunk[0]["start"] - offset)
-        chunk_end = _hold_through_gap(chunks, idx, max(0, chunk[-1]["end"] - offset), offset)
-
+    for chunk, chunk_start, chunk_end in _chunk_spans(words, chunk_size, offset):
         # Build \kf karaoke-fill parts: each word fills progressively
         parts = []
         for w in chunk:
@@ -203,85 +297,58 @@ def _render_hormozi(words: list[dict], style: dict, offset: float) -> str:
             text = w["word"].upper() if uppercase else w["word"]
             parts.append(f"{{\\kf{duration_cs}}}{text}")
 
-        # \c = active (filled) color, \2c = inactive (unfilled) color
-        line_text = (
-            f"{{\\c{style['active_color']}\\2c{style['primary_color']}}}"
-            + " ".join(parts)
-        )
-
-        start_ts = seconds_to_ass(chunk_start)
-        end_ts = seconds_to_ass(chunk_end)
+        line_text = color_prefix + " ".join(parts)
 
-        events.append(
-            f"Dialogue: 0,{start_ts},{end_ts},Default,,0,0,0,,{line_text}"
-        )
+        start_ts = ass_time(chunk_start)
+        end_ts = ass_time(chunk_end)
 
-    return header + "\n".join(events) + "\n"
+        yield f"Dialogue: 0,{start_ts},{end_ts},Default,,0,0,0,,{line_text}\n"
 
 
-def _render_karaoke(words: list[dict], style: dict, offset: float) -> str:
+def _render_karaoke(words: list[dict], style: dict, offset: float) -> Iterator[str]:
     """
     Karaoke style: Full sentence visible, words highlight as spoken.
     """
-    header = generate_ass_header(style)
-    events = []
+    yield generate_ass_header(style)
+    ass_time = _ass_time
 
     sentence_size = style.get("words_per_chunk", 5)
-    sentences = _chunk_words(words, sentence_size)
-
-    for idx, sentence in enumerate(sentences):
-        if not sentence:
-            continue
-
-        sent_start = max(0, sentence[0]["start"] - offset)
-        sent_end = _hold_through_gap(sentences, idx, max(0, sentence[-1]["end"] - offset), offset)
+    color_prefix = f"{{\\c{style['active_color']}}}{{\\2c{style['primary_color']}}}"
 
+    for sentence, sent_start, sent_end in _chunk_spans(words, sentence_size, offset):
         parts = []
         for w in sentence:
             duration_cs = int((w["end"] - w["start"]) * 100)
             text = w["word"]
             parts.append(f"{{\\kf{duration_cs}}}{text}")
 
-        line_text = " ".join(parts)
-        line_text = (
-            f"{{\\c{style['active_color']}}}{{\\2c{style['primary_color']}}}" + line_text
-        )
-
-        start_ts = seconds_to_ass(sent_start)
-        end_ts = seconds_to_ass(sent_end)
+        line_text = color_prefix + " ".join(parts)
 
-        events.append(f"Dialogue: 0,{start_ts},{end_ts},Default,,0,0,0,,{line_text}")
+        start_ts = ass_time(sent_start)
+        end_ts = ass_time(sent_end)
 
-    return header + "\n".join(events) + "\n"
+        yield f"Dialogue: 0,{start_ts},{end_ts},Default,,0,0,0,,{line_text}\n"
 
 
-def _render_subtle(words: list[dict], style: dict, offset: float) -> str:
+def _render_subtle(words: list[dict], style: dict, offset: float) -> Iterator[str]:
     """
     Subtle style: Clean white subtitles at bottom, sentence-level timing.
     """
-    header = generate_ass_header(style)
-    events = []
+    yield generate_ass_header(style)
+    ass_time = _ass_time
 
     line_size = style.get("words_per_chunk", 5)
-    lines = _chunk_words(words, line_size)
-
-    for idx, line_words in enumerate(lines):
-        if not line_words:
-            continue
-
-        line_start = max(0, line_words[0]["start"] - offset)
-        line_end = _hold_through_gap(lines, idx, max(0, line_words[-1]["end"] - offset), offset)
 
+    for line_words, line_start, line_end in _chunk_spans(words, line_size, offset):
         line_text = " ".join(w["word"] for w in line_words)
 
-        start_ts = seconds_to_ass(line_start)
-        end_ts = seconds_to_ass(line_end)
+        start_ts = ass_time(line_start)
+        end_ts = ass_time(line_end)
 
-        events.append(f"Dialogue: 0,{start_ts},{end_ts},Default,,0,0,0,,{line_text}")
-
-    return header + "\n".join(events) + "\n"
+        yield f"Dialogue: 0,{start_ts},{end_ts},Default,,0,0,0,,{line_text}\n"
 
 
+@lru_cache(maxsize=8192)
 def _normalize_case(text: str) -> str:
     """Lowercase a word unless it's an acronym or proper 'I'."""
     stripped = text.strip(".,!?;:-–—'\"")
@@ -305,6 +372,7 @@ def _calibrate_libass_y(
     of each text line. Returns a list of Y-center values (one per line).
     """
     import tempfile
+    from services.captions_burn import escape_filter_path
     from utils.proc import run as proc_run
 
     cache_key = f"{font_name}:{font_size}:{bold}:{margin_v}:{len(lines)}"
@@ -347,7 +415,7 @@ def _calibrate_libass_y(
         cmd = [
             "ffmpeg", "-y", "-f", "lavfi",
             "-i", f"color=0x808080:s={play_res_x}x{play_res_y}:d=1",
-            "-vf", f"ass='{ass_file.name}'",
+            "-vf", f"ass=filename={escape_filter_path(ass_file.name)}",
             "-frames:v", "1", png_file.name,
         ]
         proc_run(cmd, timeout=10, check=False)
@@ -417,49 +485,9 @@ def _measure_text_widths(texts: list[str], font_name: str, font_size: int, bold:
     pixel-accurate pill positioning.
     """
     try:
-        from PIL import ImageFont, ImageDraw, Image
-        from utils.proc import run as proc_run
-
-        font = None
-
-        # 1) Use fc-match to find the exact font libass resolves (most accurate)
-        try:
-            style = "Bold" if bold else "Regular"
-            result = proc_run(
-                ["fc-match", f"{font_name}:{style}", "--format=%{file}"],
-                timeout=3, check=False,
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                fc_path = result.stdout.strip()
-                if os.path.exists(fc_path):
-                    font = ImageFont.truetype(fc_path, font_size)
-        except Exception:
-            pass
-
-        # 2) Fallback: try common paths (macOS, Linux, Windows)
-        if font is None:
-            candidates = [
-                "/System/Library/Fonts/Supplemental/Arial Bold.ttf",
-                "/System/Library/Fonts/Helvetica.ttc",
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-                "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
-                "C:/Windows/Fonts/arialbd.ttf",
-            ] if bold else [
-                "/System/Library/Fonts/Supplemental/Arial.ttf",
-                "/System/Library/Fonts/Helvetica.ttc",
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-                "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
-                "C:/Windows/Fonts/arial.ttf",
-            ]
-            for path in candidates:
-                if os.path.exists(path):
-                    try:
-                        idx = 1 if (bold and path.endswith(".ttc")) else 0
-                        font = ImageFont.truetype(path, font_size, index=idx)
-                        break
-                    except Exception:
-                        continue
+        from PIL import ImageDraw, Image
 
+        font = _measure_font(font_name, font_size, bold)
         if font is None:
             return [int(len(t) * font_size * 0.6 + spacing * len(t)) for t in texts]
 
@@ -475,6 +503,74 @@ def _measure_text_widths(texts: list[str], font_name: str, font_size: int, bold:
         return [int(len(t) * font_size * 0.6) for t in texts]
 
 
+# Measuring fonts are kept per thread (a FreeTypeFont isn't safe to share,
+# and clips render on parallel threads), keyed by face, size and weight.
+_font_local = threading.local()
+
+
+def _measure_font(font_name: str, font_size: int, bold: bool):
+    """The Pillow font libass will draw with, or None if none can be loaded.
+
+    Resolved once per face and size: the branded renderer measures every
+    chunk, and each lookup costs an fc-match subprocess plus a font parse.
+    A miss isn't remembered, so a font installed (or an fc-match that timed
+    out) mid-session is picked up by the next clip.
+    """
+    fonts = getattr(_font_local, "fonts", None)
+    if fonts is None:
+        fonts = _font_local.fonts = {}
+    key = (font_name, font_size, bold)
+    font = fonts.get(key)
+    if font is None:
+        font = _load_measure_font(font_name, font_size, bold)
+        if font is not None:
+            fonts[key] = font
+    return font
+
+
+def _load_measure_font(font_name: str, font_size: int, bold: bool):
+    from PIL import ImageFont
+    from utils.proc import run as proc_run
+
+    # 1) Use fc-match to find the exact font libass resolves (most accurate)
+    try:
+        style = "Bold" if bold else "Regular"
+        result = proc_run(
+            ["fc-match", f"{font_name}:{style}", "--format=%{file}"],
+            timeout=3, check=False,
+        )
+        if result.returncode == 0 and result.stdout.strip():
+            fc_path = result.stdout.strip()
+            if os.path.exists(fc_path):
+                return ImageFont.truetype(fc_path, font_size)
+    except Exception:
+        pass
+
+    # 2) Fallback: try common paths (macOS, Linux, Windows)
+    candidates = [
+        "/System/Library/Fonts/Supplemental/Arial Bold.ttf",
+        "/System/Library/Fonts/Helvetica.ttc",
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+        "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
+        "C:/Windows/Fonts/arialbd.ttf",
+    ] if bold else [
+        "/System/Library/Fonts/Supplemental/Arial.ttf",
+        "/System/Library/Fonts/Helvetica.ttc",
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+        "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
+        "C:/Windows/Fonts/arial.ttf",
+    ]
+    for path in candidates:
+        if os.path.exists(path):
+            try:
+                idx = 1 if (bold and path.endswith(".ttc")) else 0
+                return ImageFont.truetype(path, font_size, index=idx)
+            except Exception:
+                continue
+    return None
+
+
+@lru_cache(maxsize=256)
 def _rounded_rect_drawing(w: int, h: int, r: int) -> str:
     """Generate ASS \\p1 drawing commands for a rounded rectangle at origin."""
     r = min(r, w // 2, h // 2)
@@ -493,7 +589,7 @@ def _rounded_rect_drawing(w: int, h: int, r: int) -> str:
     )
 
 
-def _render_branded(words: list[dict], style: dict, offset: float) -> str:
+def _render_branded(words: list[dict], style: dict, offset: float) -> Iterator[str]:
     """
     Branded style — large bold white text, dark rounded pill on active word only.
 
@@ -504,8 +600,8 @@ def _render_branded(words: list[dict], style: dict, offset: float) -> str:
     Each word's display is contiguous to the next word's start to prevent
     flashing/gaps between words.
     """
-    header = generate_branded_header(style)
-    events = []
+    yield generate_branded_header(style)
+    ass_time = _ass_time
     chunk_size = style.get("words_per_chunk", 6)
 
     raw_box = style.get("active_box_color", "&H00000000")
@@ -525,15 +621,16 @@ def _render_branded(words: list[dict], style: dict, offset: float) -> str:
     play_res_y = 1920
     spacing = 2  # ASS Spacing field from header
 
-    chunks = _chunk_words(words, chunk_size)
-
-    for chunk_idx, chunk in enumerate(chunks):
-        if not chunk:
-            continue
-
-        chunk_start = max(0, chunk[0]["start"] - offset)
-        chunk_end = _hold_through_gap(chunks, chunk_idx, max(0, chunk[-1]["end"] - offset), offset)
+    # Font metrics and pill size depend only on the style, not the chunk.
+    space_width = _measure_text_widths([" "], font_name, font_size, is_bold, 0)[0]
+    raw_space_w = _measure_text_widths(["A A"], font_name, font_size, is_bold, 0)[0] - \
+                  _measure_text_widths(["AA"], font_name, font_size, is_bold, 0)[0]
+    actual_pad_x = max(pad_x, int(font_size * 0.25))  # at least 25% of font size
+    pill_h = font_size + pad_y * 2
+    pill_r = min(rounding, pill_h // 2)
+    pill_tags = f"\\p1\\c{box_color}\\bord0\\shad0\\1a&HFF&\\t(0,80,\\1a{box_alpha}&)}}"
 
+    for chunk, chunk_start, chunk_end in _chunk_spans(words, chunk_size, offset):
         # Normalize casing
         normalized = []
         for j, w in enumerate(chunk):
@@ -546,7 +643,6 @@ def _render_branded(words: list[dict], style: dict, offset: float) -> str:
         # Use spacing=0 here — ASS Spacing is handled by libass internally,
         # but we position words ourselves with \pos so we need pure font metrics.
         word_widths = _measure_text_widths(normalized, font_name, font_size, is_bold, 0)
-        space_width = _measure_text_widths([" "], font_name, font_size, is_bold, 0)[0]
 
         # Split into visual lines that fit within play_res_x - margins
         max_line_w = play_res_x - 120  # 60px margin each side
@@ -571,9 +667,6 @@ def _render_branded(words: list[dict], style: dict, offset: float) -> str:
             display_lines.append(" ".join(t for _, t, _ in line))
         display_text = "\\N".join(display_lines)
 
-        # Line height and vertical layout
-        line_height = int(font_size * 1.2)
-        total_text_h = line_height * len(lines)
         # Use explicit \pos for both text and pill — no reliance on libass layout.
         # This gives us full control over line spacing and pill sizing.
         # Position text block from bottom: last line baseline at (PlayResY - MarginV)
@@ -590,10 +683,8 @@ def _render_branded(words: list[dict], style: dict, offset: float) -> str:
             y = block_bottom_y - (len(lines) - 1 - li) * line_spacing - font_size // 2
             line_center_ys.append(y)
 
-        # Pre-compute line geometry — measure space width directly with the font,
-        # use word widths without ASS Spacing inflation for tighter layout.
-        raw_space_w = _measure_text_widths(["A A"], font_name, font_size, is_bold, 0)[0] - \
-                      _measure_text_widths(["AA"], font_name, font_size, is_bold, 0)[0]
+        # Pre-compute line geometry — space width measured directly with the font,
+        # word widths without ASS Spacing inflation for tighter layout.
         line_geometry = []  # (line_center_y, line_left_x, full_line_w, space_w)
         for li, line in enumerate(lines):
             sum_word_w = sum(ww for _, _, ww in line)
@@ -601,66 +692,44 @@ def _render_branded(words: list[dict], style: dict, offset: float) -> str:
             line_left_x = (play_res_x - full_line_w) // 2
             line_geometry.append((line_center_ys[li], line_left_x, full_line_w, raw_space_w))
 
-        chunk_start_ts = seconds_to_ass(chunk_start)
-        chunk_end_ts = seconds_to_ass(chunk_end)
+        chunk_start_ts = ass_time(chunk_start)
+        chunk_end_ts = ass_time(chunk_end)
 
         # Layer 1: the text layout is static for the whole chunk, so each word
         # is emitted once for the chunk span. Only the karaoke pill below needs
-        # per-word events.
+        # per-word events; record each word's line and left edge for it here.
+        word_slots = [(0, 0)] * len(chunk)  # word index -> (line_idx, word_x)
         for li, line in enumerate(lines):
             lcy_l, llx_l, _, asp_w = line_geometry[li]
             wx = llx_l
-            for pi, (_, text, ww) in enumerate(line):
+            for idx, text, ww in line:
                 wcx = int(wx + ww // 2)
-                events.append(
+                yield (
                     f"Dialogue: 1,{chunk_start_ts},{chunk_end_ts},BrandedNormal,,0,0,0,,"
-                    f"{{\\an5\\pos({wcx},{lcy_l})}}{text}"
+                    f"{{\\an5\\pos({wcx},{lcy_l})}}{text}\n"
                 )
+                word_slots[idx] = (li, int(wx))
                 wx += ww + asp_w
 
-        # Layer 0: per-word pill behind the active word
-        for wi, w in enumerate(chunk):
-            w_start = max(0, w["start"] - offset)
-
-            # Contiguous timing
-            if wi < len(chunk) - 1:
-                w_end = max(0, chunk[wi + 1]["start"] - offset)
-            else:
-                w_end = chunk_end
-
-            if w_end <= w_start:
-                w_end = w_start + 0.1
-
-            start_ts = seconds_to_ass(w_start)
-            end_ts = seconds_to_ass(w_end)
-
-            # Find which visual line this word is on
-            word_line_idx = 0
-            word_pos_in_line = 0
-            for li, line in enumerate(lines):
-                for pi, (idx, _, _) in enumerate(line):
-                    if idx == wi:
-                        word_line_idx = li
-                        word_pos_in_line = pi
-                        break
+        # Layer 0: per-word pill behind the active word. Contiguous timing:
+        # each pill holds until the next word starts, the last to chunk end.
+        w_starts = [max(0, w["start"] - offset) for w in chunk]
+        w_ends = [e if e > st else st + 0.1 for st, e in zip(w_starts, w_starts[1:] + [chunk_end])]
+        start_tss = [ass_time(t) for t in w_starts]
+        end_tss = [ass_time(t) for t in w_ends]
 
-            line_cy, line_lx, _, actual_space_w = line_geometry[word_line_idx]
+        for wi in range(len(chunk)):
+            start_ts = start_tss[wi]
+            end_ts = end_tss[wi]
 
-            # X position using derived natural spacing
-            current_line = lines[word_line_idx]
-            word_x = line_lx
-            for k in range(word_pos_in_line):
-                word_x += current_line[k][2] + actual_space_w
-            word_x = int(word_x)
+            word_line_idx, word_x = word_slots[wi]
+            line_cy = line_geometry[word_line_idx][0]
 
             word_w = word_widths[wi]
             word_cx = word_x + word_w // 2
-            actual_pad_x = max(pad_x, int(font_size * 0.25))  # at least 25% of font size
 
             # Pill dimensions
             pill_w = word_w + actual_pad_x * 2
-            pill_h = font_size + pad_y * 2
-            pill_r = min(rounding, pill_h // 2)
 
             # Pill drawing centered at origin (for \an5 positioning)
             drawing = _rounded_rect_drawing(pill_w, pill_h, pill_r)
@@ -668,13 +737,9 @@ def _render_branded(words: list[dict], style: dict, offset: float) -> str:
             draw_offset_x = pill_w // 2
             draw_offset_y = pill_h // 2
 
-            events.append(
+            yield (
                 f"Dialogue: 0,{start_ts},{end_ts},BrandedNormal,,0,0,0,,"
                 f"{{\\an7\\pos({word_cx - draw_offset_x},{line_cy - draw_offset_y})"
-                f"\\p1\\c{box_color}\\bord0\\shad0"
-                f"\\1a&HFF&\\t(0,80,\\1a{box_alpha}&)"
-                f"}}"
-                f"{drawing}{{\\p0}}"
+                f"{pill_tags}{drawing}{{\\p0}}\n"
             )
 
-    return header + "\n".join(events) + "\n"
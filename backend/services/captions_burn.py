@@ -9,10 +9,15 @@ All ffmpeg calls route through utils.proc.run for timeout + logging.
 from __future__ import annotations
 
 import os
+import re
 import sys
+import threading
 from typing import Optional
 
-from services.encoder import get_video_encode_flags
+import numpy as np
+from PIL import Image
+
+from services.encoder import get_audio_encode_flags, get_video_encode_flags, gpu_upload
 from services.media_probe import (
     CPU_FLAGS,
     FFMPEG_TIMEOUT,
@@ -22,6 +27,19 @@ from services.media_probe import (
 from utils.proc import run as proc_run
 
 
+def escape_filter_path(path: str) -> str:
+    """Escape a path as one filter option value inside a filtergraph.
+
+    ffmpeg unescapes twice: the graph parser first (where `[ ] , ;` split the
+    graph), then the filter's option parser (where `:` separates options).
+    Backslash-escaping for both levels keeps drive letters, apostrophes and
+    brackets in the path literal, which wrapping it in single quotes can't do
+    for a path that itself contains one.
+    """
+    value = re.sub(r"([\\':])", r"\\\1", path)
+    return re.sub(r"([\\'\[\],;])", r"\\\1", value)
+
+
 def create_gradient_png(
     output_path: str,
     width: int = 1080,
@@ -30,30 +48,40 @@ def create_gradient_png(
 ) -> str:
     """Create a transparent-to-black gradient PNG for the bottom 50%.
 
-    Uses ffmpeg's lavfi source + geq filter so we don't need Pillow
-    for this specific asset. The top half is fully transparent; the
-    bottom half fades from 0 to `opacity`.
+    The top half is fully transparent; the bottom half fades from 0 to
+    `opacity`. Rasterized with NumPy (same ramp the old ffmpeg geq source
+    drew) rather than a per-pixel expression in a separate ffmpeg process.
     """
     max_alpha = int(opacity * 255)
+    half = height / 2
+    y = np.arange(height)
+    ramp = np.where(y < half, 0, np.minimum(max_alpha, max_alpha * (y - half) / half))
 
-    cmd = [
-        "ffmpeg", "-y",
-        "-f", "lavfi",
-        "-i", f"color=black@0.0:size={width}x{height}:duration=1,format=rgba,"
-              f"geq="
-              f"r=0:"
-              f"g=0:"
-              f"b=0:"
-              f"a='if(lt(Y,H/2),0,min({max_alpha},{max_alpha}*(Y-H/2)/(H/2)))'",
-        "-frames:v", "1",
-        output_path,
-    ]
-    result = proc_run(cmd, timeout=FFMPEG_TIMEOUT, check=False)
-    if result.returncode != 0:
-        raise RuntimeError(f"Gradient creation failed: {result.stderr[-300:]}")
+    rgba = np.zeros((height, width, 4), dtype=np.uint8)
+    rgba[..., 3] = ramp.astype(np.uint8)[:, None]
+    Image.fromarray(rgba).save(output_path, format="PNG")
     return output_path
 
 
+def gradient_png(width: int, height: int, opacity: float) -> str:
+    """Path to a cached gradient PNG for this frame size and opacity.
+
+    Every clip of a batch shares the same overlay, so it is drawn once into
+    the cache dir and reused instead of being recreated per burn.
+    """
+    from config.paths import paths
+
+    max_alpha = int(opacity * 255)
+    path = os.path.join(paths["cache"], "gradients", f"bottom-{width}x{height}-a{max_alpha}.png")
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Concurrent renders may race on the same file; publish it atomically.
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        create_gradient_png(tmp, width, height, opacity)
+        os.replace(tmp, path)
+    return path
+
+
 def burn_captions(
     input_path: str,
     ass_path: str,
@@ -64,35 +92,50 @@ def burn_captions(
     logo_height: int = 80,
     logo_margin_x: int = 30,
     logo_margin_y: int = 40,
+    audio_filter: Optional[str] = None,
+    input_filter: Optional[str] = None,
+    frame_dims: Optional[tuple] = None,
+    input_range: Optional[tuple] = None,
 ) -> str:
     """Burn ASS subtitles into the video.
 
     Optionally adds:
     - Bottom 50% smooth gradient overlay (transparent → black)
     - Logo image in top-left corner
+
+    audio_filter: an `-af` chain (e.g. from audio_normalize.loudnorm_filter)
+    applied while this pass encodes, instead of copying the audio through.
+
+    input_filter: a graph from [0:v] to [base] (video_processor.
+    frame_filter_graph) run ahead of the overlays, so the crop shares this
+    encode instead of needing its own; frame_dims is then its output size.
+
+    input_range: (start_second, end_second) to read from input_path, seeked
+    before decoding so the clip needs no separate cut pass.
     """
-    safe_ass = ass_path.replace("\\", "/").replace(":", "\\:")
+    safe_ass = escape_filter_path(ass_path)
 
     gradient_path: Optional[str] = None
     if gradient_overlay:
-        width, height = get_dimensions(input_path)
-        gradient_path = output_path + ".gradient.png"
-        create_gradient_png(gradient_path, width, height, gradient_opacity)
+        width, height = frame_dims if input_filter else get_dimensions(input_path)
+        gradient_path = gradient_png(width, height, gradient_opacity)
 
     inputs = ["-i", input_path]
+    if input_range:
+        start, end = input_range
+        inputs = ["-ss", str(start), "-t", str(end - start), *inputs]
     input_idx = 1
-    filter_parts: list[str] = []
+    filter_parts: list[str] = [input_filter] if input_filter else []
+    current_label = "base" if input_filter else "0:v"
 
     if gradient_overlay and gradient_path:
         inputs.extend(["-i", gradient_path])
         grad_idx = input_idx
         input_idx += 1
         filter_parts.append(
-            f"[0:v][{grad_idx}:v]overlay=0:0:format=auto[grad]"
+            f"[{current_label}][{grad_idx}:v]overlay=0:0:format=auto[grad]"
         )
         current_label = "grad"
-    else:
-        current_label = "0:v"
 
     if logo_path and os.path.exists(logo_path):
         inputs.extend(["-i", logo_path])
@@ -105,26 +148,45 @@ def burn_captions(
         current_label = "withlogo"
 
     # Burn ASS subtitles
-    filter_parts.append(f"[{current_label}]ass='{safe_ass}'[out]")
+    filter_parts.append(f"[{current_label}]ass=filename={safe_ass}[out]")
     filter_complex = ";".join(filter_parts)
 
     # Some split-screen concat outputs may not have audio
     has_audio = has_audio_stream(input_path)
-    audio_map = ["-map", "0:a?", "-c:a", "copy"] if has_audio else []
+    if not has_audio:
+        audio_map = []
+    elif audio_filter:
+        audio_map = ["-map", "0:a?", "-af", audio_filter, *get_audio_encode_flags()]
+    else:
+        audio_map = ["-map", "0:a?", "-c:a", "copy"]
+
+    def _cmd(flags: list[str], graph: str, extra: tuple[str, ...] = ()) -> list[str]:
+        return [
+            "ffmpeg", *extra, "-y",
+            *inputs,
+            "-filter_complex", graph,
+            "-map", "[out]",
+            *audio_map,
+            *flags,
+            "-movflags", "+faststart",
+            output_path,
+        ]
 
     enc_flags = get_video_encode_flags()
-    cmd = [
-        "ffmpeg", "-y",
-        *inputs,
-        "-filter_complex", filter_complex,
-        "-map", "[out]",
-        *audio_map,
-        *enc_flags,
-        "-movflags", "+faststart",
-        output_path,
-    ]
-
-    result = proc_run(cmd, timeout=FFMPEG_TIMEOUT, check=False)
+    result = None
+
+    # libass rasterizes on the CPU; with a GPU encoder, upload the finished
+    # frames once so the encode reads them from device memory.
+    upload = gpu_upload(enc_flags)
+    if upload:
+        extra, upload_filter = upload
+        graph = filter_complex[: -len("[out]")] + f",{upload_filter}[out]"
+        result = proc_run(_cmd(enc_flags, graph, tuple(extra)), timeout=FFMPEG_TIMEOUT, check=False, output=False)
+        if result.returncode != 0:
+            print("Warning: GPU upload failed for caption burn, retrying from CPU frames", file=sys.stderr)
+
+    if result is None or result.returncode != 0:
+        result = proc_run(_cmd(enc_flags, filter_complex), timeout=FFMPEG_TIMEOUT, check=False, output=False)
 
     # Fallback to CPU if HW encoder failed
     if result.returncode != 0 and enc_flags != CPU_FLAGS:
@@ -132,20 +194,7 @@ def burn_captions(
             "Warning: HW encoder failed for caption burn, falling back to libx264",
             file=sys.stderr,
         )
-        cmd_fallback = [
-            "ffmpeg", "-y",
-            *inputs,
-            "-filter_complex", filter_complex,
-            "-map", "[out]",
-            *audio_map,
-            *CPU_FLAGS,
-            "-movflags", "+faststart",
-            output_path,
-        ]
-        result = proc_run(cmd_fallback, timeout=FFMPEG_TIMEOUT, check=False)
-
-    if gradient_overlay and gradient_path and os.path.exists(gradient_path):
-        os.remove(gradient_path)
+        result = proc_run(_cmd(CPU_FLAGS, filter_complex), timeout=FFMPEG_TIMEOUT, check=False, output=False)
 
     if result.returncode != 0:
         raise RuntimeError(f"FFmpeg caption burn failed: {result.stderr[-500:]}")
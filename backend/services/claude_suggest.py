@@ -10,6 +10,7 @@ Priority: Claude Code → Codex → heuristic fallback.
 import json
 import math
 import os
+import re
 import subprocess
 import sys
 import tempfile
@@ -23,6 +24,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from presets import MIN_CLIP_DURATION, MAX_CLIP_DURATION, TARGET_CLIP_DURATION_MIN, TARGET_CLIP_DURATION_MAX
 from utils.text import clean_title
 
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*\n?(.*?)\n?\s*```", re.DOTALL)
+
 
 def _cli_name_exts() -> list[str]:
     if sys.platform == "win32":
@@ -822,9 +825,7 @@ Transcript:
 
             response = result.stdout.strip()
             if "```" in response:
-                import re
-
-                fence_match = re.search(r"```(?:json)?\s*\n?(.*?)\n?\s*```", response, re.DOTALL)
+                fence_match = _JSON_FENCE_RE.search(response)
                 if fence_match:
                     response = fence_match.group(1).strip()
 
@@ -1011,8 +1012,7 @@ def suggest_with_claude(
             try:
                 response = result.stdout.strip()
                 if "```" in response:
-                    import re
-                    fence_match = re.search(r"```(?:json)?\s*\n?(.*?)\n?\s*```", response, re.DOTALL)
+                    fence_match = _JSON_FENCE_RE.search(response)
                     if fence_match:
                         response = fence_match.group(1).strip()
 
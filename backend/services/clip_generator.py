@@ -12,6 +12,10 @@ import shutil
 import subprocess
 import re
 import threading
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import accumulate, islice
 from typing import Optional, Callable
 
 from utils.proc import run as proc_run, ProcError
@@ -20,12 +24,15 @@ from config.paths import paths
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from services.audio_normalize import loudnorm_filter
 from services.caption_renderer import render_captions
+from services.video_cut import copy_segments
 from services.video_processor import (
     cut_segment,
     cut_multi_segment,
     crop_to_vertical,
     fit_to_frame,
+    frame_filter_graph,
     burn_captions,
     normalize_audio,
     concat_outro,
@@ -51,6 +58,55 @@ _WEAK_OPENING_WORDS = frozenset([
 _SCENE_TIME_RE = re.compile(r"pts_time:([0-9]+(?:\.[0-9]+)?)")
 
 
+@lru_cache(maxsize=8192)
+def _bare_word(text: str) -> str:
+    """Lowercased word with edge punctuation stripped, for filler matching.
+
+    A podcast's vocabulary is a few thousand words repeated tens of thousands
+    of times, so the normalized form is cached per raw token. Only the edges
+    are stripped: dropping inner punctuation would turn "E.R." into "er".
+    """
+    return text.strip().lower().strip(".,!?;:-–—'\"")
+
+
+# (words, len(words), index) for the transcript last looked up. A batch hands
+# every clip the same list, so the O(N) index is built once per transcript.
+_time_index_cache: tuple = (None, 0, None)
+
+
+def _time_index(words: list[dict]) -> Optional[tuple[list[float], list[float]]]:
+    """Return (starts, running max of ends) for a start-ordered word list,
+    or None when the starts are out of order and only a full scan is safe."""
+    global _time_index_cache
+    cached_words, cached_len, index = _time_index_cache
+    if cached_words is words and cached_len == len(words):
+        return index
+    starts = [w["start"] for w in words]
+    if any(b < a for a, b in zip(starts, islice(starts, 1, None))):
+        index = None
+    else:
+        index = (starts, list(accumulate((w["end"] for w in words), max)))
+    _time_index_cache = (words, len(words), index)
+    return index
+
+
+def _words_in_range(words: list[dict], start: float, end: float) -> list[dict]:
+    """Words overlapping (start, end), in transcript order.
+
+    Same result as scanning every word for `end > start and start < end`,
+    but bisects to the candidates: nothing before the first word whose
+    running max end passes `start` can overlap, nor anything from the first
+    word starting at or after `end`.
+    """
+    index = _time_index(words)
+    if index is None:
+        return [w for w in words if w["end"] > start and w["start"] < end]
+    starts, max_ends = index
+    lo = bisect_right(max_ends, start)
+    hi = bisect_left(starts, end)
+    return [w for w in words[lo:hi] if w["end"] > start]
+
+
 def _trim_weak_opening(
     words: list[dict],
     start_second: float,
@@ -70,7 +126,7 @@ def _trim_weak_opening(
         return start_second
 
     clip_words = sorted(
-        [w for w in words if w["end"] > start_second and w["start"] < end_second],
+        _words_in_range(words, start_second, end_second),
         key=lambda w: w["start"],
     )
     if len(clip_words) < 2:
@@ -96,8 +152,7 @@ def _trim_weak_opening(
         # If the opening already has question/exclamation energy, keep it.
         if "?" in raw or "!" in raw:
             break
-        bare = raw.lower().strip(".,!?;:-–—'\"")
-        if bare in _WEAK_OPENING_WORDS:
+        if _bare_word(raw) in _WEAK_OPENING_WORDS:
             weak_run_end = max(float(w["end"]), weak_run_end or 0.0)
             continue
         saw_real_word_after_weak = True
@@ -229,7 +284,7 @@ def _apply_local_transition_smoothing(
         output_path,
     ]
     try:
-        result = proc_run(cmd, timeout=300, check=False)
+        result = proc_run(cmd, timeout=300, check=False, output=False)
         return result.returncode == 0 and os.path.exists(output_path)
     except Exception:
         return False
@@ -258,6 +313,18 @@ def _reserve_output_path(output_dir: str, stem: str, ext: str) -> str:
         return candidate
 
 
+def _move_into_place(src: str, dst: str) -> None:
+    """Move a finished file out of work_dir, which is deleted afterwards.
+
+    A rename when dst is on the same filesystem; otherwise (EXDEV) the bytes
+    are copied as before.
+    """
+    try:
+        os.replace(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
 def _reframe_can_jump(
     reframe: bool,
     crop_strategy: str,
@@ -337,7 +404,7 @@ def _snap_to_sentence_end(
     """
     SENTENCE_ENDINGS = ".!?"
 
-    clip_words = [w for w in transcript_words if w["end"] > start_second and w["start"] < end_second]
+    clip_words = _words_in_range(transcript_words, start_second, end_second)
     if not clip_words:
         return end_second
 
@@ -348,7 +415,13 @@ def _snap_to_sentence_end(
     if last_word_text and last_word_text[-1] in SENTENCE_ENDINGS:
         return max(end_second, last_clip_word["end"])
 
-    for w in sorted(transcript_words, key=lambda x: x["start"]):
+    index = _time_index(transcript_words)
+    if index is None:
+        following = sorted(transcript_words, key=lambda x: x["start"])
+    else:
+        # Already in start order: begin at the first word that can qualify.
+        following = islice(transcript_words, bisect_left(index[0], last_clip_word["end"]), None)
+    for w in following:
         if w["start"] < last_clip_word["end"]:
             continue
         if w["end"] > end_second + max_extension:
@@ -369,16 +442,8 @@ def _clean_transcript_words(words: list[dict]) -> list[dict]:
     - Strips obvious filler words (um, uh, hmm, etc.) so they don't appear in captions.
     - Does NOT shift timestamps — word timing must match the actual audio exactly.
     """
-    cleaned = []
-    for w in words:
-        text = w.get("word", "").strip()
-        # Strip punctuation for matching, but keep original text
-        bare = text.lower().strip(".,!?;:-–—'\"")
-        if bare in _FILLER_WORDS:
-            continue
-        cleaned.append(w)
-
-    return cleaned
+    # Strip punctuation for matching, but keep original text
+    return [w for w in words if _bare_word(w.get("word", "")) not in _FILLER_WORDS]
 
 
 def _build_tight_segments(
@@ -396,10 +461,7 @@ def _build_tight_segments(
     If no cuts needed, returns a single segment spanning the full range.
     """
     # Get words in clip range
-    clip_words = [
-        w for w in words
-        if w["end"] > start_second and w["start"] < end_second
-    ]
+    clip_words = _words_in_range(words, start_second, end_second)
 
     if len(clip_words) < 3:
         return [{"start": start_second, "end": end_second}]
@@ -409,9 +471,7 @@ def _build_tight_segments(
     seg_start = start_second
 
     for i, w in enumerate(clip_words):
-        text = w.get("word", "").strip()
-        bare = text.lower().strip(".,!?;:-–—'\"")
-        is_filler = bare in _FILLER_WORDS
+        is_filler = _bare_word(w.get("word", "")) in _FILLER_WORDS
 
         # Check gap before this word
         prev_end = clip_words[i - 1]["end"] if i > 0 else start_second
@@ -636,6 +696,50 @@ def _render_with_remotion(
             pass
 
 
+def export_raw_clips(video_path: str, clips: list[dict], output_dir: str) -> list[dict]:
+    """Write uncaptioned, uncropped previews of `clips` straight from the source.
+
+    All single-range clips are stream-copied in one ffmpeg run (see
+    copy_segments), so a preview batch takes seconds rather than a full render
+    per clip. Cuts land on source keyframes, so the files are drafts for
+    picking moments, not deliverables. A clip with several `segments` can't be
+    joined by stream copy, so it is cut with cut_multi_segment instead of being
+    previewed as its whole outer range.
+    """
+    if not os.path.exists(video_path):
+        raise FileNotFoundError(f"Video not found: {video_path}")
+
+    os.makedirs(output_dir, exist_ok=True)
+    results = []
+    cuts = []
+    for i, clip in enumerate(clips):
+        title = clip.get("title", f"clip_{i+1}")
+        path = _reserve_output_path(output_dir, f"{safe_filename(title)}_raw", ".mp4")
+        segments = [s for s in clip.get("segments") or [] if s["end"] > s["start"]]
+        if len(segments) > 1:
+            cut_multi_segment(video_path, path, segments)
+            start, end = segments[0]["start"], segments[-1]["end"]
+            duration = sum(s["end"] - s["start"] for s in segments)
+        else:
+            start, end = clip["start_second"], clip["end_second"]
+            cuts.append((path, start, end))
+            duration = end - start
+        results.append((title, path, start, end, duration))
+    copy_segments(video_path, cuts)
+
+    return [
+        {
+            "output_path": path,
+            "duration": round(duration, 2),
+            "file_size_mb": round(os.path.getsize(path) / (1024 * 1024), 2),
+            "title": title,
+            "start_second": start,
+            "end_second": end,
+        }
+        for title, path, start, end, duration in results
+    ]
+
+
 def generate_clip(
     video_path: str,
     start_second: float,
@@ -815,22 +919,13 @@ def generate_clip(
             msg = f"Cutting {n_segs} segment{'s' if n_segs > 1 else ''} (1/{total_steps})"
             progress_callback(10, msg)
 
-        segment_path = os.path.join(work_dir, "segment.mp4")
-        if keep_segments and len(keep_segments) > 1:
-            cut_multi_segment(video_path, segment_path, keep_segments)
-        else:
-            cut_segment(video_path, segment_path, start_second, end_second)
-
         # Remap transcript words for multi-segment clips.
         # Needed before crop (speaker detection) and captions.
         if keep_segments and len(keep_segments) > 1 and transcript_words:
             remapped_words = []
             cumulative_t = 0.0
             for seg in keep_segments:
-                seg_words = [
-                    w for w in transcript_words
-                    if w["end"] > seg["start"] and w["start"] < seg["end"]
-                ]
+                seg_words = _words_in_range(transcript_words, seg["start"], seg["end"])
                 seg_duration = seg["end"] - seg["start"]
                 for w in seg_words:
                     # Clamp to segment bounds to avoid negative/overflow timestamps
@@ -849,19 +944,62 @@ def generate_clip(
             caption_time_offset = 0
         else:
             # Filter words to just this clip's time range
-            crop_words = [
-                w for w in transcript_words
-                if w["end"] > start_second and w["start"] < end_second
-            ] if transcript_words else transcript_words
+            crop_words = (
+                _words_in_range(transcript_words, start_second, end_second)
+                if transcript_words else transcript_words
+            )
             crop_clip_start = start_second
             caption_time_offset = start_second
 
+        # crop_words already holds this clip's words (remapped for a
+        # multi-segment clip); re-scanning the full transcript would
+        # only rebuild the same list.
+        clip_words = crop_words
+        if clip_words and clean_fillers:
+            clip_words = _clean_transcript_words(clip_words)
+
+        # An ASS-only render re-encodes in the caption burn anyway, so a crop
+        # that needs no face analysis runs in that pass: one encode, not two.
+        # Cutting keeps the frame size, so the source answers for the cut.
+        fused_crop = None
+        if use_ass_captions and allow_ass_fallback and clip_words:
+            fused_crop = frame_filter_graph(
+                video_path,
+                strategy=crop_strategy,
+                crop_keyframes=crop_keyframes,
+                target_dims=spec.dims,
+                reframe=spec.reframe,
+                face_map=face_map,
+                transcript_words=crop_words,
+                clip_start=crop_clip_start,
+            )
+
+        # With the crop fused, a single-range clip is also seeked inside the
+        # burn (-ss before -i decodes from the exact frame, as cut_segment
+        # does), which saves the cut's full re-encode.
+        source_range = None
+        segment_path = os.path.join(work_dir, "segment.mp4")
+        if keep_segments and len(keep_segments) > 1:
+            cut_multi_segment(video_path, segment_path, keep_segments)
+        elif fused_crop:
+            source_range = (start_second, end_second)
+        else:
+            cut_segment(video_path, segment_path, start_second, end_second)
+
         # Step 2: Crop to vertical 9:16
         if progress_callback:
             progress_callback(30, f"Resizing for {spec.name} format (2/{total_steps})")
 
+        # The crop is re-read by a later pass, so it skips faststart's rewrite
+        # unless it is handed back as the caption overlay's source. With the
+        # crop fused, the burn reads the source itself (single range) or the
+        # multi-range cut instead; cropped_path still names a file inside
+        # work_dir, because the overlay hand-off moves it out of place.
         cropped_path = os.path.join(work_dir, "cropped.mp4")
-        if spec.reframe:
+        burn_input = cropped_path
+        if fused_crop:
+            burn_input = video_path if source_range else segment_path
+        elif spec.reframe:
             crop_to_vertical(
                 segment_path, cropped_path,
                 strategy=crop_strategy,
@@ -870,27 +1008,20 @@ def generate_clip(
                 face_map=face_map,
                 crop_keyframes=crop_keyframes,
                 target_dims=spec.dims,
+                faststart=keep_caption_overlay,
             )
         else:
-            fit_to_frame(segment_path, cropped_path, target_dims=spec.dims)
+            fit_to_frame(
+                segment_path, cropped_path, target_dims=spec.dims,
+                faststart=keep_caption_overlay,
+            )
 
         # Step 3: Render captions (Remotion-first; ASS fallback optional)
+        audio_normalized = False
         if transcript_words:
             if progress_callback:
                 progress_callback(50, f"Adding {caption_style} captions (3/{total_steps})")
 
-            if keep_segments and len(keep_segments) > 1:
-                clip_words = remapped_words
-            else:
-                clip_words = [
-                    w for w in transcript_words
-                    if w["end"] > start_second and w["start"] < end_second
-                ]
-
-            # Clean filler words
-            if clean_fillers:
-                clip_words = _clean_transcript_words(clip_words)
-
             if clip_words:
                 if progress_callback:
                     progress_callback(65, f"Rendering captions into video (3/{total_steps})")
@@ -919,19 +1050,32 @@ def generate_clip(
                 if not remotion_ok and allow_ass_fallback:
                     # Optional fallback: ASS subtitle burn-in
                     ass_path = os.path.join(work_dir, "captions.ass")
-                    render_captions(
-                        words=clip_words,
-                        caption_style=caption_style,
-                        output_path=ass_path,
-                        time_offset=caption_time_offset,
-                    )
+
+                    # The burn re-encodes anyway, so it applies the loudness
+                    # correction too and step 4 has nothing left to do. The
+                    # burn copies audio otherwise, so measuring the cropped
+                    # clip measures what normalize_audio would have seen.
+                    # The measure pass is an ffmpeg child, so it runs while
+                    # the ASS file is built here in Python.
+                    with ThreadPoolExecutor(max_workers=1) as pool:
+                        loudnorm_future = pool.submit(
+                            loudnorm_filter, burn_input, input_range=source_range,
+                        )
+                        render_captions(
+                            words=clip_words,
+                            caption_style=caption_style,
+                            output_path=ass_path,
+                            time_offset=caption_time_offset,
+                            style=style_config,
+                        )
+                        audio_filter = loudnorm_future.result()
 
                     use_gradient = style_config.get("gradient_overlay", False)
                     gradient_opacity = style_config.get("gradient_opacity", 0.6)
                     use_logo = style_config.get("logo_support", False) and logo_path
 
                     burn_captions(
-                        input_path=cropped_path,
+                        input_path=burn_input,
                         ass_path=ass_path,
                         output_path=captioned_path,
                         gradient_overlay=use_gradient,
@@ -940,7 +1084,12 @@ def generate_clip(
                         logo_height=style_config.get("logo_height", 80),
                         logo_margin_x=style_config.get("logo_margin_x", 30),
                         logo_margin_y=style_config.get("logo_margin_y", 40),
+                        audio_filter=audio_filter,
+                        input_filter=fused_crop,
+                        frame_dims=spec.dims,
+                        input_range=source_range,
                     )
+                    audio_normalized = True
             else:
                 captioned_path = cropped_path
         else:
@@ -950,8 +1099,11 @@ def generate_clip(
         if progress_callback:
             progress_callback(70, f"Balancing audio levels (4/{total_steps})")
 
-        normalized_path = os.path.join(work_dir, "normalized.mp4")
-        normalize_audio(captioned_path, normalized_path)
+        if audio_normalized:
+            normalized_path = captioned_path
+        else:
+            normalized_path = os.path.join(work_dir, "normalized.mp4")
+            normalize_audio(captioned_path, normalized_path)
 
         # Step 5: Prepend intro, then append outro (if provided).
         # concat_outro joins two clips head-to-tail, so passing the intro first
@@ -991,7 +1143,7 @@ def generate_clip(
             )
             os.close(fd)
 
-        shutil.copy2(final_video_path, final_path)
+        _move_into_place(final_video_path, final_path)
 
         # Optional bounded QA/autofix pass for transition jumps.
         # Hard-capped to avoid any infinite rerender loop.
@@ -1029,14 +1181,14 @@ def generate_clip(
         if length_warning:
             out["warning"] = length_warning
         if keep_caption_overlay and caption_overlay_path and os.path.exists(caption_overlay_path):
-            # Copy out of work_dir before cleanup so the returned paths survive.
+            # Move out of work_dir before cleanup so the returned paths survive.
             base, _ = os.path.splitext(final_path)
             persisted_overlay = f"{base}_captions.mov"
-            shutil.copy2(caption_overlay_path, persisted_overlay)
+            _move_into_place(caption_overlay_path, persisted_overlay)
             out["caption_overlay_path"] = persisted_overlay
             if os.path.exists(cropped_path):
                 persisted_source = f"{base}_source.mp4"
-                shutil.copy2(cropped_path, persisted_source)
+                _move_into_place(cropped_path, persisted_source)
                 out["cropped_source_path"] = persisted_source
         return out
 
@@ -7,48 +7,112 @@ Probes system for available encoders:
 - AMD: h264_amf (Windows) / h264_vaapi (Linux)
 - Fallback: libx264 (CPU, always available)
 
+PODCLI_VIDEO_CODEC=hevc (or av1) puts the HEVC (or AV1) hardware encoders
+ahead of H.264 for smaller files; H.264 stays the default because it plays
+everywhere on the web.
+
 Returns optimal FFmpeg encoder flags for the current system.
 """
 
 import subprocess
-from utils.proc import run as proc_run, ProcError
+from utils.proc import run as proc_run, ProcError, ffmpeg_threads
 import platform
 import tempfile
 import os
 import functools
+import re
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from config.paths import paths
 
+# Hardware candidates per codec and platform, best first.
+_CANDIDATES = {
+    "h264": {
+        "Darwin": ["h264_videotoolbox"],
+        "Linux": ["h264_nvenc", "h264_vaapi"],
+        "Windows": ["h264_nvenc", "h264_amf", "h264_qsv"],
+    },
+    "hevc": {
+        "Darwin": ["hevc_videotoolbox"],
+        "Linux": ["hevc_nvenc"],
+        "Windows": ["hevc_nvenc"],
+    },
+    "av1": {
+        "Linux": ["av1_nvenc", "av1_qsv"],
+        "Windows": ["av1_nvenc", "av1_qsv"],
+    },
+}
+
+# Each preferred codec falls back through the more compatible ones.
+_CODEC_ORDER = {
+    "h264": ["h264"],
+    "hevc": ["hevc", "h264"],
+    "av1": ["av1", "hevc", "h264"],
+}
+
+
+def _preferred_codec() -> str:
+    codec = os.environ.get("PODCLI_VIDEO_CODEC", "").strip().lower()
+    return codec if codec in _CODEC_ORDER else "h264"
+
 
 @functools.lru_cache(maxsize=1)
 def detect_encoders() -> dict:
     """
     Detect available hardware encoders.
+
+    The result is persisted alongside get_encoder_info's, so every render
+    process after the first reads it back instead of re-running the probes.
     """
+    cached = _read_cached_info()
+    if cached is not None:
+        return cached
+    info = _probe_encoders()
+    _write_cached_info(info)
+    return info
+
+
+def _probe_all() -> bool:
+    return os.environ.get("PODCLI_PROBE_ALL", "").strip() == "1"
+
+
+def _probe_encoders() -> dict:
     system = platform.system()
     available = ["libx264"]
 
-    candidates = []
-    if system == "Darwin":
-        candidates = ["h264_videotoolbox"]
-    elif system == "Linux":
-        candidates = ["h264_nvenc", "h264_vaapi"]
-    elif system == "Windows":
-        candidates = ["h264_nvenc", "h264_amf", "h264_qsv"]
-
-    for enc in candidates:
-        if _test_encoder(enc):
-            available.append(enc)
-
-    priority = [
-        "h264_videotoolbox",
-        "h264_nvenc",
-        "h264_amf",
-        "h264_vaapi",
-        "h264_qsv",
-        "libx264",
+    candidates = [
+        enc
+        for codec in _CODEC_ORDER[_preferred_codec()]
+        for enc in _CANDIDATES[codec].get(system, [])
     ]
+    priority = candidates + ["libx264"]
+
+    # A build without the encoder compiled in can never pass the test encode;
+    # one registry listing rules those out without spawning a probe each.
+    registered = _registered_encoders()
+    if registered is not None:
+        candidates = [enc for enc in candidates if enc in registered]
+
+    # Candidates are listed best-first, so when the first one works nothing
+    # below it can become `best`; skip those probes unless the full list is
+    # wanted (PODCLI_PROBE_ALL=1, e.g. to show every option in the UI).
+    probe_all = _probe_all()
+    if candidates and not probe_all and _test_encoder(candidates[0]):
+        available.append(candidates[0])
+        candidates = []
+    elif candidates and not probe_all:
+        candidates = candidates[1:]
+
+    # Each probe waits on its own ffmpeg child (up to 15s for a hung driver),
+    # so run them side by side rather than back to back.
+    if len(candidates) > 1:
+        with ThreadPoolExecutor(max_workers=len(candidates)) as pool:
+            works = list(pool.map(_test_encoder, candidates))
+    else:
+        works = [_test_encoder(enc) for enc in candidates]
+    available += [enc for enc, ok in zip(candidates, works) if ok]
 
     best = "libx264"
     for enc in priority:
@@ -60,14 +124,41 @@ def detect_encoders() -> dict:
         "available": available,
         "best": best,
         "best_flags": _get_encoder_flags(best),
+        "audio": "libfdk_aac" if registered and "libfdk_aac" in registered else "aac",
         "system": system,
     }
 
 
+def _registered_encoders() -> set[str] | None:
+    """Names from `ffmpeg -encoders`, or None if the listing can't be read.
+
+    Registration only means the encoder was built in; NVENC registers on
+    machines without an NVIDIA GPU, so candidates still need _test_encoder.
+    """
+    try:
+        result = proc_run(["ffmpeg", "-hide_banner", "-encoders"], timeout=5, check=False)
+    except (ProcError, FileNotFoundError, OSError):
+        return None
+    if result.returncode != 0:
+        return None
+    names = set()
+    in_table = False
+    for line in result.stdout.splitlines():
+        if not in_table:
+            # The capability legend ends with a dashed rule before the table.
+            in_table = line.strip().startswith("---")
+            continue
+        fields = line.split()
+        if len(fields) >= 2:
+            names.add(fields[1])
+    return names or None
+
+
 def _test_encoder(encoder: str) -> bool:
     """
     Test if an FFmpeg encoder works by encoding a small real video to a temp file.
-    Writing to /dev/null or -f null fails for some HW encoders.
+    Writing to /dev/null or -f null fails for some HW encoders. Video only:
+    an audio track would just add an AAC encoder to every probe.
     """
     tmp_out = None
     try:
@@ -78,14 +169,11 @@ def _test_encoder(encoder: str) -> bool:
         cmd = [
             "ffmpeg", "-y",
             "-f", "lavfi", "-i", "color=black:s=320x240:d=0.5:r=24",
-            "-f", "lavfi", "-i", "anullsrc=r=44100:cl=mono",
             "-t", "0.5",
             *flags,
-            "-c:a", "aac",
-            "-shortest",
             tmp_out,
         ]
-        result = proc_run(cmd, timeout=15, check=False)
+        result = proc_run(cmd, timeout=15, check=False, output=False)
         # Check both return code AND that the file was actually created
         return result.returncode == 0 and os.path.exists(tmp_out) and os.path.getsize(tmp_out) > 100
     except (ProcError, FileNotFoundError, OSError):
@@ -98,58 +186,168 @@ def _test_encoder(encoder: str) -> bool:
                 pass
 
 
+# Kept minimal to avoid conflicts with filter_complex. Built once; callers
+# get a fresh list from _get_encoder_flags.
+_FLAGS: dict[str, tuple[str, ...]] = {
+    "h264_videotoolbox": (
+        "-c:v", "h264_videotoolbox",
+        "-b:v", "6M",              # 6 Mbps — plenty for 1080x1920 vertical
+        "-profile:v", "high",
+        "-allow_sw", "1",          # Allow software fallback
+    ),
+    "hevc_videotoolbox": (
+        "-c:v", "hevc_videotoolbox",
+        "-b:v", "4M",              # HEVC matches H.264 quality at ~2/3 the rate
+        "-tag:v", "hvc1",          # Needed for QuickTime / Safari playback
+        "-allow_sw", "1",
+    ),
+    "h264_nvenc": (
+        "-c:v", "h264_nvenc",
+        "-preset", "p6",           # Slower = higher quality
+        "-cq", "18",               # High quality
+        "-profile:v", "high",
+    ),
+    "hevc_nvenc": (
+        "-c:v", "hevc_nvenc",
+        "-preset", "p6",
+        "-cq", "23",
+        "-tag:v", "hvc1",
+    ),
+    "av1_nvenc": (
+        "-c:v", "av1_nvenc",
+        "-preset", "p6",
+        "-cq", "28",
+    ),
+    "av1_qsv": (
+        "-c:v", "av1_qsv",
+        "-preset", "slow",
+        "-global_quality", "28",
+    ),
+    "h264_amf": (
+        "-c:v", "h264_amf",
+        "-quality", "quality",     # Prioritize quality over speed
+        "-rc", "cqp",
+        "-qp_i", "18", "-qp_p", "18",
+    ),
+    "h264_vaapi": (
+        "-c:v", "h264_vaapi",
+        "-qp", "18",
+    ),
+    "h264_qsv": (
+        "-c:v", "h264_qsv",
+        "-preset", "slow",
+        "-global_quality", "18",
+    ),
+    "libx264": (
+        "-c:v", "libx264",
+        "-crf", "18",              # Near-lossless quality
+        "-preset", "slow",         # Better compression at same quality
+        "-profile:v", "high",
+    ),
+}
+
+
 def _get_encoder_flags(encoder: str) -> list[str]:
-    """
-    Get optimal FFmpeg flags for a given encoder.
-    Kept minimal to avoid conflicts with filter_complex.
-    """
-    flags = {
-        "h264_videotoolbox": [
-            "-c:v", "h264_videotoolbox",
-            "-b:v", "6M",              # 6 Mbps — plenty for 1080x1920 vertical
-            "-profile:v", "high",
-            "-allow_sw", "1",          # Allow software fallback
-        ],
-        "h264_nvenc": [
-            "-c:v", "h264_nvenc",
-            "-preset", "p6",           # Slower = higher quality
-            "-cq", "18",               # High quality
-            "-profile:v", "high",
-        ],
-        "h264_amf": [
-            "-c:v", "h264_amf",
-            "-quality", "quality",     # Prioritize quality over speed
-            "-rc", "cqp",
-            "-qp_i", "18", "-qp_p", "18",
-        ],
-        "h264_vaapi": [
-            "-c:v", "h264_vaapi",
-            "-qp", "18",
-        ],
-        "h264_qsv": [
-            "-c:v", "h264_qsv",
-            "-preset", "slow",
-            "-global_quality", "18",
-        ],
-        "libx264": [
-            "-c:v", "libx264",
-            "-crf", "18",              # Near-lossless quality
-            "-preset", "slow",         # Better compression at same quality
-            "-profile:v", "high",
-        ],
-    }
-    return flags.get(encoder, flags["libx264"])
+    """Get optimal FFmpeg flags for a given encoder."""
+    return list(_FLAGS.get(encoder, _FLAGS["libx264"]))
 
 
 def get_video_encode_flags() -> list[str]:
     """Get the best available encoder flags. Main entry point."""
     try:
         info = detect_encoders()
-        return info["best_flags"]
+        flags = info["best_flags"]
     except Exception:
         # Absolute fallback — never let encoder detection break the pipeline
         print("Warning: encoder detection failed, using libx264", file=sys.stderr)
-        return ["-c:v", "libx264", "-crf", "18", "-preset", "slow", "-profile:v", "high"]
+        return list(_FLAGS["libx264"])
+    # Concurrent x264 encodes would each start a thread per core; share them.
+    threads = ffmpeg_threads()
+    if threads and "libx264" in flags:
+        return [*flags, "-threads", str(threads)]
+    return flags
+
+
+# Audio for every re-encoded clip. Fraunhofer's AAC encoder (non-free, so only
+# in custom builds) is faster and better than ffmpeg's native one; its VBR
+# mode 5 lands around the 192k the native encoder is given.
+_AUDIO_FLAGS = {
+    "libfdk_aac": ("-c:a", "libfdk_aac", "-vbr", "5", "-ar", "44100"),
+    "aac": ("-c:a", "aac", "-b:a", "192k", "-ar", "44100"),
+}
+
+
+def get_audio_encode_flags() -> list[str]:
+    """AAC encode flags for the best AAC encoder this ffmpeg has."""
+    try:
+        encoder = detect_encoders().get("audio", "aac")
+    except Exception:
+        encoder = "aac"
+    return list(_AUDIO_FLAGS.get(encoder, _AUDIO_FLAGS["aac"]))
+
+
+# A -vf chain's closing fixed-size scale, the one step worth moving to the GPU.
+_TAIL_SCALE_RE = re.compile(r"(^|,)scale=(\d+):(\d+)$")
+
+
+def hw_family(enc_flags: list[str]) -> str | None:
+    """"cuda" or "vaapi" when enc_flags encode on a GPU that can also scale."""
+    codec = enc_flags[enc_flags.index("-c:v") + 1] if "-c:v" in enc_flags else ""
+    if codec.endswith("_nvenc"):
+        return "cuda"
+    if codec.endswith("_vaapi"):
+        return "vaapi"
+    return None
+
+
+def vaapi_device() -> str:
+    return os.environ.get("PODCLI_VAAPI_DEVICE") or "/dev/dri/renderD128"
+
+
+def gpu_upload(enc_flags: list[str]) -> tuple[list[str], str] | None:
+    """(leading args, filter) that hand a graph's CPU frames to the encoder's
+    GPU once, at the end of the graph, or None for encoders that take CPU
+    frames anyway.
+
+    The args go ahead of the first -i. With NVENC they also decode that
+    input on NVDEC; without -hwaccel_output_format the decoded frames come
+    back to system memory for the CPU filters (crop expressions, libass),
+    and a codec NVDEC can't handle falls back to software decoding.
+    """
+    family = hw_family(enc_flags)
+    if family == "cuda":
+        return ["-hwaccel", "cuda"], "hwupload_cuda"
+    if family == "vaapi":
+        return ["-vaapi_device", vaapi_device()], "format=nv12,hwupload"
+    return None
+
+
+def gpu_scaled_command(cmd_parts_before_enc: list[str], enc_flags: list[str]) -> list[str] | None:
+    """cmd_parts_before_enc with its -vf chain's final scale=W:H run on the
+    encoder's GPU, or None when that doesn't apply.
+
+    Frames are uploaded right after the CPU crop, at crop size, and stay on
+    the device through scaling and encoding; otherwise the CPU scales to the
+    full output size and the encoder uploads that. Crop x expressions
+    still need the CPU, so frames are filtered there in between.
+    """
+    upload = gpu_upload(enc_flags)
+    if upload is None or "-vf" not in cmd_parts_before_enc:
+        return None
+    i = cmd_parts_before_enc.index("-vf") + 1
+    match = _TAIL_SCALE_RE.search(cmd_parts_before_enc[i])
+    if not match:
+        return None
+    sep, w, h = match.groups()
+    extra, upload_filter = upload
+    cmd = list(cmd_parts_before_enc)
+    cmd[i] = f"{cmd[i][:match.start()]}{sep}{upload_filter},scale_{hw_family(enc_flags)}={w}:{h}"
+    return cmd[:1] + extra + cmd[1:]
+
+
+# Bumped whenever the shape of the persisted info changes (2 added "audio"),
+# so a file written by an older podcli is re-probed instead of half-trusted.
+_CACHE_VERSION = 2
 
 
 def _encoder_cache_path() -> str:
@@ -167,36 +365,72 @@ def _ffmpeg_fingerprint() -> str:
         return ffbin
 
 
-def get_encoder_info() -> dict:
-    """Get full encoder detection info (for UI/logging).
+def _read_cached_info() -> dict | None:
+    """The persisted detection result, if it was made by this ffmpeg and OS."""
+    import json
+    try:
+        with open(_encoder_cache_path(), encoding="utf-8") as f:
+            cached = json.load(f)
+        if (
+            cached.get("version") == _CACHE_VERSION
+            and cached.get("fingerprint") == _ffmpeg_fingerprint()
+            and cached.get("codec", "h264") == _preferred_codec()
+            # A full probe answers a partial one too, but not the reverse.
+            and (cached.get("probe_all", False) or not _probe_all())
+            and cached.get("system") == platform.system()
+            and cached.get("release") == platform.release()
+        ):
+            info = cached["info"]
+            # Flags come from this code, not the file, so tuning them never
+            # waits for the cache to go stale.
+            if "best" in info:
+                info["best_flags"] = _get_encoder_flags(info["best"])
+            return info
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        pass
+    return None
 
-    Cached under paths["cache"]/encoder.json keyed by ffmpeg binary fingerprint.
-    Encoder probing runs ffmpeg twice (~1.6s on macOS) — huge startup win.
-    """
+
+def _write_cached_info(info: dict) -> None:
     import json
     cache_path = _encoder_cache_path()
-    fp = _ffmpeg_fingerprint()
-
     try:
-        with open(cache_path, encoding="utf-8") as f:
-            cached = json.load(f)
-        if cached.get("fingerprint") == fp and cached.get("system") == platform.system():
-            return cached["info"]
-    except (OSError, ValueError, KeyError):
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        # Parallel renders (processes, or threads of one) can all miss at
+        # once; each writes its own temp file and replaces atomically so none
+        # of them reads a half-written file.
+        tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "version": _CACHE_VERSION,
+                "fingerprint": _ffmpeg_fingerprint(),
+                "system": platform.system(),
+                "release": platform.release(),
+                "codec": _preferred_codec(),
+                "probe_all": _probe_all(),
+                "info": info,
+            }, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
         pass
 
+
+def get_encoder_info() -> dict:
+    """Get full encoder detection info (for UI/logging).
+
+    Cached under paths["cache"]/encoder.json keyed by ffmpeg binary fingerprint
+    and OS. Encoder probing runs ffmpeg twice (~1.6s on macOS) — huge startup win.
+    """
+    cached = _read_cached_info()
+    if cached is not None:
+        return cached
+
     try:
         info = detect_encoders()
     except Exception:
         info = {"available": ["libx264"], "best": "libx264",
-                "best_flags": ["-c:v", "libx264", "-crf", "18", "-preset", "slow", "-profile:v", "high"],
+                "best_flags": list(_FLAGS["libx264"]),
                 "system": platform.system()}
 
-    try:
-        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
-        with open(cache_path, "w", encoding="utf-8") as f:
-            json.dump({"fingerprint": fp, "system": platform.system(), "info": info}, f)
-    except OSError:
-        pass
-
+    _write_cached_info(info)
     return info
@@ -2,6 +2,8 @@ def normalize_engine(name: str | None) -> str:
     value = (name or "whisper-py").strip().lower()
     if value in ("whispercpp", "whisper-cpp", "whisper.cpp", "cpp"):
         return "whispercpp"
+    if value in ("faster-whisper", "faster_whisper", "faster"):
+        return "faster-whisper"
     if value in ("assemblyai", "assembly-ai", "aai"):
         return "assemblyai"
     return "whisper-py"
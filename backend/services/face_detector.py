@@ -10,6 +10,7 @@ and detect_faces() to keep the model path and parameters in one place.
 """
 
 import os
+import threading
 from typing import Optional
 
 # Minimum face width as fraction of frame width (filters noise)
@@ -23,6 +24,26 @@ CONFIDENCE_THRESHOLD = 0.5
 # Coordinates are scaled back to original frame size.
 _MAX_DIM = 640
 
+# Detectors are kept per thread (a YuNet instance isn't safe to share, and
+# clips render on parallel threads), keyed by model path and input size.
+_local = threading.local()
+
+
+def _dnn_target(cv2) -> tuple[int, int] | None:
+    """(backend_id, target_id) to run YuNet on, or None for OpenCV's default
+    CPU path. PODCLI_FACE_BACKEND=cuda moves inference onto the GPU, for
+    OpenCV builds with CUDA DNN support and a device to run it on; =opencl
+    uses OpenCV's T-API instead, which reaches integrated GPUs too."""
+    choice = os.environ.get("PODCLI_FACE_BACKEND", "").strip().lower()
+    try:
+        if choice == "cuda" and cv2.cuda.getCudaEnabledDeviceCount() >= 1:
+            return cv2.dnn.DNN_BACKEND_CUDA, cv2.dnn.DNN_TARGET_CUDA
+        if choice == "opencl" and cv2.ocl.haveOpenCL():
+            return cv2.dnn.DNN_BACKEND_OPENCV, cv2.dnn.DNN_TARGET_OPENCL
+    except (AttributeError, cv2.error):
+        pass
+    return None
+
 
 def _model_path() -> str:
     backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -37,6 +58,8 @@ def create_detector(frame_width: int, frame_height: int):
     returns coordinates in the original frame space.
 
     Returns (detector, scale_x, scale_y) tuple, or None if model not found.
+    The detector is reused by later calls on this thread for the same size,
+    which skips re-parsing the model and its first-run warm-up.
     """
     import cv2
 
@@ -49,14 +72,25 @@ def create_detector(frame_width: int, frame_height: int):
     det_w = int(frame_width * scale)
     det_h = int(frame_height * scale)
 
-    detector = cv2.FaceDetectorYN.create(
-        model=model,
-        config="",
-        input_size=(det_w, det_h),
-        score_threshold=CONFIDENCE_THRESHOLD,
-        nms_threshold=0.3,
-        top_k=10,
-    )
+    cache = getattr(_local, "detectors", None)
+    if cache is None:
+        cache = _local.detectors = {}
+    target = _dnn_target(cv2)
+    key = (model, det_w, det_h, target)
+    detector = cache.get(key)
+    if detector is None:
+        if len(cache) >= 8:
+            cache.clear()
+        extra = {"backend_id": target[0], "target_id": target[1]} if target else {}
+        detector = cache[key] = cv2.FaceDetectorYN.create(
+            model=model,
+            config="",
+            input_size=(det_w, det_h),
+            score_threshold=CONFIDENCE_THRESHOLD,
+            nms_threshold=0.3,
+            top_k=10,
+            **extra,
+        )
     return (detector, det_w, det_h, frame_width / det_w, frame_height / det_h)
 
 
@@ -309,6 +309,7 @@ def detect_local_speaker_reframe_plan(
                 ],
                 timeout=motion_timeout,
                 check=False,
+                output=False,
             )
         except ProcError as exc:
             log.warning("local-reframe motion ffmpeg failed: %s", exc)
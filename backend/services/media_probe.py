@@ -11,13 +11,14 @@ they inherit the mandatory timeout + structured logging.
 
 from __future__ import annotations
 
-import json
+import functools
 import math
 import os
 import sys
 from typing import Optional
 
-from services.encoder import get_video_encode_flags
+from services.encoder import get_video_encode_flags, gpu_scaled_command
+from utils import jsonio
 from utils.proc import run as proc_run
 
 # Max time for any single FFmpeg/ffprobe call (seconds).
@@ -55,12 +56,21 @@ def run_ffmpeg_with_fallback(
         cmd_parts_before_enc + <encoder_flags> + cmd_parts_after_enc + [output_path]
 
     If the preferred hardware encoder fails, the function automatically
-    retries with libx264 before raising.
+    retries with libx264 before raising. With a GPU encoder, a -vf ending in
+    scale=W:H first runs that scale on the GPU (encoder.gpu_scaled_command),
+    falling back to the CPU chain if the device can't.
     """
     enc_flags = get_video_encode_flags()
+    gpu_before = gpu_scaled_command(cmd_parts_before_enc, enc_flags)
+    if gpu_before:
+        cmd = gpu_before + enc_flags + cmd_parts_after_enc + [output_path]
+        if proc_run(cmd, timeout=FFMPEG_TIMEOUT, check=False, output=False).returncode == 0:
+            return output_path
+        print(f"Warning: GPU scaling failed for {label}, scaling on the CPU", file=sys.stderr)
+
     cmd = cmd_parts_before_enc + enc_flags + cmd_parts_after_enc + [output_path]
 
-    result = proc_run(cmd, timeout=FFMPEG_TIMEOUT, check=False)
+    result = proc_run(cmd, timeout=FFMPEG_TIMEOUT, check=False, output=False)
     if result.returncode == 0:
         return output_path
 
@@ -70,7 +80,7 @@ def run_ffmpeg_with_fallback(
             file=sys.stderr,
         )
         cmd_fallback = cmd_parts_before_enc + CPU_FLAGS + cmd_parts_after_enc + [output_path]
-        result2 = proc_run(cmd_fallback, timeout=FFMPEG_TIMEOUT, check=False)
+        result2 = proc_run(cmd_fallback, timeout=FFMPEG_TIMEOUT, check=False, output=False)
         if result2.returncode == 0:
             return output_path
         raise RuntimeError(
@@ -81,7 +91,22 @@ def run_ffmpeg_with_fallback(
 
 
 def get_video_info(video_path: str) -> dict:
-    """Probe a media file and return the full ffprobe JSON payload."""
+    """Probe a media file and return the full ffprobe JSON payload.
+
+    The probe is cached per (path, mtime, size): one render asks about the same
+    file from several stages, and each ffprobe launch costs 100-300 ms. Every
+    call parses a fresh dict, so callers may modify what they get.
+    """
+    try:
+        st = os.stat(video_path)
+    except OSError:
+        return jsonio.loads(_probe_json.__wrapped__(video_path))  # let ffprobe report it
+    return jsonio.loads(_probe_json(video_path, st.st_mtime_ns, st.st_size))
+
+
+@functools.lru_cache(maxsize=256)
+def _probe_json(video_path: str, mtime_ns: int = 0, size: int = 0) -> str:
+    """ffprobe's JSON for video_path; mtime_ns and size only key the cache."""
     cmd = [
         "ffprobe",
         "-v", "quiet",
@@ -93,7 +118,7 @@ def get_video_info(video_path: str) -> dict:
     result = proc_run(cmd, timeout=FFMPEG_TIMEOUT, check=False)
     if result.returncode != 0:
         raise RuntimeError(f"ffprobe failed: {result.stderr}")
-    return json.loads(result.stdout)
+    return result.stdout
 
 
 def has_audio_stream(video_path: str) -> bool:
@@ -228,7 +228,7 @@ def _cut(source: str, out_dir: str, idx: int, m: Moment, format: str, logo: str
     else:
         cmd += ["-vf", _scale_filter(format)]
     cmd += [*_encode_flags(), out, "-loglevel", "error"]
-    proc_run(cmd, timeout=300, check=True)
+    proc_run(cmd, timeout=300, check=True, output=False)
     return out
 
 
@@ -254,11 +254,11 @@ def build_reel(session: ReelSession, progress_callback: Optional[Callable] = Non
             p = os.path.abspath(x).replace("\\", "/")
             f.write(f"file '{p}'\n")
     r = proc_run(["ffmpeg", "-y", "-f", "concat", "-safe", "0", "-i", lst,
-                  "-c", "copy", reel, "-loglevel", "error"], timeout=300, check=False)
+                  "-c", "copy", reel, "-loglevel", "error"], timeout=300, check=False, output=False)
     if r.returncode != 0:
         proc_run(["ffmpeg", "-y", "-f", "concat", "-safe", "0", "-i", lst,
                   *_encode_flags(), reel, "-loglevel", "error"],
-                 timeout=900, check=True)
+                 timeout=900, check=True, output=False)
     if progress_callback:
         progress_callback(100, f"built reel with {len(files)} moments")
     return reel
@@ -8,9 +8,12 @@ per-word and per-segment speaker attribution.
 Supports 2-person and 3+ person podcasts automatically.
 """
 
+import functools
 import os
 import subprocess
 import tempfile
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
 from typing import Optional, Callable
 
 from utils.proc import run as proc_run, ProcError
@@ -41,12 +44,60 @@ def extract_audio_wav(video_path: str, output_path: str) -> str:
         "-ac", "1",             # Mono
         output_path,
     ]
-    result = proc_run(cmd, timeout=600, check=False)
+    result = proc_run(cmd, timeout=600, check=False, output=False)
     if result.returncode != 0:
         raise RuntimeError(f"Audio extraction failed: {result.stderr[-300:]}")
     return output_path
 
 
+@functools.lru_cache(maxsize=2)
+def _load_pipeline(token: str):
+    """Load the diarization pipeline onto the best device, once per token.
+
+    Loading reads several hundred MB of weights and allocates device memory,
+    so a long-lived backend keeps the pipeline for later files. Failed loads
+    raise and are not cached. Returns (pipeline, device name).
+    """
+    from pyannote.audio import Pipeline
+
+    # pyannote >= 3.1 uses 'token', older versions use 'use_auth_token'
+    try:
+        pipeline = Pipeline.from_pretrained(
+            "pyannote/speaker-diarization-3.1",
+            token=token,
+        )
+    except TypeError:
+        pipeline = Pipeline.from_pretrained(
+            "pyannote/speaker-diarization-3.1",
+            use_auth_token=token,
+        )
+
+    # Move pipeline to GPU if available (Apple Silicon MPS or CUDA)
+    import torch
+    device = "cpu"
+    if torch.cuda.is_available():
+        device = "cuda"
+        pipeline.to(torch.device("cuda"))
+    elif hasattr(torch.backends, "mps") and torch.backends.mps.is_available():
+        try:
+            pipeline.to(torch.device("mps"))
+            device = "mps"
+        except Exception:
+            pass  # Some pyannote components don't support MPS, fall back to CPU
+    return pipeline, device
+
+
+def unload_pipeline() -> None:
+    """Drop cached diarization pipelines, e.g. to hand GPU memory back."""
+    _load_pipeline.cache_clear()
+    try:
+        import torch
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+    except ImportError:
+        pass
+
+
 def run_diarization(
     audio_path: str,
     num_speakers: Optional[int] = None,
@@ -71,7 +122,7 @@ def run_diarization(
     token = hf_token or os.environ.get("HF_TOKEN", "")
 
     try:
-        from pyannote.audio import Pipeline
+        import pyannote.audio  # noqa: F401  (loaded by _load_pipeline)
     except ImportError:
         msg = "Speaker detection not installed — run: podcli setup --speakers"
         if progress_callback:
@@ -99,17 +150,7 @@ def run_diarization(
         progress_callback(10, "Loading speaker diarization model...")
 
     try:
-        # pyannote >= 3.1 uses 'token', older versions use 'use_auth_token'
-        try:
-            pipeline = Pipeline.from_pretrained(
-                "pyannote/speaker-diarization-3.1",
-                token=token,
-            )
-        except TypeError:
-            pipeline = Pipeline.from_pretrained(
-                "pyannote/speaker-diarization-3.1",
-                use_auth_token=token,
-            )
+        pipeline, device = _load_pipeline(token)
     except Exception as e:
         err_str = str(e).lower()
         if "token" in err_str or "auth" in err_str or "403" in err_str or "401" in err_str:
@@ -127,19 +168,6 @@ def run_diarization(
             raise PermissionError(msg) from e
         raise
 
-    # Move pipeline to GPU if available (Apple Silicon MPS or CUDA)
-    import torch
-    device = "cpu"
-    if torch.cuda.is_available():
-        device = "cuda"
-        pipeline.to(torch.device("cuda"))
-    elif hasattr(torch.backends, "mps") and torch.backends.mps.is_available():
-        try:
-            pipeline.to(torch.device("mps"))
-            device = "mps"
-        except Exception:
-            pass  # Some pyannote components don't support MPS, fall back to CPU
-
     # Estimate duration for progress message
     import wave
     try:
@@ -189,6 +217,50 @@ def run_diarization(
     return speaker_segments
 
 
+def _turn_index(speaker_segments: list[dict]) -> Optional[tuple[list[float], list[float]]]:
+    """(starts, running max of ends) for start-ordered diarization turns.
+
+    pyannote emits turns in start order, possibly overlapping during
+    crosstalk; the running max keeps bisection correct for those. Returns
+    None for out-of-order input, which callers then scan in full.
+    """
+    starts = [sp["start"] for sp in speaker_segments]
+    if any(b < a for a, b in zip(starts, starts[1:])):
+        return None
+    return starts, list(accumulate((sp["end"] for sp in speaker_segments), max))
+
+
+def _overlapping_turns(
+    speaker_segments: list[dict],
+    index: Optional[tuple[list[float], list[float]]],
+    start: float,
+    end: float,
+) -> list[dict]:
+    """The turns that can overlap (start, end), in their original order.
+
+    Everything before the first turn whose running max end passes `start`,
+    and everything from the first turn starting at or after `end`, has no
+    overlap, so the per-speaker sums and their tie order are unchanged.
+    """
+    if index is None:
+        return speaker_segments
+    starts, max_ends = index
+    return speaker_segments[bisect_right(max_ends, start):bisect_left(starts, end)]
+
+
+def _turns_containing(
+    speaker_segments: list[dict],
+    index: Optional[tuple[list[float], list[float]]],
+    t: float,
+) -> list[dict]:
+    """Like _overlapping_turns, for turns that may contain instant `t`
+    (end points included)."""
+    if index is None:
+        return speaker_segments
+    starts, max_ends = index
+    return speaker_segments[bisect_left(max_ends, t):bisect_right(starts, t)]
+
+
 def assign_speakers_to_segments(
     segments: list[dict],
     speaker_segments: list[dict],
@@ -205,13 +277,14 @@ def assign_speakers_to_segments(
             seg["speaker"] = None
         return segments
 
+    index = _turn_index(speaker_segments)
     for seg in segments:
         seg_start = seg["start"]
         seg_end = seg["end"]
 
         # Find overlapping speaker segments
         speaker_overlap = {}
-        for sp in speaker_segments:
+        for sp in _overlapping_turns(speaker_segments, index, seg_start, seg_end):
             overlap_start = max(seg_start, sp["start"])
             overlap_end = min(seg_end, sp["end"])
             overlap = max(0, overlap_end - overlap_start)
@@ -244,9 +317,10 @@ def assign_speakers_to_words(
             w["speaker"] = None
         return words
 
+    index = _turn_index(speaker_segments)
     for w in words:
         speaker_overlap = {}
-        for sp in speaker_segments:
+        for sp in _overlapping_turns(speaker_segments, index, w["start"], w["end"]):
             overlap = min(w["end"], sp["end"]) - max(w["start"], sp["start"])
             if overlap > 0:
                 speaker_overlap[sp["speaker"]] = speaker_overlap.get(sp["speaker"], 0) + overlap
@@ -257,7 +331,11 @@ def assign_speakers_to_words(
             # Zero-length or gap words: fall back to midpoint containment.
             midpoint = (w["start"] + w["end"]) / 2
             w["speaker"] = next(
-                (sp["speaker"] for sp in speaker_segments if sp["start"] <= midpoint <= sp["end"]),
+                (
+                    sp["speaker"]
+                    for sp in _turns_containing(speaker_segments, index, midpoint)
+                    if sp["start"] <= midpoint <= sp["end"]
+                ),
                 None,
             )
 
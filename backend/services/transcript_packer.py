@@ -11,6 +11,7 @@ Output: packed/<hash>.md under the active config home
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
 import os
@@ -45,10 +46,18 @@ REACTION_REPORT_THRESHOLD = 0.15
 
 def compute_cache_hash(video_path: str) -> str:
     """Match src/services/transcript-cache.ts: sha256 of first 10MB + 'size:<N>', 16 hex chars."""
-    size = os.path.getsize(video_path)
+    st = os.stat(video_path)
+    return _cache_hash(os.path.abspath(video_path), st.st_size, st.st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=32)
+def _cache_hash(abs_path: str, size: int, mtime_ns: int) -> str:
+    # One process run asks for the same video's key from several caches
+    # (transcript, signals, suggestions). Keyed on size+mtime so an edited
+    # file is rehashed; the key format itself stays shared with the TS cache.
     h = hashlib.sha256()
     remaining = 10 * 1024 * 1024
-    with open(video_path, "rb") as f:
+    with open(abs_path, "rb") as f:
         while remaining > 0:
             chunk = f.read(min(1 << 20, remaining))
             if not chunk:
@@ -76,6 +85,8 @@ def engine_cache_suffix(engine: str | None) -> str:
     engine = normalize_engine(engine)
     if engine == "whispercpp":
         return "-whispercpp"
+    if engine == "faster-whisper":
+        return "-faster-whisper"
     if engine == "assemblyai":
         return "-assemblyai"
     return ""
@@ -13,6 +13,26 @@ import re
 import json
 from typing import List, Dict, Any, Optional
 
+# Pattern: "Speaker Name (MM:SS)" or "Speaker (HH:MM:SS)" on a line of its own.
+# Matched across the whole text, so whitespace is [^\S\n]: never a newline.
+_SPEAKER_HEADER_RE = re.compile(
+    r'^[^\S\n]*(\S.*?)[^\S\n]*\((\d{1,2}:\d{2}(?::\d{2})?)\)[^\S\n]*$',
+    re.MULTILINE,
+)
+# Runs of whitespace and "⁓" markers: the markers are dropped, and a run that
+# holds any whitespace collapses to a single space.
+_BLOCK_NOISE_RE = re.compile(r'[\s⁓]+')
+
+
+def _space_or_nothing(match: "re.Match[str]") -> str:
+    return " " if match.group().strip("⁓") else ""
+
+
+def _clean_block_text(text: str) -> str:
+    """Drop "⁓" markers from a speaker block's body and collapse whitespace,
+    line breaks included."""
+    return _BLOCK_NOISE_RE.sub(_space_or_nothing, text).strip()
+
 
 def parse_srt_timestamp(ts: str) -> float:
     """Convert SRT timestamp HH:MM:SS,mmm to seconds."""
@@ -310,68 +330,33 @@ def parse_speaker_transcript(raw_text: str, total_duration: Optional[float] = No
         total_duration: Total duration of the podcast in seconds
         time_adjust: Seconds to add/subtract from all timestamps (e.g., -1.0 to shift 1s earlier)
     """
-    lines = raw_text.strip().split("\n")
-
-    # Pattern: "Speaker Name (MM:SS)" or "Speaker (HH:MM:SS)"
-    header_pattern = re.compile(r'^(.+?)\s*\((\d{1,2}:\d{2}(?::\d{2})?)\)\s*$')
-
-    # First pass: extract blocks (speaker, start_time, text)
+    # First pass: extract blocks (speaker, start_time, text). Each block's
+    # body is everything between its header and the next one; text before
+    # the first header belongs to no speaker and is skipped.
+    headers = list(_SPEAKER_HEADER_RE.finditer(raw_text))
+    body_ends = [m.start() for m in headers[1:]] + [len(raw_text)]
     blocks = []
-    current_speaker = None
-    current_time = 0.0
-    current_text_lines = []
-
-    for line in lines:
-        match = header_pattern.match(line.strip())
-        if match:
-            # Save previous block
-            if current_speaker is not None:
-                text = " ".join(current_text_lines).strip()
-                # Clean up special chars
-                text = text.replace("⁓", "").strip()
-                text = re.sub(r'\s+', ' ', text)
-                if text:
-                    blocks.append({
-                        "speaker": current_speaker,
-                        "start": current_time,
-                        "text": text,
-                    })
-
-            current_speaker = match.group(1).strip()
-            current_time = parse_timestamp(match.group(2))
-            current_text_lines = []
-        else:
-            stripped = line.strip()
-            if stripped:
-                current_text_lines.append(stripped)
-
-    # Don't forget the last block
-    if current_speaker is not None:
-        text = " ".join(current_text_lines).strip()
-        text = text.replace("⁓", "").strip()
-        text = re.sub(r'\s+', ' ', text)
+    for match, body_end in zip(headers, body_ends):
+        text = _clean_block_text(raw_text[match.end():body_end])
         if text:
             blocks.append({
-                "speaker": current_speaker,
-                "start": current_time,
+                "speaker": match.group(1).strip(),
+                "start": parse_timestamp(match.group(2)),
                 "text": text,
             })
 
     if not blocks:
         return {"error": "No speaker blocks found in transcript"}
 
-    # Second pass: compute end times for each block
-    for i, block in enumerate(blocks):
-        if i + 1 < len(blocks):
-            block["end"] = blocks[i + 1]["start"]
-        else:
-            # Last block: use total_duration or estimate from text length
-            if total_duration:
-                block["end"] = total_duration
-            else:
-                # Rough estimate: ~3 words per second
-                word_count = len(block["text"].split())
-                block["end"] = block["start"] + max(word_count / 3.0, 2.0)
+    # Second pass: each block ends where the next one starts
+    for block, nxt in zip(blocks, blocks[1:]):
+        block["end"] = nxt["start"]
+    last = blocks[-1]
+    if total_duration:
+        last["end"] = total_duration
+    else:
+        # Rough estimate: ~3 words per second
+        last["end"] = last["start"] + max(len(last["text"].split()) / 3.0, 2.0)
 
     # Third pass: generate word-level timestamps
     all_words = []
@@ -392,18 +377,16 @@ def parse_speaker_transcript(raw_text: str, total_duration: Optional[float] = No
         usable_duration = block_duration * 0.95
         word_duration = usable_duration / len(words_in_block) if words_in_block else 0
 
-        block_words = []
+        block_start = block["start"]
+        gap_duration = word_duration * 0.9  # small gap between words
         for j, w in enumerate(words_in_block):
-            word_start = block["start"] + j * word_duration + time_adjust
-            word_end = word_start + word_duration * 0.9  # small gap between words
-            word_obj = {
+            word_start = block_start + j * word_duration + time_adjust
+            all_words.append({
                 "word": w,
-                "start": round(max(0, word_start), 3),
-                "end": round(max(0, word_end), 3),
+                "start": round(word_start, 3) if word_start > 0 else 0,
+                "end": round(max(0, word_start + gap_duration), 3),
                 "speaker": speaker,
-            }
-            all_words.append(word_obj)
-            block_words.append(word_obj)
+            })
 
         # Track speaker time
         if speaker not in speaker_times:
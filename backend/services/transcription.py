@@ -7,16 +7,19 @@ Produces word-level timestamps with speaker labels by:
 3. Merging speaker labels onto each word and segment
 """
 
+import functools
 import json
 import http.client
 import os
 import shutil
 import sys
 import tempfile
+import threading
 import time
 import urllib.error
 import urllib.parse
 import urllib.request
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from typing import Optional, Callable
 
 from services.engines import is_assemblyai_engine, normalize_engine
@@ -87,6 +90,89 @@ def _transcribe_with_whispercpp(file_path, model_size, language, progress_callba
     return result
 
 
+# Single-pass decoding. By default both Whisper engines re-decode
+# low-confidence windows at rising temperatures, and condition each window on
+# the previous text. On noisy podcast audio that can double or triple the runtime
+# for a marginal accuracy gain, and conditioning feeds repetition loops.
+_FAST_DECODE = {"temperature": 0.0, "condition_on_previous_text": False}
+
+
+def _decode_options(engine: str, model_size: str, overrides: Optional[dict]) -> dict:
+    opts = dict(_FAST_DECODE)
+    # openai-whisper is already greedy unless beam_size is given (beam_size=1
+    # would switch it to the slower beam decoder); faster-whisper beams 5 wide.
+    if engine == "faster-whisper" and model_size in ("tiny", "base", "small"):
+        opts.update(beam_size=1, best_of=1)
+    opts.update(overrides or {})
+    return opts
+
+
+@functools.lru_cache(maxsize=1)
+def _load_whisper_model(model_size: str):
+    """openai-whisper model, kept loaded for the next file in this process.
+
+    load_model already places it on CUDA when one is available, and
+    transcribe() runs fp16 there (falling back to fp32 on CPU by itself).
+    """
+    import whisper
+
+    return whisper.load_model(model_size)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_faster_whisper_model(model_size: str):
+    """faster-whisper model, kept loaded like _load_whisper_model. device="auto"
+    picks CUDA when present and compute_type="default" keeps fp16 there."""
+    from faster_whisper import WhisperModel
+
+    return WhisperModel(model_size, device="auto", compute_type="default")
+
+
+def _transcribe_with_faster_whisper(file_path, model_size, language, progress_callback, decode_options=None):
+    """Run faster-whisper (CTranslate2) and return openai-whisper's result shape,
+    so both engines share the timestamp post-processing below."""
+    try:
+        import faster_whisper  # noqa: F401  (loaded by _load_faster_whisper_model)
+    except ImportError as e:
+        raise RuntimeError(
+            "The faster-whisper engine needs the faster-whisper package — "
+            "pip install faster-whisper, or rerun with --engine whisper-py."
+        ) from e
+
+    if progress_callback:
+        progress_callback(5, "Loading Whisper model...")
+    model = _load_faster_whisper_model(model_size)
+
+    if progress_callback:
+        progress_callback(10, f"Transcribing with faster-whisper ({model_size})...")
+    seg_iter, info = model.transcribe(
+        file_path,
+        language=language,
+        word_timestamps=True,
+        **_decode_options("faster-whisper", model_size, decode_options),
+    )
+
+    # Segments are produced lazily as decoding runs.
+    segments = []
+    for seg in seg_iter:
+        segments.append({
+            "id": seg.id,
+            "start": seg.start,
+            "end": seg.end,
+            "text": seg.text,
+            "words": [
+                {"word": w.word, "start": w.start, "end": w.end, "probability": w.probability}
+                for w in (seg.words or [])
+            ],
+        })
+    return {
+        "text": "".join(s["text"] for s in segments),
+        "segments": segments,
+        "duration": info.duration,
+        "language": info.language,
+    }
+
+
 def _assemblyai_base_url() -> str:
     region = os.environ.get("ASSEMBLYAI_REGION", "").strip().lower()
     if region == "eu":
@@ -329,6 +415,82 @@ def _transcribe_with_assemblyai(file_path, language, enable_diarization, num_spe
     raise TimeoutError(f"AssemblyAI transcript timed out: transcript_id={transcript_id}")
 
 
+def _diarize(file_path, num_speakers, progress_callback=None, wav_path=None, cancel=None) -> list[dict]:
+    """Extract (or reuse) the 16 kHz mono WAV and run speaker diarization on it.
+
+    cancel: an Event checked once the audio is extracted; when it is set the
+    job returns [] without loading pyannote (see _abandon_diarization).
+    """
+    from services.speaker_detection import extract_audio_wav, run_diarization
+
+    if progress_callback:
+        progress_callback(55, "Extracting audio for speaker detection...")
+
+    shared_wav = wav_path if wav_path and os.path.exists(wav_path) else None
+    if shared_wav:
+        diar_wav = shared_wav
+    else:
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
+            diar_wav = tmp.name
+
+    try:
+        if not shared_wav:
+            extract_audio_wav(file_path, diar_wav)
+        if cancel is not None and cancel.is_set():
+            return []
+
+        if progress_callback:
+            progress_callback(60, "Running speaker diarization...")
+
+        return run_diarization(
+            diar_wav,
+            num_speakers=num_speakers,
+            progress_callback=lambda pct, msg: (
+                progress_callback(60 + int(pct * 0.3), msg) if progress_callback else None
+            ),
+        )
+    finally:
+        if not shared_wav and os.path.exists(diar_wav):
+            os.unlink(diar_wav)
+
+
+def _start_diarization(
+    file_path, num_speakers, wav_path=None,
+) -> "Optional[tuple[Future[list[dict]], threading.Event]]":
+    """Run _diarize on a worker thread. It needs only the audio, so it can
+    overlap the Whisper decode; it reports no progress of its own, which
+    would interleave with Whisper's.
+
+    Returns (future, cancel_event), or None when PODCLI_DIARIZE_OVERLAP=0.
+    Overlapping keeps Whisper and pyannote loaded at the same time, so on a
+    GPU the card must hold both: Whisper's weights (about 1 GB for base, 3 GB
+    for small, up to 10 GB for large) plus pyannote's segmentation and
+    embedding models and their activations (another 1-2 GB). On a card
+    without that headroom set PODCLI_DIARIZE_OVERLAP=0, and diarization runs
+    after the transcription as before.
+    """
+    if os.environ.get("PODCLI_DIARIZE_OVERLAP", "").strip() == "0":
+        return None
+    cancel = threading.Event()
+    pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="diarize")
+    future = pool.submit(_diarize, file_path, num_speakers, None, wav_path, cancel)
+    pool.shutdown(wait=False)  # the worker exits once the job is done
+    return future, cancel
+
+
+def _abandon_diarization(job) -> None:
+    """Stop a _start_diarization job whose transcription failed.
+
+    A job that has not started is dropped; one still extracting audio skips
+    pyannote; one already diarizing is waited for. Either way no worker is
+    left running (or holding its temporary WAV) once the error propagates.
+    """
+    future, cancel = job
+    cancel.set()
+    if not future.cancel():
+        wait([future])
+
+
 def _attach_speakers_and_faces(
     file_path,
     base,
@@ -336,10 +498,12 @@ def _attach_speakers_and_faces(
     num_speakers,
     progress_callback,
     wav_path=None,
+    diarization: Optional[Future] = None,
 ):
     """Merge speaker diarization + face analysis into a transcribed result.
     Shared by both engines; face analysis (OpenCV) runs even when diarization
-    is unavailable."""
+    is unavailable. `diarization` is a job from _start_diarization, when one
+    was started alongside transcription."""
     segments = base.get("segments") or []
     words = base.get("words") or []
     duration = base.get("duration") or (segments[-1]["end"] if segments else 0.0)
@@ -351,55 +515,31 @@ def _attach_speakers_and_faces(
     if enable_diarization:
         try:
             from services.speaker_detection import (
-                extract_audio_wav,
-                run_diarization,
                 assign_speakers_to_segments,
                 assign_speakers_to_words,
                 create_speaker_summary,
             )
 
-            if progress_callback:
-                progress_callback(55, "Extracting audio for speaker detection...")
-
-            shared_wav = wav_path if wav_path and os.path.exists(wav_path) else None
-            if shared_wav:
-                diar_wav = shared_wav
+            if diarization is not None:
+                if progress_callback:
+                    progress_callback(60, "Finishing speaker diarization...")
+                speaker_segments = diarization.result()
             else:
-                with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-                    diar_wav = tmp.name
-
-            try:
-                if not shared_wav:
-                    extract_audio_wav(file_path, diar_wav)
+                speaker_segments = _diarize(file_path, num_speakers, progress_callback, wav_path)
 
+            if speaker_segments:
                 if progress_callback:
-                    progress_callback(60, "Running speaker diarization...")
-
-                speaker_segments = run_diarization(
-                    diar_wav,
-                    num_speakers=num_speakers,
-                    progress_callback=lambda pct, msg: (
-                        progress_callback(60 + int(pct * 0.3), msg) if progress_callback else None
-                    ),
-                )
+                    progress_callback(92, "Assigning speakers to transcript...")
 
-                if speaker_segments:
-                    if progress_callback:
-                        progress_callback(92, "Assigning speakers to transcript...")
+                segments = assign_speakers_to_segments(segments, speaker_segments)
+                words = assign_speakers_to_words(words, speaker_segments)
+                speaker_summary = create_speaker_summary(speaker_segments)
 
-                    segments = assign_speakers_to_segments(segments, speaker_segments)
-                    words = assign_speakers_to_words(words, speaker_segments)
-                    speaker_summary = create_speaker_summary(speaker_segments)
-
-                    if progress_callback:
-                        progress_callback(
-                            95,
-                            f"Found {speaker_summary['num_speakers']} speakers",
-                        )
-
-            finally:
-                if not shared_wav and os.path.exists(diar_wav):
-                    os.unlink(diar_wav)
+                if progress_callback:
+                    progress_callback(
+                        95,
+                        f"Found {speaker_summary['num_speakers']} speakers",
+                    )
 
         except ImportError as e:
             diarization_warning = f"Speaker detection unavailable: {e}"
@@ -455,12 +595,16 @@ def transcribe_file(
     num_speakers: Optional[int] = None,
     progress_callback: Optional[Callable[[int, str], None]] = None,
     wav_path: Optional[str] = None,
+    decode_options: Optional[dict] = None,
 ) -> dict:
     """
     Transcribe a video/audio file with word-level timestamps and speaker detection.
 
     wav_path: optional pre-extracted 16 kHz mono WAV shared across analysis
     stages — used by whisper.cpp and diarization instead of re-decoding.
+    decode_options: Whisper transcribe() kwargs layered over the single-pass
+    defaults (_FAST_DECODE), e.g. {"temperature": (0.0, 0.2, 0.4)} to bring
+    back fallback sampling for accuracy.
 
     Returns:
         {
@@ -479,6 +623,7 @@ def transcribe_file(
     requested = engine if engine is not None else os.environ.get("PODCLI_ENGINE", "")
     engine = normalize_engine(requested)
     use_cpp = engine == "whispercpp"
+    use_faster = engine == "faster-whisper"
     use_assemblyai = is_assemblyai_engine(engine)
 
     if use_assemblyai:
@@ -490,13 +635,11 @@ def transcribe_file(
     # Native installs ship whisper.cpp, not openai-whisper. Fall back to it
     # automatically — whether whisper is missing OR a broken install fails to
     # load/run — unless the user explicitly asked for the whisper-py engine.
-    if not use_cpp:
+    if not use_cpp and not use_faster:
         if progress_callback:
             progress_callback(5, "Loading Whisper model...")
         try:
-            import whisper
-
-            model = whisper.load_model(model_size)
+            model = _load_whisper_model(model_size)
         except Exception as e:
             if not requested and _whispercpp_ready(model_size):
                 use_cpp = True
@@ -517,18 +660,33 @@ def transcribe_file(
             file_path, base, False, num_speakers, progress_callback
         )
 
+    diarization_job = (
+        _start_diarization(file_path, num_speakers, wav_path) if enable_diarization else None
+    )
+
     # ================================================================
     # Step 1: Whisper transcription
     # ================================================================
-    if progress_callback:
-        progress_callback(10, f"Transcribing with Whisper ({model_size})...")
-
-    result = model.transcribe(
-        file_path,
-        language=language,
-        word_timestamps=True,
-        verbose=False,
-    )
+    try:
+        if use_faster:
+            result = _transcribe_with_faster_whisper(
+                file_path, model_size, language, progress_callback, decode_options
+            )
+        else:
+            if progress_callback:
+                progress_callback(10, f"Transcribing with Whisper ({model_size})...")
+
+            result = model.transcribe(
+                file_path,
+                language=language,
+                word_timestamps=True,
+                verbose=False,
+                **_decode_options("whisper-py", model_size, decode_options),
+            )
+    except BaseException:
+        if diarization_job is not None:
+            _abandon_diarization(diarization_job)
+        raise
 
     if progress_callback:
         progress_callback(50, "Processing timestamps...")
@@ -598,9 +756,9 @@ def transcribe_file(
         "words": words,
         "duration": duration,
         "language": detected_lang,
-        "engine": "whisper-py",
+        "engine": engine if use_faster else "whisper-py",
     }
     return _attach_speakers_and_faces(
         file_path, base, enable_diarization, num_speakers, progress_callback,
-        wav_path=wav_path,
+        wav_path=wav_path, diarization=diarization_job[0] if diarization_job else None,
     )
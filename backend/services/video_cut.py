@@ -7,10 +7,25 @@ caption rendering.
 
 from __future__ import annotations
 
-import os
+from services.encoder import get_audio_encode_flags
+from services.media_probe import FFMPEG_TIMEOUT, has_audio_stream
+from utils.proc import ffmpeg_threads, run as proc_run
 
-from services.media_probe import FFMPEG_TIMEOUT
-from utils.proc import run as proc_run
+
+def _cut_encode_flags() -> list[str]:
+    """Visually lossless intermediate encode, sharing cores during a render pool.
+
+    Audio gets the pipeline's standard AAC encode, so the crop passes after
+    the cut can copy it through instead of encoding it a second time.
+    """
+    flags = [
+        "-c:v", "libx264", "-crf", "16", "-preset", "fast", "-profile:v", "high",
+        *get_audio_encode_flags(),
+    ]
+    threads = ffmpeg_threads()
+    if threads:
+        flags += ["-threads", str(threads)]
+    return flags
 
 
 def cut_segment(
@@ -37,12 +52,11 @@ def cut_segment(
         "-ss", str(start_second),
         "-i", input_path,
         "-t", str(duration),
-        "-c:v", "libx264", "-crf", "16", "-preset", "fast", "-profile:v", "high",
-        "-c:a", "aac", "-b:a", "192k",
+        *_cut_encode_flags(),
         "-avoid_negative_ts", "make_zero",
         output_path,
     ]
-    result = proc_run(cmd, timeout=FFMPEG_TIMEOUT, check=False)
+    result = proc_run(cmd, timeout=FFMPEG_TIMEOUT, check=False, output=False)
     if result.returncode != 0:
         raise RuntimeError(f"FFmpeg cut failed: {result.stderr[-500:]}")
     return output_path
@@ -57,46 +71,96 @@ def cut_multi_segment(
 
     segments: [{"start": 10.5, "end": 25.0}, {"start": 30.2, "end": 45.0}]
 
-    Each segment is cut individually with frame-accurate encoding,
-    then concatenated with stream copy (matching codecs means no
-    re-encode needed).
+    One ffmpeg run does the whole job. The source is opened once, seeked with
+    `-ss` before `-i` (frame-accurate, as in cut_segment) to the first range
+    and read to the last; each range is then cut out with trim/atrim and the
+    concat filter joins them into a single encode. Tight filler-trimmed clips
+    have dozens of ranges, so this keeps to one demuxer and one decoder
+    instead of one per range, with no part files left behind.
     """
+    # Ranges play in source order; overlapping or touching ones are merged
+    # so no stretch of the source is shown twice.
+    merged: list[dict] = []
+    for seg in sorted(segments, key=lambda s: s["start"]):
+        if merged and seg["start"] <= merged[-1]["end"]:
+            merged[-1]["end"] = max(merged[-1]["end"], seg["end"])
+        else:
+            merged.append({"start": seg["start"], "end": seg["end"]})
+    segments = merged
+
     if len(segments) == 1:
         return cut_segment(
             input_path, output_path, segments[0]["start"], segments[0]["end"]
         )
 
-    work_dir = os.path.dirname(output_path) or "."
-    part_paths: list[str] = []
-    concat_file = os.path.join(work_dir, "_concat_parts.txt")
+    base = segments[0]["start"]
+    span = segments[-1]["end"] - base
+    with_audio = has_audio_stream(input_path)
+    n = len(segments)
+    graph = [f"[0:v]split={n}" + "".join(f"[v{i}]" for i in range(n))]
+    if with_audio:
+        graph.append(f"[0:a]asplit={n}" + "".join(f"[a{i}]" for i in range(n)))
+    pads = []
+    for i, seg in enumerate(segments):
+        start, end = seg["start"] - base, seg["end"] - base
+        graph.append(f"[v{i}]trim=start={start:.3f}:end={end:.3f},setpts=PTS-STARTPTS[cv{i}]")
+        pads.append(f"[cv{i}]")
+        if with_audio:
+            graph.append(f"[a{i}]atrim=start={start:.3f}:end={end:.3f},asetpts=PTS-STARTPTS[ca{i}]")
+            pads.append(f"[ca{i}]")
+    outs = ["[v]", "[a]"] if with_audio else ["[v]"]
+    graph.append(f"{''.join(pads)}concat=n={n}:v=1:a={int(with_audio)}{''.join(outs)}")
+    cmd = [
+        "ffmpeg", "-y",
+        "-ss", str(base),
+        "-t", str(span),
+        "-i", input_path,
+        "-filter_complex", ";".join(graph),
+    ]
+    for label in outs:
+        cmd += ["-map", label]
+    cmd += [
+        *_cut_encode_flags(),
+        "-movflags", "+faststart",
+        output_path,
+    ]
+    result = proc_run(cmd, timeout=FFMPEG_TIMEOUT, check=False, output=False)
+    if result.returncode != 0:
+        raise RuntimeError(f"FFmpeg concat failed: {result.stderr[-500:]}")
+    return output_path
 
-    try:
-        for i, seg in enumerate(segments):
-            part_path = os.path.join(work_dir, f"_part_{i}.mp4")
-            cut_segment(input_path, part_path, seg["start"], seg["end"])
-            part_paths.append(part_path)
 
-        with open(concat_file, "w", encoding="utf-8") as f:
-            for p in part_paths:
-                f.write(f"file '{os.path.abspath(p)}'\n")
+def copy_segments(
+    input_path: str,
+    cuts: list[tuple[str, float, float]],
+) -> list[str]:
+    """Stream-copy several ranges of one source in a single ffmpeg run.
+
+    cuts: [(output_path, start_second, end_second), ...]
 
-        cmd = [
-            "ffmpeg", "-y",
-            "-f", "concat", "-safe", "0",
-            "-i", concat_file,
+    Meant for raw previews only. As cut_segment explains, `-c copy` starts
+    each output at the keyframe at-or-before its start, so these files can
+    open up to a GOP early and are never fed to the caption pipeline. In
+    exchange nothing is decoded or encoded, and ffmpeg starts once for the
+    whole batch instead of once per clip.
+    """
+    if not cuts:
+        return []
+
+    cmd = ["ffmpeg", "-y"]
+    for _, start, end in cuts:
+        cmd += ["-ss", str(start), "-t", str(end - start), "-i", input_path]
+    for idx, (output_path, _, _) in enumerate(cuts):
+        cmd += [
+            # Video and audio only: data, subtitle and attachment streams
+            # (timecode tracks, cover art) often can't be muxed into MP4.
+            "-map", f"{idx}:v", "-map", f"{idx}:a?",
             "-c", "copy",
+            "-avoid_negative_ts", "make_zero",
             "-movflags", "+faststart",
             output_path,
         ]
-        result = proc_run(cmd, timeout=FFMPEG_TIMEOUT, check=False)
-        if result.returncode != 0:
-            raise RuntimeError(f"FFmpeg concat failed: {result.stderr[-500:]}")
-
-        return output_path
-
-    finally:
-        for p in part_paths:
-            if os.path.exists(p):
-                os.remove(p)
-        if os.path.exists(concat_file):
-            os.remove(concat_file)
+    result = proc_run(cmd, timeout=FFMPEG_TIMEOUT, check=False, output=False)
+    if result.returncode != 0:
+        raise RuntimeError(f"FFmpeg copy failed: {result.stderr[-500:]}")
+    return [output_path for output_path, _, _ in cuts]
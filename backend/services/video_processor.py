@@ -6,12 +6,14 @@ audio normalization, and final encoding.
 """
 
 import os
+import queue
 import subprocess
 import json
 import math
+import threading
 from typing import Optional
 
-from services.encoder import get_video_encode_flags
+from services.encoder import get_audio_encode_flags, get_video_encode_flags
 from utils.proc import run as proc_run, ProcError
 from utils.log import log_event
 from services import media_probe
@@ -75,6 +77,137 @@ def _manual_crop_x_expr(keyframes: list, crop_w: int, width: int) -> str:
     return expr
 
 
+def _manual_crop_vf(keyframes: list, width: int, height: int, target_w: int, target_h: int) -> str:
+    crop_h = height
+    crop_w = min(int(crop_h * (target_w / target_h)), width)
+    crop_y = max(0, (height - crop_h) // 2)
+    x_expr = _manual_crop_x_expr(keyframes, crop_w, width)
+    return f"crop={crop_w}:{crop_h}:x='{x_expr}':y={crop_y},scale={target_w}:{target_h}"
+
+
+def _blur_background_graph(target_w: int, target_h: int, out: str) -> str:
+    """Scales source to fill the target height → blur → overlay sharp fit-to-width."""
+    return (
+        f"[0:v]split[bg][fg];"
+        f"[bg]scale=-2:{target_h},crop={target_w}:{target_h}:(iw-{target_w})/2:0,"
+        f"boxblur=25:3[bbg];"
+        f"[fg]scale={target_w}:-2[sfg];"
+        f"[bbg][sfg]overlay=0:(H-h)/2[{out}]"
+    )
+
+
+def _center_crop_vf(width: int, height: int, target_w: int, target_h: int) -> str:
+    crop_w = width
+    crop_h = int(crop_w / (target_w / target_h))
+    if crop_h > height:
+        return f"scale={target_w}:-2,pad={target_w}:{target_h}:(ow-iw)/2:(oh-ih)/2:black"
+    crop_y = (height - crop_h) // 2
+    return f"crop={crop_w}:{crop_h}:0:{crop_y},scale={target_w}:{target_h}"
+
+
+def _fit_frame_vf(target_w: int, target_h: int) -> str:
+    return (
+        f"scale={target_w}:{target_h}:force_original_aspect_ratio=decrease,"
+        f"pad={target_w}:{target_h}:(ow-iw)/2:(oh-ih)/2:black,setsar=1"
+    )
+
+
+def _mux_flags(faststart: bool) -> list[str]:
+    return ["-movflags", "+faststart"] if faststart else []
+
+
+def _crop_audio_flags(input_path: str) -> list[str]:
+    """Audio flags for a crop pass over a whole clip.
+
+    The cut segment is already AAC, and re-encoding it to AAC again only
+    costs time and a generation of quality, so audio that already is what
+    the crop would produce (AAC at 44.1 kHz) is copied through.
+    """
+    try:
+        streams = get_video_info(input_path).get("streams", [])
+    except Exception:
+        return get_audio_encode_flags()
+    audio = next((s for s in streams if s.get("codec_type") == "audio"), None)
+    if audio and audio.get("codec_name") == "aac" and str(audio.get("sample_rate")) == "44100":
+        return ["-c:a", "copy"]
+    return get_audio_encode_flags()
+
+
+def _hardcut_face_map_vf(
+    face_map: dict,
+    transcript_words: list,
+    clip_start: float,
+    width: int,
+    height: int,
+    target_w: int,
+    target_h: int,
+) -> Optional[str]:
+    """speaker-hardcut's crop, snapping between the face_map positions of
+    whoever is talking; None when the face_map can't place this clip."""
+    target_ratio = target_w / target_h
+    crop_h = height
+    crop_y = max(0, (height - crop_h) // 2)
+    x_expr = _use_face_map(
+        face_map=face_map,
+        transcript_words=transcript_words,
+        clip_start=clip_start,
+        width=width,
+        height=height,
+        target_ratio=target_ratio,
+        crop_h=crop_h,
+        hard_cut=True,
+    )
+    if not x_expr:
+        return None
+    crop_w = min(int(crop_h * target_ratio), width)
+    return f"crop={crop_w}:{crop_h}:{x_expr}:{crop_y},scale={target_w}:{target_h}"
+
+
+def frame_filter_graph(
+    input_path: str,
+    strategy: str = "face",
+    crop_keyframes: list = None,
+    target_dims: tuple = (1080, 1920),
+    reframe: bool = True,
+    out: str = "base",
+    face_map: dict = None,
+    transcript_words: list = None,
+    clip_start: float = 0,
+) -> Optional[str]:
+    """The crop_to_vertical / fit_to_frame filter as a graph from [0:v] to
+    [out], for the choices that need no look at the frames: manual keyframes,
+    center, letterboxing, and speaker-hardcut when the precomputed face_map
+    places the clip. Returns None for the rest, which must render through
+    crop_to_vertical.
+
+    Lets a later pass that re-encodes anyway (the caption burn) apply the crop
+    itself, saving the cropped intermediate's decode + encode.
+    """
+    target_w, target_h = target_dims
+    if not reframe:
+        log_event("crop", "chose=fit-letterbox", target=f"{target_w}x{target_h}", fused=1)
+        return f"[0:v]{_fit_frame_vf(target_w, target_h)}[{out}]"
+
+    width, height = get_dimensions(input_path)
+    if strategy == "manual" and crop_keyframes:
+        log_event("crop", "chose=manual", keyframes=len(crop_keyframes), source=f"{width}x{height}", fused=1)
+        return f"[0:v]{_manual_crop_vf(crop_keyframes, width, height, target_w, target_h)}[{out}]"
+    if strategy == "center":
+        if width / height > target_w / target_h:
+            log_event("crop", "chose=center-blur-bg", source=f"{width}x{height}", fused=1)
+            return _blur_background_graph(target_w, target_h, out)
+        log_event("crop", "chose=center", source=f"{width}x{height}", fused=1)
+        return f"[0:v]{_center_crop_vf(width, height, target_w, target_h)}[{out}]"
+    if strategy == "speaker-hardcut" and face_map:
+        vf = _hardcut_face_map_vf(
+            face_map, transcript_words, clip_start, width, height, target_w, target_h,
+        )
+        if vf:
+            log_event("crop", "chose=speaker-hardcut", source=f"{width}x{height}", fused=1)
+            return f"[0:v]{vf}[{out}]"
+    return None
+
+
 def crop_to_vertical(
     input_path: str,
     output_path: str,
@@ -84,6 +217,7 @@ def crop_to_vertical(
     face_map: dict = None,
     crop_keyframes: list = None,
     target_dims: tuple = (1080, 1920),
+    faststart: bool = True,
 ) -> str:
     """
     Crop/scale video to 1080x1920 (9:16 vertical).
@@ -99,6 +233,9 @@ def crop_to_vertical(
     transcript_words: Word dicts with 'speaker', 'start', 'end' keys (from Whisper+pyannote).
                       Used by 'face' strategy when speaker data is available.
     clip_start: The start time of this clip in the original video (for timestamp alignment).
+    faststart: Move the moov atom to the front of the output. Only worth its
+               extra rewrite of the file when the output is what gets played;
+               a later pass reads an intermediate just as well either way.
     """
     width, height = get_dimensions(input_path)
     target_w, target_h = target_dims
@@ -108,36 +245,20 @@ def crop_to_vertical(
 
     if strategy == "manual" and crop_keyframes:
         log_event("crop", "chose=manual", keyframes=len(crop_keyframes), source=f"{width}x{height}")
-        crop_h = height
-        crop_w = min(int(crop_h * target_ratio), width)
-        crop_y = max(0, (height - crop_h) // 2)
-        x_expr = _manual_crop_x_expr(crop_keyframes, crop_w, width)
-        vf = f"crop={crop_w}:{crop_h}:x='{x_expr}':y={crop_y},scale={target_w}:{target_h}"
+        vf = _manual_crop_vf(crop_keyframes, width, height, target_w, target_h)
         return _run_ffmpeg_with_fallback(
             cmd_parts_before_enc=["ffmpeg", "-y", "-i", input_path, "-vf", vf],
-            cmd_parts_after_enc=["-c:a", "aac", "-b:a", "192k", "-ar", "44100", "-movflags", "+faststart"],
+            cmd_parts_after_enc=[*_crop_audio_flags(input_path), *_mux_flags(faststart)],
             output_path=output_path,
             label="crop_manual",
         )
 
     if strategy == "speaker-hardcut" and face_map:
-        crop_h = height
-        crop_y = max(0, (height - crop_h) // 2)
-        x_expr = _use_face_map(
-            face_map=face_map,
-            transcript_words=transcript_words,
-            clip_start=clip_start,
-            width=width,
-            height=height,
-            target_ratio=target_ratio,
-            crop_h=crop_h,
-            hard_cut=True,
+        vf = _hardcut_face_map_vf(
+            face_map, transcript_words, clip_start, width, height, target_w, target_h,
         )
-        if x_expr:
+        if vf:
             log_event("crop", "chose=speaker-hardcut", source=f"{width}x{height}")
-            crop_w = int(crop_h * target_ratio)
-            crop_w = min(crop_w, width)
-            vf = f"crop={crop_w}:{crop_h}:{x_expr}:{crop_y},scale={target_w}:{target_h}"
             return _run_ffmpeg_with_fallback(
                 cmd_parts_before_enc=[
                     "ffmpeg", "-y",
@@ -145,10 +266,8 @@ def crop_to_vertical(
                     "-vf", vf,
                 ],
                 cmd_parts_after_enc=[
-                    "-c:a", "aac",
-                    "-b:a", "192k",
-                    "-ar", "44100",
-                    "-movflags", "+faststart",
+                    *_crop_audio_flags(input_path),
+                    *_mux_flags(faststart),
                 ],
                 output_path=output_path,
                 label="crop_speaker_hardcut",
@@ -187,10 +306,8 @@ def crop_to_vertical(
                         "-vf", vf,
                     ],
                     cmd_parts_after_enc=[
-                        "-c:a", "aac",
-                        "-b:a", "192k",
-                        "-ar", "44100",
-                        "-movflags", "+faststart",
+                        *_crop_audio_flags(input_path),
+                        *_mux_flags(faststart),
                     ],
                     output_path=output_path,
                     label="crop_local_reframe",
@@ -209,6 +326,7 @@ def crop_to_vertical(
                 width, height, target_w, target_h,
                 transcript_words, clip_start,
                 face_map=face_map,
+                faststart=faststart,
             )
             if result:
                 log_event("crop", "chose=speaker-track", speakers=len(speakers_in_clip))
@@ -239,10 +357,8 @@ def crop_to_vertical(
                         "-vf", vf,
                     ],
                     cmd_parts_after_enc=[
-                        "-c:a", "aac",
-                        "-b:a", "192k",
-                        "-ar", "44100",
-                        "-movflags", "+faststart",
+                        *_crop_audio_flags(input_path),
+                        *_mux_flags(faststart),
                     ],
                     output_path=output_path,
                     label="crop_face_map",
@@ -253,6 +369,7 @@ def crop_to_vertical(
             width, height, target_w, target_h,
             transcript_words, clip_start,
             face_map=face_map,
+            faststart=faststart,
         )
         if result:
             log_event("crop", "chose=face-track")
@@ -264,14 +381,7 @@ def crop_to_vertical(
         if source_ratio > target_ratio:
             log_event("crop", "chose=center-blur-bg", source=f"{width}x{height}")
             # Wide source with no face detected: blurred background + sharp center.
-            # Scales source to fill 9:16 height → blur → overlay sharp fit-to-width.
-            vf_complex = (
-                f"split[bg][fg];"
-                f"[bg]scale=-2:{target_h},crop={target_w}:{target_h}:(iw-{target_w})/2:0,"
-                f"boxblur=25:3[bbg];"
-                f"[fg]scale={target_w}:-2[sfg];"
-                f"[bbg][sfg]overlay=0:(H-h)/2[v]"
-            )
+            vf_complex = _blur_background_graph(target_w, target_h, "v")
             return _run_ffmpeg_with_fallback(
                 cmd_parts_before_enc=[
                     "ffmpeg", "-y",
@@ -280,23 +390,15 @@ def crop_to_vertical(
                     "-map", "[v]", "-map", "0:a?",
                 ],
                 cmd_parts_after_enc=[
-                    "-c:a", "aac",
-                    "-b:a", "192k",
-                    "-ar", "44100",
-                    "-movflags", "+faststart",
+                    *_crop_audio_flags(input_path),
+                    *_mux_flags(faststart),
                 ],
                 output_path=output_path,
                 label="crop_blur_bg",
             )
         else:
             log_event("crop", "chose=center", source=f"{width}x{height}")
-            crop_w = width
-            crop_h = int(crop_w / target_ratio)
-            if crop_h > height:
-                vf = f"scale={target_w}:-2,pad={target_w}:{target_h}:(ow-iw)/2:(oh-ih)/2:black"
-            else:
-                crop_y = (height - crop_h) // 2
-                vf = f"crop={crop_w}:{crop_h}:0:{crop_y},scale={target_w}:{target_h}"
+            vf = _center_crop_vf(width, height, target_w, target_h)
 
     return _run_ffmpeg_with_fallback(
         cmd_parts_before_enc=[
@@ -305,10 +407,8 @@ def crop_to_vertical(
             "-vf", vf,
         ],
         cmd_parts_after_enc=[
-            "-c:a", "aac",
-            "-b:a", "192k",
-            "-ar", "44100",
-            "-movflags", "+faststart",
+            *_crop_audio_flags(input_path),
+            *_mux_flags(faststart),
         ],
         output_path=output_path,
         label="crop",
@@ -319,6 +419,7 @@ def fit_to_frame(
     input_path: str,
     output_path: str,
     target_dims: tuple = (1920, 1080),
+    faststart: bool = True,
 ) -> str:
     """Scale to fit target_dims and letterbox with black bars, preserving the
     whole frame. Used for non-reframe formats (e.g. 16:9) where cropping to a
@@ -327,17 +428,12 @@ def fit_to_frame(
     """
     target_w, target_h = target_dims
     log_event("crop", "chose=fit-letterbox", target=f"{target_w}x{target_h}")
-    vf = (
-        f"scale={target_w}:{target_h}:force_original_aspect_ratio=decrease,"
-        f"pad={target_w}:{target_h}:(ow-iw)/2:(oh-ih)/2:black,setsar=1"
-    )
+    vf = _fit_frame_vf(target_w, target_h)
     return _run_ffmpeg_with_fallback(
         cmd_parts_before_enc=["ffmpeg", "-y", "-i", input_path, "-vf", vf],
         cmd_parts_after_enc=[
-            "-c:a", "aac",
-            "-b:a", "192k",
-            "-ar", "44100",
-            "-movflags", "+faststart",
+            *_crop_audio_flags(input_path),
+            *_mux_flags(faststart),
         ],
         output_path=output_path,
         label="fit_frame",
@@ -980,6 +1076,74 @@ def _face_sample_indices(total_frames: int, fps: float) -> list[int]:
     return indices
 
 
+def _frames_at_times(cap, times: list[float], fps: float):
+    """Yield (t, frame) for ascending `times` from one sequential decode.
+
+    grab() steps over the frames in between and retrieve() converts only the
+    sampled ones; a cap.set() seek per sample re-decodes from the previous
+    keyframe every time, which at several samples a second decodes each
+    GOP over and over.
+    """
+    frame_idx = -1
+    for t in times:
+        target = int(t * fps + 0.5)  # nearest frame, as a POS_MSEC seek lands
+        while frame_idx < target:
+            if not cap.grab():
+                return
+            frame_idx += 1
+        ret, frame = cap.retrieve()
+        if ret:
+            yield t, frame
+
+
+_PREFETCH_DONE = object()
+
+
+def _prefetch(items, depth: int = 8):
+    """Yield from `items` while a background thread produces the next ones.
+
+    For frame decoding feeding face detection: VideoCapture and the DNN both
+    release the GIL, so decoding the next frames overlaps detection on this
+    one. At most `depth` items wait in the queue. The producer is stopped
+    and joined before this returns, so the capture can be released safely.
+    """
+    q = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    failure = []
+
+    def _put(item) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce():
+        try:
+            for item in items:
+                if not _put(item):
+                    return
+        except Exception as exc:  # surfaced in the consumer
+            failure.append(exc)
+        _put(_PREFETCH_DONE)
+
+    worker = threading.Thread(target=_produce, name="podcli-prefetch", daemon=True)
+    worker.start()
+    try:
+        while True:
+            item = q.get()
+            if item is _PREFETCH_DONE:
+                break
+            yield item
+    finally:
+        stop.set()
+        worker.join()
+    if failure:
+        raise failure[0]
+
+
 def _track_and_crop(
     input_path: str,
     output_path: str,
@@ -990,6 +1154,7 @@ def _track_and_crop(
     transcript_words: list = None,
     clip_start: float = 0,
     face_map: dict = None,
+    faststart: bool = True,
 ) -> Optional[str]:
     """
     Adaptive face tracking with sticky visual tracks and heavy-tripod movement.
@@ -1229,8 +1394,8 @@ def _track_and_crop(
                 return _run_ffmpeg_with_fallback(
                     cmd_parts_before_enc=["ffmpeg", "-y", "-i", input_path, "-vf", vf],
                     cmd_parts_after_enc=[
-                        "-c:a", "aac", "-b:a", "192k", "-ar", "44100",
-                        "-movflags", "+faststart",
+                        *_crop_audio_flags(input_path),
+                        *_mux_flags(faststart),
                     ],
                     output_path=output_path, label="crop_mixed_static",
                 )
@@ -1260,11 +1425,11 @@ def _track_and_crop(
                         "-i", input_path,
                         "-vf", seg_vf,
                         "-c:v", "libx264", "-crf", "18", "-preset", "fast",
-                        "-c:a", "aac", "-b:a", "192k",
+                        *get_audio_encode_flags(),
                         "-avoid_negative_ts", "make_zero",
                         part_path,
                     ]
-                    r = proc_run(cmd, timeout=_FFMPEG_TIMEOUT, check=False)
+                    r = proc_run(cmd, timeout=_FFMPEG_TIMEOUT, check=False, output=False)
                     if r.returncode != 0:
                         continue
                     part_paths.append(part_path)
@@ -1276,7 +1441,7 @@ def _track_and_crop(
                     vf = f"crop={crop_w}:{crop_h}:{crop_x}:{crop_y},scale={target_w}:{target_h}"
                     return _run_ffmpeg_with_fallback(
                         cmd_parts_before_enc=["ffmpeg", "-y", "-i", input_path, "-vf", vf],
-                        cmd_parts_after_enc=["-c:a", "aac", "-b:a", "192k", "-ar", "44100", "-movflags", "+faststart"],
+                        cmd_parts_after_enc=[*get_audio_encode_flags(), *_mux_flags(faststart)],
                         output_path=output_path, label="crop_mixed_fallback",
                     )
 
@@ -1292,11 +1457,11 @@ def _track_and_crop(
                         f"[0:a][1:a]acrossfade=d={xfade_dur}[a]",
                         "-map", "[v]", "-map", "[a]",
                         "-c:v", "libx264", "-crf", "18", "-preset", "fast",
-                        "-c:a", "aac", "-b:a", "192k",
-                        "-movflags", "+faststart",
+                        *get_audio_encode_flags(),
+                        *_mux_flags(faststart),
                         output_path,
                     ]
-                    r = proc_run(cmd, timeout=_FFMPEG_TIMEOUT, check=False)
+                    r = proc_run(cmd, timeout=_FFMPEG_TIMEOUT, check=False, output=False)
                     if r.returncode == 0:
                         return output_path
                 else:
@@ -1331,11 +1496,11 @@ def _track_and_crop(
                         "-filter_complex", filter_complex,
                         "-map", "[v]", "-map", "[a]",
                         "-c:v", "libx264", "-crf", "18", "-preset", "fast",
-                        "-c:a", "aac", "-b:a", "192k",
-                        "-movflags", "+faststart",
+                        *get_audio_encode_flags(),
+                        *_mux_flags(faststart),
                         output_path,
                     ]
-                    r = proc_run(cmd, timeout=_FFMPEG_TIMEOUT, check=False)
+                    r = proc_run(cmd, timeout=_FFMPEG_TIMEOUT, check=False, output=False)
                     if r.returncode == 0:
                         return output_path
 
@@ -1345,7 +1510,7 @@ def _track_and_crop(
                 vf = f"crop={crop_w}:{crop_h}:{crop_x}:{crop_y},scale={target_w}:{target_h}"
                 return _run_ffmpeg_with_fallback(
                     cmd_parts_before_enc=["ffmpeg", "-y", "-i", input_path, "-vf", vf],
-                    cmd_parts_after_enc=["-c:a", "aac", "-b:a", "192k", "-ar", "44100", "-movflags", "+faststart"],
+                    cmd_parts_after_enc=[*get_audio_encode_flags(), *_mux_flags(faststart)],
                     output_path=output_path, label="crop_mixed_xfade_fallback",
                 )
             finally:
@@ -1554,8 +1719,8 @@ def _track_and_crop(
     return _run_ffmpeg_with_fallback(
         cmd_parts_before_enc=["ffmpeg", "-y", "-i", input_path, "-vf", vf],
         cmd_parts_after_enc=[
-            "-c:a", "aac", "-b:a", "192k", "-ar", "44100",
-            "-movflags", "+faststart",
+            *_crop_audio_flags(input_path),
+            *_mux_flags(faststart),
         ],
         output_path=output_path, label="crop_track",
     )
@@ -1710,7 +1875,7 @@ def _crop_split_screen(
                 vf = f"crop={right_w}:{right_h}:{right_crop_x}:{right_crop_y},scale={target_w}:{target_h}"
             return _run_ffmpeg_with_fallback(
                 cmd_parts_before_enc=["ffmpeg", "-y", "-i", input_path, "-vf", vf],
-                cmd_parts_after_enc=["-c:a", "aac", "-b:a", "192k", "-ar", "44100", "-movflags", "+faststart"],
+                cmd_parts_after_enc=[*_crop_audio_flags(input_path), "-movflags", "+faststart"],
                 output_path=output_path, label="crop_split",
             )
 
@@ -1817,11 +1982,11 @@ def _crop_split_screen(
                     "-i", input_path,
                     "-vf", vf,
                     "-c:v", "libx264", "-crf", "18", "-preset", "fast",
-                    "-c:a", "aac", "-b:a", "192k",
+                    *get_audio_encode_flags(),
                     "-avoid_negative_ts", "make_zero",
                     part_path,
                 ]
-                r = proc_run(cmd, timeout=_FFMPEG_TIMEOUT, check=False)
+                r = proc_run(cmd, timeout=_FFMPEG_TIMEOUT, check=False, output=False)
                 if r.returncode != 0:
                     print(f"Warning: split-screen segment {i} failed: {r.stderr[-200:]}", file=sys.stderr)
                     continue
@@ -1844,7 +2009,7 @@ def _crop_split_screen(
                 "-movflags", "+faststart",
                 output_path,
             ]
-            r = proc_run(cmd, timeout=_FFMPEG_TIMEOUT, check=False)
+            r = proc_run(cmd, timeout=_FFMPEG_TIMEOUT, check=False, output=False)
             if r.returncode != 0:
                 return None
 
@@ -2072,13 +2237,8 @@ def _build_speaker_aware_crop(
         # Each face: (cx, cy, fw, conf)
         frame_data = []
 
-        for i in range(sample_count):
-            t = i * duration / sample_count
-            cap.set(cv2.CAP_PROP_POS_MSEC, t * 1000)
-            ret, frame = cap.read()
-            if not ret:
-                continue
-
+        sample_times = [i * duration / sample_count for i in range(sample_count)]
+        for t, frame in _prefetch(_frames_at_times(cap, sample_times, fps)):
             faces_raw = detect_faces(detector, frame, width, height)
 
             faces = []
@@ -2541,7 +2701,7 @@ def scale_to_frame(input_path: str, output_path: str, width: int, height: int) -
                    f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2:black",
         ],
         cmd_parts_after_enc=[
-            "-c:a", "aac", "-b:a", "192k", "-ar", "44100",
+            *get_audio_encode_flags(),
             "-movflags", "+faststart",
         ],
         output_path=output_path,
@@ -2550,6 +2710,48 @@ def scale_to_frame(input_path: str, output_path: str, width: int, height: int) -
     return output_path
 
 
+_COPY_CONCAT_KEYS = {
+    "video": ("codec_name", "profile", "width", "height", "pix_fmt",
+              "sample_aspect_ratio", "r_frame_rate", "time_base"),
+    "audio": ("codec_name", "sample_rate", "channels", "time_base"),
+}
+
+
+def _frame_rate(video_path: str, default: str = "30") -> str:
+    """The first video stream's frame rate as ffprobe reports it ("30000/1001"),
+    ready to drop into an fps= filter."""
+    try:
+        for stream in get_video_info(video_path).get("streams", []):
+            if stream.get("codec_type") != "video":
+                continue
+            for key in ("avg_frame_rate", "r_frame_rate"):
+                rate = str(stream.get(key) or "")
+                num, _, den = rate.partition("/")
+                if num.isdigit() and int(num) > 0 and (not den or (den.isdigit() and int(den) > 0)):
+                    return rate
+            break
+    except Exception:
+        pass
+    return default
+
+
+def _can_concat_copy(first_path: str, second_path: str) -> bool:
+    """True when both files carry the same stream layout and parameters, so
+    the concat demuxer can join them with `-c copy` and no re-encode."""
+    def signature(path: str) -> list:
+        streams = get_video_info(path).get("streams", [])
+        return [
+            (s["codec_type"], tuple(s.get(k) for k in _COPY_CONCAT_KEYS[s["codec_type"]]))
+            for s in streams if s.get("codec_type") in _COPY_CONCAT_KEYS
+        ]
+
+    try:
+        first = signature(first_path)
+        return bool(first) and first == signature(second_path)
+    except Exception:
+        return False
+
+
 def concat_outro(
     input_path: str,
     outro_path: str,
@@ -2571,24 +2773,42 @@ def concat_outro(
     else:
         safe_crossfade = _parse_duration_seconds(crossfade_duration) or 0.5
 
-    # Re-encode outro to match dimensions
-    outro_scaled = output_path + ".outro_scaled.mp4"
-    _run_ffmpeg_with_fallback(
-        cmd_parts_before_enc=[
-            "ffmpeg", "-y",
-            "-i", outro_path,
-            "-vf", f"scale={width}:{height}:force_original_aspect_ratio=decrease,"
-                   f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2:black",
-        ],
-        cmd_parts_after_enc=[
-            "-c:a", "aac", "-b:a", "192k", "-ar", "44100",
-            "-movflags", "+faststart",
-        ],
-        output_path=outro_scaled,
-        label="outro_scale",
+    # A hard cut onto an outro encoded like the clip (generated cards and
+    # clips rendered by this pipeline usually are) needs no encode at all.
+    if safe_crossfade == 0 and _can_concat_copy(input_path, outro_path):
+        concat_list = output_path + ".concat.txt"
+        try:
+            with open(concat_list, "w", encoding="utf-8") as f:
+                f.write(f"file '{os.path.abspath(input_path)}'\n")
+                f.write(f"file '{os.path.abspath(outro_path)}'\n")
+            result = proc_run([
+                "ffmpeg", "-y",
+                "-f", "concat", "-safe", "0",
+                "-i", concat_list,
+                "-c", "copy",
+                "-movflags", "+faststart",
+                output_path,
+            ], timeout=_FFMPEG_TIMEOUT, check=False, output=False)
+        finally:
+            if os.path.exists(concat_list):
+                os.remove(concat_list)
+        if result.returncode == 0:
+            return output_path
+        log_event("outro", "fallback", reason="concat_copy_failed")
+
+    # The outro is fitted to the main clip's frame inside each graph below,
+    # so every attempt is one decode + one encode with no intermediate file.
+    # xfade and concat both refuse inputs whose frame rate or timebase differ,
+    # so both sides are pinned to the clip's rate on the default timebase.
+    fps = _frame_rate(input_path)
+    frames = (
+        f"[0:v]fps={fps},settb=AVTB,setsar=1[m];"
+        f"[1:v]scale={width}:{height}:force_original_aspect_ratio=decrease,"
+        f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2:black,"
+        f"fps={fps},settb=AVTB,setsar=1[o]"
     )
 
-    outro_duration = _get_media_duration_seconds(outro_scaled, default=0.0)
+    outro_duration = _get_media_duration_seconds(outro_path, default=0.0)
     safe_crossfade = min(safe_crossfade, max(0.05, main_duration - 0.05))
     if outro_duration > 0:
         safe_crossfade = min(safe_crossfade, max(0.05, outro_duration - 0.05))
@@ -2606,13 +2826,15 @@ def concat_outro(
         for audio_filter in [
             # Option 1: video transition + audio crossfade.
             (
-                f"[0:v][1:v]xfade=transition={transition}:duration={safe_crossfade}:offset={fade_offset}[v];"
+                f"{frames};"
+                f"[m][o]xfade=transition={transition}:duration={safe_crossfade}:offset={fade_offset}[v];"
                 f"[0:a]{_AFMT}[a0];[1:a]{_AFMT}[a1];"
                 f"[a0][a1]acrossfade=d={safe_crossfade}[a]"
             ),
             # Option 2: video transition + hard audio concat fallback.
             (
-                f"[0:v][1:v]xfade=transition={transition}:duration={safe_crossfade}:offset={fade_offset}[v];"
+                f"{frames};"
+                f"[m][o]xfade=transition={transition}:duration={safe_crossfade}:offset={fade_offset}[v];"
                 f"[0:a]{_AFMT}[a0];[1:a]{_AFMT}[a1];"
                 f"[a0][a1]concat=n=2:v=0:a=1[a]"
             ),
@@ -2621,24 +2843,25 @@ def concat_outro(
                 xfade_cmd = [
                     "ffmpeg", "-y",
                     "-i", input_path,
-                    "-i", outro_scaled,
+                    "-i", outro_path,
                     "-filter_complex", audio_filter,
                     "-map", "[v]", "-map", "[a]",
                 ]
                 xfade_cmd += get_video_encode_flags()
                 xfade_cmd += [
-                    "-c:a", "aac", "-b:a", "192k",
+                    *get_audio_encode_flags(),
                     "-movflags", "+faststart",
                     output_path,
                 ]
-                result = proc_run(xfade_cmd, timeout=_FFMPEG_TIMEOUT, check=False)
+                result = proc_run(xfade_cmd, timeout=_FFMPEG_TIMEOUT, check=False, output=False)
                 if result.returncode == 0:
-                    if os.path.exists(outro_scaled):
-                        os.remove(outro_scaled)
                     return output_path
             except Exception:
                 continue
 
+    main_has_audio = _has_audio_stream(input_path)
+    outro_has_audio = _has_audio_stream(outro_path)
+
     # Fallback 1: hard video cut + softened audio boundary
     # (keeps playback natural even when xfade is unavailable/fails).
     #
@@ -2647,28 +2870,28 @@ def concat_outro(
     # ffmpeg fails with rc=234 ("at least one of its streams received
     # no packets"), which the old code silently swallowed and then
     # cascaded into the pure-concat fallback.
-    if _has_audio_stream(input_path) and _has_audio_stream(outro_scaled):
+    if main_has_audio and outro_has_audio:
         audio_fade = min(safe_crossfade, max(0.05, max(0.1, main_duration) - 0.05))
         audio_fade_start = max(0.0, main_duration - audio_fade)
-        AFMT = "aformat=sample_fmts=fltp:sample_rates=44100:channel_layouts=stereo"
         try:
             return _run_ffmpeg_with_fallback(
                 cmd_parts_before_enc=[
                     "ffmpeg", "-y",
                     "-i", input_path,
-                    "-i", outro_scaled,
+                    "-i", outro_path,
                     "-filter_complex",
                     (
-                        "[0:v][1:v]concat=n=2:v=1:a=0[v];"
-                        f"[0:a]{AFMT},afade=t=out:st={audio_fade_start}:d={audio_fade}[a0];"
-                        f"[1:a]{AFMT},afade=t=in:st=0:d={audio_fade}[a1];"
+                        f"{frames};"
+                        "[m][o]concat=n=2:v=1:a=0[v];"
+                        f"[0:a]{_AFMT},afade=t=out:st={audio_fade_start}:d={audio_fade}[a0];"
+                        f"[1:a]{_AFMT},afade=t=in:st=0:d={audio_fade}[a1];"
                         "[a0][a1]concat=n=2:v=0:a=1[a]"
                     ),
                     "-map", "[v]",
                     "-map", "[a]",
                 ],
                 cmd_parts_after_enc=[
-                    "-c:a", "aac", "-b:a", "192k", "-ar", "44100",
+                    *get_audio_encode_flags(),
                     "-movflags", "+faststart",
                 ],
                 output_path=output_path,
@@ -2677,46 +2900,50 @@ def concat_outro(
         except Exception:
             pass
 
-    # Fallback 2: pure hard cut concat
-    main_reenc = output_path + ".main_reenc.mp4"
-    concat_list = os.path.join(os.path.dirname(output_path), "concat_list.txt")
+    # Fallback 2: pure hard cut, concatenated in the same filter graph.
+    # A side without audio contributes silence for its length so the
+    # joined track still lines up with the video.
+    inputs = ["-i", input_path, "-i", outro_path]
+    if main_has_audio or outro_has_audio:
+        audio_parts = []
+        next_idx = 2
+        for idx, has_audio, duration in (
+            (0, main_has_audio, main_duration),
+            (1, outro_has_audio, outro_duration),
+        ):
+            src = idx
+            if not has_audio:
+                src, next_idx = next_idx, next_idx + 1
+                inputs += ["-f", "lavfi", "-t", f"{max(duration, 0.05):.3f}",
+                           "-i", "anullsrc=r=44100:cl=stereo"]
+            audio_parts.append(f"[{src}:a]{_AFMT}[a{idx}]")
+        graph = ";".join([
+            frames,
+            *audio_parts,
+            "[m][a0][o][a1]concat=n=2:v=1:a=1[v][a]",
+        ])
+        maps = ["-map", "[v]", "-map", "[a]"]
+        audio_flags = get_audio_encode_flags()
+    else:
+        graph = f"{frames};[m][o]concat=n=2:v=1:a=0[v]"
+        maps = ["-map", "[v]"]
+        audio_flags = []
 
-    _run_ffmpeg_with_fallback(
+    return _run_ffmpeg_with_fallback(
         cmd_parts_before_enc=[
             "ffmpeg", "-y",
-            "-i", input_path,
-            "-vf", f"scale={width}:{height}",
+            *inputs,
+            "-filter_complex", graph,
+            *maps,
         ],
         cmd_parts_after_enc=[
-            "-c:a", "aac", "-b:a", "192k", "-ar", "44100",
+            *audio_flags,
             "-movflags", "+faststart",
         ],
-        output_path=main_reenc,
-        label="main_reenc",
+        output_path=output_path,
+        label="outro_concat",
     )
 
-    try:
-        with open(concat_list, "w", encoding="utf-8") as f:
-            f.write(f"file '{main_reenc}'\n")
-            f.write(f"file '{outro_scaled}'\n")
-
-        cmd = [
-            "ffmpeg", "-y",
-            "-f", "concat", "-safe", "0",
-            "-i", concat_list,
-            "-c", "copy",
-            "-movflags", "+faststart",
-            output_path,
-        ]
-        result = proc_run(cmd, timeout=_FFMPEG_TIMEOUT, check=False)
-        if result.returncode != 0:
-            raise RuntimeError(f"FFmpeg concat failed: {result.stderr[-500:]}")
-        return output_path
-    finally:
-        for tmp in [concat_list, outro_scaled, main_reenc]:
-            if os.path.exists(tmp):
-                os.remove(tmp)
-
 
 # normalize_audio is now in services.audio_normalize; re-exported below.
 
@@ -2938,12 +3165,7 @@ def _detect_face_offset(
             cap.release()
             return None
 
-        for t in sample_times:
-            cap.set(cv2.CAP_PROP_POS_MSEC, t * 1000)
-            ret, frame = cap.read()
-            if not ret:
-                continue
-
+        for t, frame in _prefetch(_frames_at_times(cap, sample_times, fps)):
             faces = detect_faces(detector, frame, width, height)
 
             # Pick the best face (largest × most confident)
@@ -2975,15 +3197,18 @@ def _detect_face_offset(
         all_cx = np.array([p[1] for p in timed_positions])
         cluster_radius = crop_w * 0.35
 
+        # Each cluster takes every position less than cluster_radius above
+        # the smallest one not yet claimed: one sort, then a binary search
+        # per cluster boundary.
+        order = np.argsort(all_cx, kind="stable")
+        sorted_cx = all_cx[order]
         clusters = []
-        used = np.zeros(len(all_cx), dtype=bool)
-        for idx in np.argsort(all_cx):
-            if used[idx]:
-                continue
-            mask = (np.abs(all_cx - all_cx[idx]) < cluster_radius) & ~used
-            if np.any(mask):
-                clusters.append(np.where(mask)[0])
-                used |= mask
+        start = 0
+        while start < len(sorted_cx) and cluster_radius > 0:
+            offsets = sorted_cx[start:] - sorted_cx[start]
+            end = start + int(np.searchsorted(offsets, cluster_radius, side="left"))
+            clusters.append(order[start:end])
+            start = end
 
         if not clusters:
             return None
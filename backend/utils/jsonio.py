@@ -0,0 +1,55 @@
+"""JSON helpers that use orjson when it is installed.
+
+Word-level transcripts run to tens of MB, where orjson parses and serializes
+several times faster than the stdlib. It stays optional: without it (or for
+input it rejects, like NaN literals) every helper falls back to `json`, and
+parse errors surface as json.JSONDecodeError either way.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+
+def loads(data: str | bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def dumpb(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 bytes, orjson's native output, for binary streams."""
+    if orjson is not None:
+        option = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_SERIALIZE_NUMPY
+            | (orjson.OPT_INDENT_2 if indent else 0)
+        )
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def dumps(obj: Any, *, indent: bool = False) -> str:
+    return dumpb(obj, indent=indent).decode("utf-8")
+
+
+def load_file(path: str) -> Any:
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def dump_file(obj: Any, path: str, *, indent: bool = False) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(dumps(obj, indent=indent))
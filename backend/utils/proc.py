@@ -7,16 +7,21 @@ the server or swallow failures silently.
 
 from __future__ import annotations
 
+import contextlib
 import logging
 import os
 import subprocess
+import threading
 import time
-from typing import Sequence
+from typing import Iterator, Sequence
 
 log = logging.getLogger("podcli.proc")
 
 _TOOL_ENV = {"ffmpeg": "PODCLI_FFMPEG", "ffprobe": "PODCLI_FFPROBE"}
 
+# How much stderr run(output=False) keeps: enough for ffmpeg's closing error.
+_STDERR_TAIL = 4096
+
 
 def _resolve_tool(cmd: Sequence[str]) -> list[str]:
     if not cmd:
@@ -27,6 +32,60 @@ def _resolve_tool(cmd: Sequence[str]) -> list[str]:
     return list(cmd)
 
 
+def usable_cpus() -> int:
+    """CPUs this process may run on: its affinity mask where the OS has one,
+    so a container or taskset limit is honoured, else the machine's count."""
+    try:
+        return len(os.sched_getaffinity(0)) or 1
+    except AttributeError:  # macOS / Windows
+        return os.cpu_count() or 1
+
+
+def render_concurrency() -> int:
+    """How many clip renders may run side by side.
+
+    Each render is dominated by its own multithreaded ffmpeg children, so more
+    than two at once only thrashes the CPU; PODCLI_RENDER_CONCURRENCY overrides.
+    """
+    raw = (os.environ.get("PODCLI_RENDER_CONCURRENCY") or "").strip()
+    if raw:
+        try:
+            return max(1, int(raw))
+        except ValueError:
+            pass
+    return 2 if usable_cpus() >= 8 else 1
+
+
+_render_jobs = 0
+_render_jobs_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def render_pool(jobs: int) -> Iterator[None]:
+    """Mark `jobs` renders as running side by side while the block runs.
+
+    CPU encodes started meanwhile split the cores between them (see
+    ffmpeg_threads) instead of each sizing its thread pool to the machine.
+    """
+    global _render_jobs
+    with _render_jobs_lock:
+        _render_jobs += jobs
+    try:
+        yield
+    finally:
+        with _render_jobs_lock:
+            _render_jobs -= jobs
+
+
+def ffmpeg_threads() -> int | None:
+    """Encoder thread count for one of several concurrent renders, or None
+    (ffmpeg's default) when only one is running."""
+    jobs = _render_jobs
+    if jobs <= 1:
+        return None
+    return max(1, usable_cpus() // jobs)
+
+
 class ProcError(RuntimeError):
     """Raised when a wrapped subprocess fails or times out."""
 
@@ -48,10 +107,13 @@ def run(
     check: bool = True,
     input_text: str | None = None,
     cwd: str | None = None,
+    output: bool = True,
 ) -> subprocess.CompletedProcess[str]:
     """Run a command with a mandatory timeout and structured logging.
 
-    - Captures stdout/stderr as text.
+    - Captures stdout/stderr as text. With output=False stdout is discarded
+      and only the last few KB of stderr are kept, for commands (ffmpeg
+      encodes, probes and extractions) whose exit code is all that matters.
     - Logs start, duration, and failure with the tool name + return code.
     - Raises ProcError on non-zero exit (when check=True) or timeout.
     """
@@ -62,17 +124,20 @@ def run(
     t0 = time.monotonic()
     log.debug("proc.start tool=%s argc=%d timeout=%.0fs", tool, len(cmd), timeout)
     try:
-        result = subprocess.run(
-            list(cmd),
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            input=input_text,
-            cwd=cwd,
-        )
+        if output:
+            result = subprocess.run(
+                list(cmd),
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                input=input_text,
+                cwd=cwd,
+            )
+        else:
+            result = _run_tail(cmd, timeout=timeout, input_text=input_text, cwd=cwd)
     except subprocess.TimeoutExpired as exc:
         duration = time.monotonic() - t0
-        stderr = (exc.stderr or b"").decode("utf-8", "replace") if isinstance(exc.stderr, bytes) else (exc.stderr or "")
+        stderr = (exc.stderr or b"")[-_STDERR_TAIL:].decode("utf-8", "replace") if isinstance(exc.stderr, bytes) else (exc.stderr or "")
         log.error("proc.timeout tool=%s duration=%.2fs", tool, duration)
         raise ProcError(cmd, -1, f"timeout after {timeout:.0f}s: {stderr}", duration) from exc
 
@@ -97,3 +162,143 @@ def run(
     else:
         log.debug("proc.ok tool=%s duration=%.2fs", tool, duration)
     return result
+
+
+def _run_tail(
+    cmd: Sequence[str],
+    *,
+    timeout: float,
+    input_text: str | None,
+    cwd: str | None,
+) -> subprocess.CompletedProcess[str]:
+    """run(output=False): stdout discarded, stderr drained as it arrives with
+    only its last _STDERR_TAIL bytes kept, so a long encode's progress log
+    never accumulates in memory."""
+    proc = subprocess.Popen(
+        list(cmd),
+        stdin=subprocess.DEVNULL if input_text is None else subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        cwd=cwd,
+    )
+    tail = bytearray()
+
+    def _drain():
+        for chunk in iter(lambda: proc.stderr.read(1 << 16), b""):
+            tail.extend(chunk)
+            del tail[:-_STDERR_TAIL]
+
+    reader = threading.Thread(target=_drain, daemon=True)
+    reader.start()
+    try:
+        if input_text is not None:
+            try:
+                proc.stdin.write(input_text.encode("utf-8"))
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass
+        proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        reader.join(timeout=1)  # a surviving grandchild may hold the pipe
+        raise subprocess.TimeoutExpired(cmd, timeout, stderr=bytes(tail))
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+    reader.join()
+    proc.stderr.close()
+    return subprocess.CompletedProcess(
+        list(cmd), proc.returncode, "", tail.decode("utf-8", "replace"),
+    )
+
+
+@contextlib.contextmanager
+def _streaming(cmd: Sequence[str], *, timeout: float, stderr: bool, text: bool):
+    """Popen `cmd` with one output stream piped, killing it at `timeout`.
+
+    The body must read the pipe to EOF; leaving by an exception (including a
+    closed generator) kills the process instead. ProcError is raised on exit
+    after a timeout or a non-zero exit status.
+    """
+    if not cmd:
+        raise ValueError("proc: cmd must be non-empty")
+    cmd = _resolve_tool(cmd)
+    tool = cmd[0]
+    t0 = time.monotonic()
+    log.debug("proc.stream tool=%s argc=%d timeout=%.0fs", tool, len(cmd), timeout)
+    text_kwargs = {"text": True, "encoding": "utf-8", "errors": "replace"} if text else {}
+    proc = subprocess.Popen(
+        list(cmd),
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL if stderr else subprocess.PIPE,
+        stderr=subprocess.PIPE if stderr else subprocess.DEVNULL,
+        bufsize=1 << 20,
+        **text_kwargs,
+    )
+    timed_out = threading.Event()
+
+    def _kill():
+        timed_out.set()
+        proc.kill()
+
+    timer = threading.Timer(timeout, _kill)
+    timer.daemon = True
+    timer.start()
+    pipe = proc.stderr if stderr else proc.stdout
+    try:
+        yield pipe  # read to EOF unless the consumer bails out
+    except BaseException:
+        proc.kill()  # consumer stopped early (or failed)
+        raise
+    else:
+        proc.wait()  # EOF: the exit status is moments away
+    finally:
+        timer.cancel()
+        pipe.close()
+        proc.wait()
+    duration = time.monotonic() - t0
+    if timed_out.is_set():
+        log.error("proc.timeout tool=%s duration=%.2fs", tool, duration)
+        raise ProcError(cmd, -1, f"timeout after {timeout:.0f}s", duration)
+    if proc.returncode != 0:
+        log.warning("proc.fail tool=%s rc=%d duration=%.2fs", tool, proc.returncode, duration)
+        raise ProcError(cmd, proc.returncode, "", duration)
+    log.debug("proc.done tool=%s rc=%d duration=%.2fs", tool, proc.returncode, duration)
+
+
+def stream_lines(
+    cmd: Sequence[str],
+    *,
+    timeout: float,
+    stderr: bool = False,
+) -> Iterator[str]:
+    """Yield a command's stdout (or stderr) line by line as it is produced.
+
+    For tools like ffmpeg's metadata printers, whose output grows with the
+    input: lines are parsed while the tool is still decoding, and nothing
+    holds the whole stream in memory. The other stream is discarded.
+
+    Raises ProcError once the stream ends if the process was killed at
+    `timeout` or exited non-zero, so callers never mistake a truncated stream
+    for a complete one. Stopping early just kills the process.
+    """
+    with _streaming(cmd, timeout=timeout, stderr=stderr, text=True) as pipe:
+        yield from pipe
+
+
+def stream_chunks(
+    cmd: Sequence[str],
+    *,
+    timeout: float,
+    chunk_size: int,
+) -> Iterator[bytes]:
+    """Yield a command's binary stdout in `chunk_size` pieces (the last may be
+    short). Same streaming and timeout behaviour as stream_lines."""
+    with _streaming(cmd, timeout=timeout, stderr=False, text=False) as pipe:
+        while True:
+            chunk = pipe.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
@@ -1,11 +1,16 @@
 """Timestamp formatting utilities for ASS subtitles and FFmpeg."""
 
+import math
+
 
 def seconds_to_ass(seconds: float) -> str:
     """Convert seconds to ASS timestamp format: H:MM:SS.cc"""
     h = int(seconds // 3600)
     m = int((seconds % 3600) // 60)
     s = seconds % 60
+    if s >= 59.995 and f"{s:.2f}" == "60.00":
+        # Rounds up to a whole minute; carry instead of printing "SS" as 60.
+        return seconds_to_ass(float(math.floor(seconds) + 1))
     return f"{h}:{m:02d}:{s:05.2f}"
 
 
@@ -10,7 +10,7 @@ const cache = new TranscriptCache();
 export interface TranscribeInput {
   file_path: string;
   model_size?: "tiny" | "base" | "small" | "medium" | "large";
-  engine?: "whisper-py" | "whispercpp" | "assemblyai";
+  engine?: "whisper-py" | "faster-whisper" | "whispercpp" | "assemblyai";
   language?: string;
   enable_diarization?: boolean;
   num_speakers?: number;
@@ -50,7 +50,7 @@ export const transcribeToolDef = {
       },
       engine: {
         type: "string",
-        enum: ["whisper-py", "whispercpp", "assemblyai"],
+        enum: ["whisper-py", "faster-whisper", "whispercpp", "assemblyai"],
         description: "Transcription engine. Default: whisper-py.",
       },
       enable_diarization: {
@@ -168,7 +168,7 @@ export const transcribeStartToolDef = {
       language: { type: "string" },
       engine: {
         type: "string",
-        enum: ["whisper-py", "whispercpp", "assemblyai"],
+        enum: ["whisper-py", "faster-whisper", "whispercpp", "assemblyai"],
       },
       enable_diarization: { type: "boolean", default: false },
       num_speakers: { type: "number" },
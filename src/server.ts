@@ -270,7 +270,7 @@ export function createServer(): McpServer {
         .default("base")
         .describe("Whisper model size"),
       engine: z
-        .enum(["whisper-py", "whispercpp", "assemblyai"])
+        .enum(["whisper-py", "faster-whisper", "whispercpp", "assemblyai"])
         .optional()
         .describe("Transcription engine"),
       language: z.string().optional().describe("ISO language code"),
@@ -350,7 +350,7 @@ export function createServer(): McpServer {
         .optional()
         .default("base"),
       language: z.string().optional(),
-      engine: z.enum(["whisper-py", "whispercpp", "assemblyai"]).optional(),
+      engine: z.enum(["whisper-py", "faster-whisper", "whispercpp", "assemblyai"]).optional(),
       enable_diarization: z.boolean().optional().default(false),
       num_speakers: z.number().optional(),
     },
@@ -73,6 +73,9 @@ export class TranscriptCache {
     if (["whispercpp", "whisper-cpp", "whisper.cpp", "cpp"].includes(value)) {
       return "-whispercpp";
     }
+    if (["faster-whisper", "faster_whisper", "faster"].includes(value)) {
+      return "-faster-whisper";
+    }
     if (["assemblyai", "assembly-ai", "aai"].includes(value)) {
       return "-assemblyai";
     }
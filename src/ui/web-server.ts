@@ -1717,13 +1717,14 @@ app.get("/api/export-transcript", (_req, res) => {
 
 // --- Analyze audio energy ---
 app.post("/api/analyze-energy", async (req, res) => {
-  const { video_path, segments } = req.body;
+  const { video_path, segments, include_energy_data } = req.body;
   if (!video_path)
     return res.status(400).json({ error: "video_path required" });
   try {
     const result = await executor.execute("analyze_energy", {
       video_path,
       segments: segments || [],
+      include_energy_data: include_energy_data === true,
     });
     res.json(result.data || {});
   } catch (err: any) {
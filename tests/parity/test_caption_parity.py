@@ -77,7 +77,7 @@ def _render(style: str) -> str:
 def _hermetic_render(monkeypatch):
     """Pin the two host-dependent inputs so goldens are reproducible everywhere.
 
-    1. Font name: caption_styles.DETECTED_FONT is resolved at import via fc-list,
+    1. Font name: get_style() resolves font_name via fc-list on first use,
        so it's "Arial" on macOS and "Liberation Sans" on CI's Ubuntu — and that
        name is written into the ASS Style line.
     2. Text widths: see _deterministic_text_widths (affects the branded style's
@@ -77,6 +77,23 @@ class ComputeEnergyScoresTests(unittest.TestCase):
         # Only 2 samples contribute — -20 is above the -40 baseline → score > 0
         self.assertGreater(scores[0], 0)
 
+    def test_unsorted_energy_data_scores_like_sorted(self):
+        energy = [{"time": float(t), "rms_db": -40.0 + (t % 7) * 4} for t in range(30)]
+        segments = [{"start": 0, "end": 5}, {"start": 5, "end": 5}, {"start": 12.5, "end": 29}]
+        self.assertEqual(
+            aa.compute_energy_scores(list(reversed(energy)), segments),
+            aa.compute_energy_scores(energy, segments),
+        )
+
+    def test_out_of_range_levels_read_as_silence(self):
+        energy = [{"time": float(t), "rms_db": -20.0 - t} for t in range(10)]
+        with_inf = energy + [{"time": 3.5, "rms_db": float("-inf")}]
+        segments = [{"start": 0, "end": 9}, {"start": 3, "end": 4}]
+        self.assertEqual(
+            aa.compute_energy_scores(with_inf, segments),
+            aa.compute_energy_scores(energy, segments),
+        )
+
     def test_zero_variance_energy_is_handled(self):
         # All-same energy level would cause std=0 — function must avoid div-by-zero
         energy = [{"time": float(t), "rms_db": -25.0} for t in range(0, 20)]
@@ -89,16 +106,52 @@ class ComputeEnergyScoresTests(unittest.TestCase):
 
 class ExtractAudioEnergyCommandTests(unittest.TestCase):
     def _run(self, wav_path=None):
-        with mock.patch.object(aa, "proc_run", return_value=mock.Mock(returncode=0, stdout="", stderr="")) as mocked, \
+        with mock.patch.object(aa, "stream_chunks", return_value=iter([])) as mocked, \
              mock.patch.object(aa, "_fallback_energy", return_value=[]):
             aa.extract_audio_energy("/video.mp4", wav_path=wav_path)
         return mocked.call_args.args[0]
 
-    def test_window_is_pinned_with_asetnsamples(self):
+    def test_pipes_16k_mono_pcm(self):
         cmd = self._run()
-        af = cmd[cmd.index("-af") + 1]
-        self.assertIn("asetnsamples=n=16000", af)
-        self.assertIn("astats=metadata=1:reset=1", af)
+        joined = " ".join(cmd)
+        self.assertIn("-ac 1 -ar 16000 -f s16le -", joined)
+        self.assertIn("-vn", cmd)
+
+    def test_rms_per_window_from_pcm(self):
+        import numpy as np
+
+        # Second 0: constant half-scale, second 1: digital silence (dropped),
+        # second 2: short tail, zero-padded to a full window.
+        pcm = np.concatenate((
+            np.full(16000, 16384, dtype="<i2"),
+            np.zeros(16000, dtype="<i2"),
+            np.full(4000, -16384, dtype="<i2"),
+        )).tobytes()
+        with mock.patch.object(aa, "stream_chunks", return_value=iter([pcm])):
+            energy = aa.extract_audio_energy("/video.mp4")
+        self.assertEqual(energy, [
+            {"time": 0.0, "rms_db": -6.02},
+            {"time": 2.0, "rms_db": -12.04},
+        ])
+
+    def _failing_stream(self, returncode):
+        def stream(cmd, **kwargs):
+            yield b"\x00\x40" * 16000
+            raise aa.ProcError(cmd, returncode, "", 1.0)
+        return stream
+
+    def test_timeout_raises_instead_of_returning_a_truncated_curve(self):
+        with mock.patch.object(aa, "stream_chunks", side_effect=self._failing_stream(-1)), \
+             mock.patch.object(aa, "_fallback_energy") as fallback:
+            with self.assertRaises(aa.ProcError):
+                aa.extract_audio_energy("/video.mp4")
+        fallback.assert_not_called()
+
+    def test_failed_decode_drops_partial_levels_for_the_fallback(self):
+        ebur = [{"time": 0.0, "rms_db": -20.0}]
+        with mock.patch.object(aa, "stream_chunks", side_effect=self._failing_stream(1)), \
+             mock.patch.object(aa, "_fallback_energy", return_value=ebur):
+            self.assertEqual(aa.extract_audio_energy("/video.mp4"), ebur)
 
     def test_uses_shared_wav_when_provided(self):
         fd, wav = tempfile.mkstemp(suffix=".wav")
@@ -115,6 +168,93 @@ class ExtractAudioEnergyCommandTests(unittest.TestCase):
         self.assertIn("/video.mp4", cmd)
 
 
+class GetEnergyProfileTests(unittest.TestCase):
+    def test_cached_energy_data_skips_extraction(self):
+        energy = [{"time": float(t), "rms_db": -20.0 - t} for t in range(10)]
+        with mock.patch.object(aa, "extract_audio_energy") as extract:
+            profile = aa.get_energy_profile(
+                "/video.mp4", [{"start": 0, "end": 9}], energy_data=energy,
+            )
+        extract.assert_not_called()
+        self.assertIs(profile["energy_data"], energy)
+        self.assertEqual(profile["peak_times"], [0.0])
+
+    def test_peak_times_are_loudest_first_with_ties_in_order(self):
+        levels = [-30, -10, -20, -10, -40, -10, -50, -60, -35, -25,
+                  -45, -55, -15, -65, -70, -75, -80, -85, -90, -95]
+        energy = [{"time": float(t), "rms_db": float(db)} for t, db in enumerate(levels)]
+        self.assertEqual(aa._peak_times(energy), [1.0, 3.0])
+        self.assertEqual(aa._peak_times([]), [])
+
+
+class AnalyzeEnergyHandlerTests(unittest.TestCase):
+    def _run(self, params, cached=None):
+        import main as backend_main
+        from services import signal_cache
+
+        energy = [{"time": 0.0, "rms_db": -20.0}]
+        self.profile_kwargs = {}
+
+        def fake_profile(**kwargs):
+            self.profile_kwargs = kwargs
+            return {"energy_data": kwargs["energy_data"] or energy, "segment_scores": [], "peak_times": [0.0]}
+
+        with mock.patch.object(aa, "get_energy_profile", fake_profile), \
+             mock.patch.object(backend_main.os.path, "exists", return_value=True), \
+             mock.patch.object(signal_cache, "load_signals", return_value=cached or {}), \
+             mock.patch.object(signal_cache, "save_signals") as self.save, \
+             mock.patch.object(backend_main, "emit_result") as emit, \
+             mock.patch.object(backend_main, "emit_progress"):
+            backend_main.handle_analyze_energy("t", {"video_path": "/video.mp4", **params})
+        return emit.call_args.kwargs["data"]
+
+    def test_energy_curve_is_left_off_the_wire_by_default(self):
+        data = self._run({})
+        self.assertNotIn("energy_data", data)
+        self.assertEqual(data["peak_times"], [0.0])
+
+    def test_energy_curve_is_included_on_request(self):
+        self.assertIn("energy_data", self._run({"include_energy_data": True}))
+
+    def test_fresh_curve_is_cached(self):
+        self._run({})
+        self.assertIsNone(self.profile_kwargs["energy_data"])
+        self.save.assert_called_once()
+
+    def test_cached_curve_skips_extraction(self):
+        cached = [{"time": 1.0, "rms_db": -30.0}]
+        self._run({}, cached={"energy_data": cached})
+        self.assertIs(self.profile_kwargs["energy_data"], cached)
+        self.save.assert_not_called()
+
+    def test_audio_less_input_returns_an_empty_profile(self):
+        import main as backend_main
+        from services import signal_cache
+
+        def no_audio(cmd, **kwargs):
+            raise aa.ProcError(cmd, 1, "Output file does not contain any stream", 0.1)
+            yield
+
+        probe = mock.Mock(returncode=0, stdout='{"format": {"duration": "12.0"}}')
+        with mock.patch.object(aa, "stream_chunks", side_effect=no_audio), \
+             mock.patch.object(aa, "stream_lines", side_effect=no_audio), \
+             mock.patch.object(aa, "proc_run", return_value=probe), \
+             mock.patch.object(backend_main.os.path, "exists", return_value=True), \
+             mock.patch.object(signal_cache, "load_signals", return_value={}), \
+             mock.patch.object(signal_cache, "save_signals") as save, \
+             mock.patch.object(backend_main, "emit_result") as emit, \
+             mock.patch.object(backend_main, "emit_progress"), \
+             mock.patch("sys.stderr"):
+            backend_main.handle_analyze_energy(
+                "t", {"video_path": "/silent.mp4", "segments": [{"start": 0, "end": 5}]},
+            )
+        self.assertEqual(emit.call_args.args[1], "success")
+        data = emit.call_args.kwargs["data"]
+        self.assertEqual(data["segment_scores"], [0])
+        self.assertEqual(data["peak_times"], [])
+        save.assert_not_called()
+
+
 class ExtractWavCleanupTests(unittest.TestCase):
     def test_failed_extraction_removes_internally_created_wav(self):
         with tempfile.TemporaryDirectory() as tmpdir:
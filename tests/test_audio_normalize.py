@@ -16,6 +16,10 @@ if BACKEND_ROOT not in sys.path:
 
 from services import audio_normalize as an
 
+# Native AAC, as get_audio_encode_flags returns without libfdk_aac; patched
+# in so these tests never run (or persist) a real encoder probe.
+AAC_FLAGS = ["-c:a", "aac", "-b:a", "192k", "-ar", "44100"]
+
 
 class ParseLoudnormStatsTests(unittest.TestCase):
     def test_empty_stderr_returns_none(self):
@@ -59,6 +63,11 @@ class ParseLoudnormStatsTests(unittest.TestCase):
 
 
 class NormalizeAudioTests(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(an, "get_audio_encode_flags", return_value=AAC_FLAGS)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def _ok(self, stderr: str = "") -> mock.Mock:
         return mock.Mock(returncode=0, stdout="", stderr=stderr)
 
@@ -81,6 +90,20 @@ class NormalizeAudioTests(unittest.TestCase):
             self.assertIn("measured_I=-20.5", joined)
             self.assertIn("linear=true", joined)
 
+    def test_measure_pass_skips_video_decode(self):
+        with mock.patch.object(an, "proc_run", return_value=self._ok()) as mocked:
+            an.loudnorm_filter("/in.mp4")
+        measure_cmd = mocked.call_args.args[0]
+        self.assertIn("-vn", measure_cmd)
+        self.assertGreater(measure_cmd.index("-vn"), measure_cmd.index("-i"))
+
+    def test_measure_pass_can_seek_a_source_range(self):
+        with mock.patch.object(an, "proc_run", return_value=self._ok()) as mocked:
+            an.loudnorm_filter("/src.mp4", input_range=(12.5, 40.0))
+        cmd = mocked.call_args.args[0]
+        i = cmd.index("-i")
+        self.assertEqual(cmd[i - 4:i], ["-ss", "12.5", "-t", "27.5"])
+
     def test_single_pass_fallback_on_missing_stats(self):
         with mock.patch.object(
             an, "proc_run",
@@ -125,6 +148,37 @@ class NormalizeAudioTests(unittest.TestCase):
                 an.normalize_audio("/in.mp4", "/out.mp4")
 
 
+class BurnWithLoudnormTests(unittest.TestCase):
+    def _burn(self, has_audio=True, **kwargs):
+        from services import captions_burn as cb
+
+        ok = mock.Mock(returncode=0, stdout="", stderr="")
+        with mock.patch.object(cb, "proc_run", return_value=ok) as run, \
+             mock.patch.object(cb, "has_audio_stream", return_value=has_audio), \
+             mock.patch.object(cb, "get_video_encode_flags", return_value=cb.CPU_FLAGS), \
+             mock.patch.object(cb, "get_audio_encode_flags", return_value=AAC_FLAGS):
+            cb.burn_captions("/in.mp4", "/c.ass", "/out.mp4", **kwargs)
+        return run.call_args.args[0]
+
+    def test_audio_filter_is_applied_while_burning(self):
+        cmd = self._burn(audio_filter="loudnorm=I=-14.0:TP=-1.5:LRA=11")
+        self.assertEqual(cmd[cmd.index("-af") + 1], "loudnorm=I=-14.0:TP=-1.5:LRA=11")
+        self.assertEqual(cmd[cmd.index("-c:a") + 1], "aac")
+
+    def test_audio_is_copied_without_a_filter(self):
+        cmd = self._burn()
+        self.assertNotIn("-af", cmd)
+        self.assertEqual(cmd[cmd.index("-c:a") + 1], "copy")
+
+    def test_filter_is_dropped_for_silent_input(self):
+        self.assertNotIn("-af", self._burn(has_audio=False, audio_filter="loudnorm"))
+
+    def test_input_range_seeks_the_source_before_decoding(self):
+        cmd = self._burn(audio_filter="loudnorm", input_range=(12.5, 40.0))
+        self.assertEqual(cmd[cmd.index("-i") - 4:cmd.index("-i") + 2],
+                         ["-ss", "12.5", "-t", "27.5", "-i", "/in.mp4"])
+
+
 class ReExportTests(unittest.TestCase):
     def test_video_processor_still_exposes_normalize_audio(self):
         from services import video_processor as vp
@@ -0,0 +1,92 @@
+"""Tests for backend.main progress emission: background writes, per-stage
+coalescing, and draining before the result line."""
+
+import io
+import json
+import os
+import sys
+import unittest
+from unittest import mock
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+BACKEND_ROOT = os.path.join(ROOT, "backend")
+if BACKEND_ROOT not in sys.path:
+    sys.path.insert(0, BACKEND_ROOT)
+
+import main as backend_main
+
+
+def _lines(buf: io.StringIO) -> list[dict]:
+    return [json.loads(line) for line in buf.getvalue().splitlines()]
+
+
+class ProgressWriterTests(unittest.TestCase):
+    def setUp(self):
+        self.writer = backend_main._ProgressWriter()
+        self.err = io.StringIO()
+        patcher = mock.patch.object(backend_main.sys, "stderr", self.err)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_events_reach_stderr_after_flush(self):
+        self.writer.put({"task_id": "t", "stage": "a", "percent": 10, "message": "m"})
+        self.writer.flush()
+        self.assertEqual(_lines(self.err), [{"task_id": "t", "stage": "a", "percent": 10, "message": "m"}])
+
+    def test_plain_updates_coalesce_but_results_are_kept(self):
+        # Hold the emit lock so every put lands before the writer drains.
+        with backend_main._emit_lock:
+            self.writer.put({"task_id": "t", "stage": "warmup", "percent": 0, "message": "start"},
+                            coalesce=True)
+            for pct in range(1, 50):
+                self.writer.put({"task_id": "t", "stage": "batch", "percent": pct, "message": "x"},
+                                coalesce=True)
+            self.writer.put({"task_id": "t", "stage": "clip_complete", "percent": 50, "message": "c",
+                             "clip_result": {"clip_index": 0}})
+            self.writer.put({"task_id": "t", "stage": "clip_complete", "percent": 100, "message": "c",
+                             "clip_result": {"clip_index": 1}})
+        self.writer.flush()
+        events = _lines(self.err)
+        batch = [e["percent"] for e in events if e["stage"] == "batch"]
+        self.assertEqual(batch[-1], 49)
+        self.assertLess(len(batch), 49)
+        done = [e["clip_result"]["clip_index"] for e in events if e["stage"] == "clip_complete"]
+        self.assertEqual(done, [0, 1])
+
+    def test_unserializable_event_does_not_block_others(self):
+        self.writer.put({"task_id": "t", "stage": "a", "percent": 1, "message": "m", "bad": object()})
+        self.writer.put({"task_id": "t", "stage": "b", "percent": 2, "message": "m"})
+        self.writer.flush()
+        self.assertEqual([e["stage"] for e in _lines(self.err)], ["b"])
+
+    def test_only_events_marked_for_coalescing_are_merged(self):
+        with backend_main._emit_lock:
+            for pct in (1, 2):
+                self.writer.put({"task_id": "t", "stage": "s", "percent": pct, "message": "m"})
+        self.writer.flush()
+        self.assertEqual([e["percent"] for e in _lines(self.err)], [1, 2])
+
+
+class EmitProgressTests(unittest.TestCase):
+    def test_bare_updates_coalesce_and_extra_fields_do_not(self):
+        with mock.patch.object(backend_main, "_progress") as progress:
+            backend_main.emit_progress("t", "batch", 10, "x")
+            backend_main.emit_progress("t", "clip_complete", 50, "c", clip_result={"clip_index": 0})
+        self.assertEqual(
+            [c.kwargs["coalesce"] for c in progress.put.call_args_list], [True, False],
+        )
+
+
+class EmitResultTests(unittest.TestCase):
+    def test_result_waits_for_queued_progress(self):
+        err, out = io.StringIO(), io.StringIO()
+        with mock.patch.object(backend_main.sys, "stderr", err), \
+             mock.patch.object(backend_main.sys, "stdout", out):
+            backend_main.emit_progress("t", "batch", 99, "almost")
+            backend_main.emit_result("t", "success", data={"ok": True})
+        self.assertEqual(_lines(err)[-1]["percent"], 99)
+        self.assertEqual(json.loads(out.getvalue())["status"], "success")
+
+
+if __name__ == "__main__":
+    unittest.main()
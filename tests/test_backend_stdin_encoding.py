@@ -47,3 +47,18 @@ def test_non_ascii_title_survives_cp1252_stdin():
     result = json.loads(proc.stdout.strip().splitlines()[-1])
     assert result["status"] == "error"
     assert result["task_id"] == TITLE
+
+
+def test_malformed_utf8_is_replaced_not_fatal():
+    proc = subprocess.run(
+        [sys.executable, str(MAIN)],
+        input=b'{"task_id": "bad\x9dbyte", "task_type": "ping", "params": {}}\n',
+        capture_output=True,
+        env=os.environ.copy(),
+        cwd=str(BACKEND),
+        timeout=120,
+    )
+
+    result = json.loads(proc.stdout.decode("utf-8").strip().splitlines()[-1])
+    assert result["status"] == "success"
+    assert result["task_id"] == "bad�byte"
@@ -14,6 +14,10 @@ if BACKEND_ROOT not in sys.path:
 import main as backend_main
 
 
+def _cpus(n):
+    return mock.patch("os.sched_getaffinity", return_value=set(range(n)), create=True)
+
+
 def _clean_env():
     return {k: v for k, v in os.environ.items() if k != "PODCLI_RENDER_CONCURRENCY"}
 
@@ -29,27 +33,29 @@ class RenderConcurrencyTests(unittest.TestCase):
 
     def test_invalid_env_falls_back_to_cpu_rule(self):
         with mock.patch.dict(os.environ, {"PODCLI_RENDER_CONCURRENCY": "junk"}), \
-             mock.patch.object(backend_main.os, "cpu_count", return_value=16):
+             _cpus(16):
             self.assertEqual(backend_main._render_concurrency(), 2)
 
     def test_two_workers_on_big_machines(self):
         with mock.patch.dict(os.environ, _clean_env(), clear=True), \
-             mock.patch.object(backend_main.os, "cpu_count", return_value=8):
+             _cpus(8):
             self.assertEqual(backend_main._render_concurrency(), 2)
 
     def test_one_worker_on_small_machines(self):
         with mock.patch.dict(os.environ, _clean_env(), clear=True), \
-             mock.patch.object(backend_main.os, "cpu_count", return_value=4):
+             _cpus(4):
             self.assertEqual(backend_main._render_concurrency(), 1)
 
 
 class HandleBatchClipsTests(unittest.TestCase):
-    def _run_batch(self, concurrency, fail_index=None, n=4):
+    def _run_batch(self, concurrency, fail_index=None, n=4, max_parallel=None):
         clips = [
             {"start_second": float(i * 100), "end_second": float(i * 100 + 30), "title": f"clip_{i}"}
             for i in range(n)
         ]
         params = {"video_path": "/video.mp4", "clips": clips}
+        if max_parallel is not None:
+            params["max_parallel"] = max_parallel
 
         def fake_generate_clip(**kwargs):
             title = kwargs["title"]
@@ -106,6 +112,22 @@ class HandleBatchClipsTests(unittest.TestCase):
         self.assertEqual(by_index[1]["status"], "error")
         self.assertEqual(by_index[0]["status"], "success")
 
+    def test_max_parallel_overrides_default_pool(self):
+        from concurrent import futures
+
+        with mock.patch.object(futures, "ThreadPoolExecutor", wraps=futures.ThreadPoolExecutor) as pool:
+            holder, _ = self._run_batch(concurrency=1, max_parallel=3)
+        pool.assert_called_once_with(max_workers=3)
+        self.assertEqual(holder["data"]["successful_clips"], 4)
+
+    def test_max_parallel_one_stays_sequential(self):
+        from concurrent import futures
+
+        with mock.patch.object(futures, "ThreadPoolExecutor") as pool:
+            holder, _ = self._run_batch(concurrency=4, max_parallel=1)
+        pool.assert_not_called()
+        self.assertEqual(holder["data"]["successful_clips"], 4)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -77,12 +77,27 @@ class ChunkWordsTests(unittest.TestCase):
         self.assertEqual(cr._chunk_words([], 4), [])
 
 
+class SanitizeWordsTests(unittest.TestCase):
+    def test_clean_words_pass_through_uncopied(self):
+        word = _word("fine", 1.0, 1.5)
+        self.assertIs(cr._sanitize_words([word])[0], word)
+
+    def test_fixed_words_are_copied(self):
+        words = [_word(" padded ", 1.0, 1.5), _word("short", 2.0, 2.01), _word("int", 3, 4)]
+        cleaned = cr._sanitize_words(words)
+        self.assertEqual(cleaned[0]["word"], "padded")
+        self.assertAlmostEqual(cleaned[1]["end"], 2.0 + cr.MIN_WORD_DURATION)
+        self.assertIsInstance(cleaned[2]["start"], float)
+        self.assertEqual(words[0]["word"], " padded ")
+        self.assertEqual(words[1]["end"], 2.01)
+
+
 class BrandedEventVolumeTests(unittest.TestCase):
     def test_events_are_linear_in_word_count(self):
         style = get_style("branded")
         chunk_size = style.get("words_per_chunk", 6)
         words = _flowing_words(["word"] * chunk_size)
-        content = cr._render_branded(words, style, 0.0)
+        content = "".join(cr._render_branded(words, style, 0.0))
         dialogue_count = content.count("Dialogue:")
         # One text event per word for the chunk span + one pill per word.
         self.assertEqual(dialogue_count, 2 * chunk_size)
@@ -90,7 +105,7 @@ class BrandedEventVolumeTests(unittest.TestCase):
     def test_text_events_span_the_whole_chunk(self):
         style = get_style("branded")
         words = _flowing_words(["alpha", "beta", "gamma"])
-        content = cr._render_branded(words, style, 0.0)
+        content = "".join(cr._render_branded(words, style, 0.0))
         layer1 = [l for l in content.splitlines() if l.startswith("Dialogue: 1,")]
         starts = {l.split(",")[1] for l in layer1}
         ends = {l.split(",")[2] for l in layer1}
@@ -98,5 +113,96 @@ class BrandedEventVolumeTests(unittest.TestCase):
         self.assertEqual(len(ends), 1)
 
 
+class RenderCaptionsWriteTests(unittest.TestCase):
+    def test_streamed_file_matches_rendered_lines_across_batches(self):
+        import tempfile
+
+        words = _flowing_words(["word", "café."] * (cr._WRITE_BATCH + 10))
+        style = get_style("subtle")
+        expected = "".join(cr._render_subtle(cr._sanitize_words(words), style, 0.0))
+        with tempfile.TemporaryDirectory() as tmp:
+            out = cr.render_captions(words, "subtle", os.path.join(tmp, "c.ass"))
+            with open(out, "rb") as f:
+                written = f.read()
+        self.assertGreater(expected.count("Dialogue:"), cr._WRITE_BATCH)
+        self.assertEqual(written, expected.encode("utf-8"))
+
+    def test_resolved_style_is_used_without_a_second_lookup(self):
+        import tempfile
+        from unittest import mock
+
+        style = get_style("subtle")
+        with tempfile.TemporaryDirectory() as tmp:
+            with mock.patch.object(cr, "get_style") as lookup:
+                out = cr.render_captions(
+                    _flowing_words(["just", "one"]), "subtle",
+                    os.path.join(tmp, "c.ass"), style=style,
+                )
+            with open(out, encoding="utf-8") as f:
+                content = f.read()
+        lookup.assert_not_called()
+        self.assertIn("Dialogue:", content)
+
+    def test_header_without_events_ends_in_a_blank_line(self):
+        import tempfile
+        from unittest import mock
+
+        style = get_style("subtle")
+        header = cr.generate_ass_header(style)
+        with tempfile.TemporaryDirectory() as tmp:
+            with mock.patch.object(cr, "_render_subtle", return_value=iter([header])):
+                out = cr.render_captions(_flowing_words(["um"]), "subtle",
+                                         os.path.join(tmp, "c.ass"), style=style)
+            with open(out, encoding="utf-8") as f:
+                self.assertEqual(f.read(), header + "\n")
+
+    def test_renderer_error_leaves_the_previous_file_untouched(self):
+        import tempfile
+        from unittest import mock
+
+        def broken(*args):
+            yield "[Script Info]\n"
+            raise RuntimeError("boom")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "c.ass")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("old")
+            with mock.patch.object(cr, "_render_subtle", side_effect=broken):
+                with self.assertRaises(RuntimeError):
+                    cr.render_captions(_flowing_words(["hi"]), "subtle", path)
+            self.assertEqual(os.listdir(tmp), ["c.ass"])
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(f.read(), "old")
+
+
+class MeasureFontCacheTests(unittest.TestCase):
+    def setUp(self):
+        cr._font_local.fonts = {}
+        self.addCleanup(vars(cr._font_local).clear)
+
+    def test_font_is_loaded_once_per_thread(self):
+        import threading
+        from unittest import mock
+
+        with mock.patch.object(cr, "_load_measure_font", side_effect=lambda *a: object()) as load:
+            first = cr._measure_font("Arial", 40, True)
+            self.assertIs(cr._measure_font("Arial", 40, True), first)
+            other = []
+            t = threading.Thread(target=lambda: other.append(cr._measure_font("Arial", 40, True)))
+            t.start()
+            t.join()
+        self.assertIsNot(other[0], first)
+        self.assertEqual(load.call_count, 2)
+
+    def test_missing_font_is_retried(self):
+        from unittest import mock
+
+        with mock.patch.object(cr, "_load_measure_font", return_value=None) as load:
+            self.assertIsNone(cr._measure_font("Nope", 40, False))
+            self.assertIsNone(cr._measure_font("Nope", 40, False))
+        self.assertEqual(load.call_count, 2)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,88 @@
+"""Tests for backend.config.caption_styles font detection and style lookup."""
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+BACKEND_ROOT = os.path.join(ROOT, "backend")
+if BACKEND_ROOT not in sys.path:
+    sys.path.insert(0, BACKEND_ROOT)
+
+from config import caption_styles as cs
+from utils.proc import ProcError
+
+
+class DetectFontTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache_file = os.path.join(self._tmp.name, "detected-font.txt")
+        patcher = mock.patch.object(cs, "_font_cache_path", return_value=self.cache_file)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self._tmp.cleanup)
+        cs._detect_font.cache_clear()
+        self.addCleanup(cs._detect_font.cache_clear)
+
+    def _fc_list(self, stdout, returncode=0):
+        return mock.patch.object(
+            cs, "proc_run", return_value=mock.Mock(returncode=returncode, stdout=stdout),
+        )
+
+    def test_picks_highest_priority_installed_font(self):
+        with self._fc_list("DejaVu Sans\nNoto Sans,Noto Sans UI\nComic Neue\n"):
+            self.assertEqual(cs._detect_font(), "Noto Sans")
+
+    def test_result_is_cached_on_disk(self):
+        with self._fc_list("Liberation Sans\n"):
+            cs._detect_font()
+        cs._detect_font.cache_clear()
+        with self._fc_list("") as run:
+            self.assertEqual(cs._detect_font(), "Liberation Sans")
+        run.assert_not_called()
+
+    def test_stale_cache_is_ignored(self):
+        with open(self.cache_file, "w", encoding="utf-8") as f:
+            f.write("FreeSans")
+        old = os.path.getmtime(self.cache_file) - cs._FONT_CACHE_TTL - 60
+        os.utime(self.cache_file, (old, old))
+        with self._fc_list("DejaVu Sans\n"):
+            self.assertEqual(cs._detect_font(), "DejaVu Sans")
+
+    def test_missing_fc_list_falls_back_to_arial(self):
+        with self._fc_list("", returncode=1):
+            self.assertEqual(cs._detect_font(), "Arial")
+
+    def test_failed_scan_is_not_cached(self):
+        with self._fc_list("", returncode=1):
+            cs._detect_font()
+        self.assertFalse(os.path.exists(self.cache_file))
+        cs._detect_font.cache_clear()
+        with self._fc_list("DejaVu Sans\n"):
+            self.assertEqual(cs._detect_font(), "DejaVu Sans")
+
+    def test_timed_out_scan_is_not_cached(self):
+        err = ProcError(["fc-list"], -1, "timeout after 5s", 5.0)
+        with mock.patch.object(cs, "proc_run", side_effect=err):
+            self.assertEqual(cs._detect_font(), "Arial")
+        self.assertFalse(os.path.exists(self.cache_file))
+
+    def test_get_style_resolves_font_without_touching_the_table(self):
+        with self._fc_list("FreeSans\n"):
+            style = cs.get_style("branded")
+        self.assertEqual(style["font_name"], "FreeSans")
+        self.assertNotIn("font_name", cs.STYLES["branded"])
+
+    def test_style_table_is_read_only(self):
+        with self.assertRaises(TypeError):
+            cs.STYLES["branded"]["font_size"] = 10
+        with self._fc_list(""):
+            style = cs.get_style("branded")
+        style["font_size"] = 10
+        self.assertEqual(cs.STYLES["branded"]["font_size"], 80)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -31,7 +31,7 @@ Today we talk about split screens.
 """
 
 
-def _process_args(video_path, transcript_path, output_dir):
+def _process_args(video_path, transcript_path, output_dir, jobs=None):
     return argparse.Namespace(
         video=video_path,
         transcript=transcript_path,
@@ -57,20 +57,21 @@ def _process_args(video_path, transcript_path, output_dir):
         no_resume=True,
         quality=None,
         allow_ass_fallback=False,
+        jobs=jobs,
         review_each=False,
         post_review=False,
     )
 
 
 class CliTranscriptTests(unittest.TestCase):
-    def _run_process(self, transcript_text, cached_transcript=None):
+    def _run_process(self, transcript_text, cached_transcript=None, clips=None, jobs=None):
         """Run cmd_process with --transcript and return the generate_clip mock."""
-        clip = {
+        clips = clips or [{
             "title": "Test clip",
             "start_second": 0.0,
             "end_second": 0.5,
             "duration": 0.5,
-        }
+        }]
 
         with tempfile.TemporaryDirectory() as temp_dir:
             video_path = os.path.join(temp_dir, "episode.mp4")
@@ -102,8 +103,8 @@ class CliTranscriptTests(unittest.TestCase):
                     "services.transcript_packer.load_cached_transcript_for_video",
                     return_value=cached_transcript,
                 ),
-                mock.patch.object(cli_mod, "_suggest_clips", return_value=[clip]),
-                mock.patch.object(cli_mod, "_review_clips", return_value=[clip]),
+                mock.patch.object(cli_mod, "_suggest_clips", return_value=clips),
+                mock.patch.object(cli_mod, "_review_clips", return_value=clips),
                 mock.patch.object(
                     cli_mod, "_should_enter_post_render_loop", return_value=False
                 ),
@@ -112,9 +113,9 @@ class CliTranscriptTests(unittest.TestCase):
                     return_value=generated,
                 ) as generate_clip,
             ):
-                cli_mod.cmd_process(_process_args(video_path, transcript_path, output_dir))
+                cli_mod.cmd_process(_process_args(video_path, transcript_path, output_dir, jobs=jobs))
 
-        generate_clip.assert_called_once()
+        self.assertEqual(generate_clip.call_count, len(clips))
         return generate_clip
 
     def test_json_transcript_face_map_reaches_clip_generator(self):
@@ -152,6 +153,18 @@ class CliTranscriptTests(unittest.TestCase):
 
         self.assertEqual(generate_clip.call_args.kwargs["face_map"], FACE_MAP)
 
+    def test_jobs_renders_every_clip_concurrently(self):
+        clips = [
+            {"title": f"clip {i}", "start_second": float(i), "end_second": i + 0.5, "duration": 0.5}
+            for i in range(3)
+        ]
+
+        with mock.patch.object(cli_mod.sys.stdin, "isatty", return_value=False):
+            generate_clip = self._run_process(SRT, clips=clips, jobs=2)
+
+        titles = sorted(c.kwargs["title"] for c in generate_clip.call_args_list)
+        self.assertEqual(titles, ["clip 0", "clip 1", "clip 2"])
+
 
 if __name__ == "__main__":
     unittest.main()
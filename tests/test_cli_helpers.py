@@ -53,5 +53,56 @@ class SharedWavTests(unittest.TestCase):
         self.assertEqual(extract.call_count, 1)
 
 
+class SpinnerTests(unittest.TestCase):
+    def test_non_tty_output_gets_no_animation(self):
+        import io
+
+        buf = io.StringIO()
+        with mock.patch.object(cli_mod.sys, "stdout", buf):
+            with cli_mod._Spinner("Clip 1/1: working...") as sp:
+                self.assertIsNone(sp._thread)
+        self.assertEqual(buf.getvalue(), "")
+
+
+class KeywordCounterTests(unittest.TestCase):
+    def test_matches_naive_substring_count(self):
+        keywords = ["when i", "when we", "we were", "i was", "the reason", "reason"]
+        count = cli_mod._keyword_counter(keywords)
+        for text in ["", "when we were young", "the reason i was late", "reasonable", "hi wassup"]:
+            self.assertEqual(count(text), sum(1 for kw in keywords if kw in text), text)
+
+
+def _talk_segments(n=60):
+    lines = [
+        "Here's the thing about pricing.",
+        "Because most people actually get it wrong!",
+        "When we were starting, I was broke.",
+        "The reason is simple, we raised $2m at 40% dilution.",
+    ]
+    return [
+        {"start": i * 4.0, "end": i * 4.0 + 3.8, "text": lines[i % len(lines)],
+         "speaker": "A" if i % 3 else "B"}
+        for i in range(n)
+    ]
+
+
+class SuggestClipsTests(unittest.TestCase):
+    def test_selected_clips_do_not_overlap_heavily(self):
+        clips = cli_mod._suggest_clips(_talk_segments(), top_n=8)
+        self.assertTrue(clips)
+        for a in clips:
+            for b in clips:
+                if a is b:
+                    continue
+                overlap = min(a["end_second"], b["end_second"]) - max(a["start_second"], b["start_second"])
+                self.assertLessEqual(overlap, min(a["duration"], b["duration"]) * 0.3)
+
+    def test_results_are_time_ordered_and_capped(self):
+        clips = cli_mod._suggest_clips(_talk_segments(), top_n=3)
+        self.assertLessEqual(len(clips), 3)
+        starts = [c["start_second"] for c in clips]
+        self.assertEqual(starts, sorted(starts))
+
+
 if __name__ == "__main__":
     unittest.main()
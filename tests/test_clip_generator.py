@@ -221,6 +221,73 @@ class TransitionAutofixGatingTests(unittest.TestCase):
             self.assertEqual(cg._transition_autofix_passes(True), 2)
 
 
+class MoveIntoPlaceTests(unittest.TestCase):
+    def test_renames_within_a_filesystem(self):
+        with tempfile.TemporaryDirectory() as td:
+            src = os.path.join(td, "final.mp4")
+            dst = os.path.join(td, "out.mp4")
+            with open(src, "wb") as f:
+                f.write(b"clip")
+            cg._move_into_place(src, dst)
+            self.assertFalse(os.path.exists(src))
+            with open(dst, "rb") as f:
+                self.assertEqual(f.read(), b"clip")
+
+    def test_copies_across_filesystems(self):
+        with tempfile.TemporaryDirectory() as td:
+            src = os.path.join(td, "final.mp4")
+            dst = os.path.join(td, "out.mp4")
+            with open(src, "wb") as f:
+                f.write(b"clip")
+            with mock.patch.object(cg.os, "replace", side_effect=OSError(18, "EXDEV")):
+                cg._move_into_place(src, dst)
+            with open(dst, "rb") as f:
+                self.assertEqual(f.read(), b"clip")
+
+
+class WordsInRangeTests(unittest.TestCase):
+    def _scan(self, words, start, end):
+        return [w for w in words if w["end"] > start and w["start"] < end]
+
+    def test_matches_a_full_scan_including_long_words(self):
+        import random
+
+        rng = random.Random(7)
+        t, words = 0.0, []
+        for i in range(400):
+            t += rng.uniform(0.0, 0.6)
+            # Every 50th word stretches far past its neighbours.
+            dur = 8.0 if i % 50 == 0 else rng.uniform(0.05, 0.5)
+            words.append({"word": f"w{i}", "start": round(t, 3), "end": round(t + dur, 3)})
+        for _ in range(200):
+            a = rng.uniform(-1.0, t + 1.0)
+            b = a + rng.uniform(0.0, 30.0)
+            self.assertEqual(cg._words_in_range(words, a, b), self._scan(words, a, b))
+
+    def test_unordered_starts_fall_back_to_a_scan(self):
+        words = [
+            {"word": "late", "start": 5.0, "end": 5.5},
+            {"word": "early", "start": 1.0, "end": 1.5},
+        ]
+        self.assertIsNone(cg._time_index(words))
+        self.assertEqual(cg._words_in_range(words, 0.0, 2.0), [words[1]])
+
+    def test_index_is_rebuilt_when_the_list_grows(self):
+        words = [{"word": "a", "start": 0.0, "end": 0.5}]
+        self.assertEqual(cg._words_in_range(words, 0.0, 10.0), words)
+        words.append({"word": "b", "start": 1.0, "end": 1.5})
+        self.assertEqual(cg._words_in_range(words, 0.9, 10.0), [words[1]])
+
+    def test_snap_to_sentence_end_reaches_the_next_full_stop(self):
+        words = [
+            {"word": "we", "start": 0.0, "end": 0.4},
+            {"word": "kept", "start": 0.5, "end": 0.9},
+            {"word": "going.", "start": 1.0, "end": 1.4},
+            {"word": "Next", "start": 1.6, "end": 2.0},
+        ]
+        self.assertEqual(cg._snap_to_sentence_end(words, 0.0, 0.8), 1.4)
+
+
 class OutputPathReservationTests(unittest.TestCase):
     def setUp(self):
         self.tmpdir = tempfile.mkdtemp(prefix="podcli-output-test-")
@@ -264,5 +331,37 @@ class OutputPathReservationTests(unittest.TestCase):
         self.assertTrue(base.endswith("same_title_short-2"))
 
 
+class ExportRawClipsTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp(prefix="podcli-raw-test-")
+        self.addCleanup(shutil.rmtree, self.tmpdir, ignore_errors=True)
+        cg._reserved_output_paths.clear()
+        self.addCleanup(cg._reserved_output_paths.clear)
+        self.source = os.path.join(self.tmpdir, "src.mp4")
+        open(self.source, "wb").close()
+
+    def _touch(self, *paths):
+        for path in paths:
+            open(path, "wb").close()
+
+    def test_multi_range_clip_is_cut_to_its_segments(self):
+        clips = [
+            {"title": "one", "start_second": 1.0, "end_second": 5.0},
+            {"title": "two", "start_second": 10.0, "end_second": 40.0,
+             "segments": [{"start": 10.0, "end": 15.0}, {"start": 30.0, "end": 40.0}]},
+        ]
+        with mock.patch.object(cg, "copy_segments",
+                               side_effect=lambda src, cuts: self._touch(*(c[0] for c in cuts))) as copy, \
+             mock.patch.object(cg, "cut_multi_segment",
+                               side_effect=lambda src, out, segs: self._touch(out)) as multi:
+            results = cg.export_raw_clips(self.source, clips, self.tmpdir)
+
+        self.assertEqual([c[1:] for c in copy.call_args.args[1]], [(1.0, 5.0)])
+        self.assertEqual(multi.call_args.args[2],
+                         [{"start": 10.0, "end": 15.0}, {"start": 30.0, "end": 40.0}])
+        self.assertEqual([r["title"] for r in results], ["one", "two"])
+        self.assertEqual(results[1]["duration"], 15.0)
+
+
 if __name__ == "__main__":
     unittest.main()
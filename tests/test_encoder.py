@@ -65,6 +65,16 @@ class GetVideoEncodeFlagsTests(unittest.TestCase):
         ):
             self.assertEqual(encoder.get_video_encode_flags(), fake_flags)
 
+    def test_cpu_encodes_share_cores_during_a_render_pool(self):
+        x264 = encoder._get_encoder_flags("libx264")
+        nvenc = encoder._get_encoder_flags("h264_nvenc")
+        with mock.patch.object(encoder, "ffmpeg_threads", return_value=3):
+            with mock.patch.object(encoder, "detect_encoders", return_value={"best_flags": x264}):
+                self.assertEqual(encoder.get_video_encode_flags()[-2:], ["-threads", "3"])
+            with mock.patch.object(encoder, "detect_encoders", return_value={"best_flags": nvenc}):
+                self.assertEqual(encoder.get_video_encode_flags(), nvenc)
+        self.assertNotIn("-threads", x264)
+
     def test_falls_back_when_detect_encoders_raises(self):
         with mock.patch.object(encoder, "detect_encoders", side_effect=RuntimeError("boom")):
             flags = encoder.get_video_encode_flags()
@@ -73,6 +83,259 @@ class GetVideoEncodeFlagsTests(unittest.TestCase):
             self.assertIn("-crf", flags)
 
 
+class DetectEncodersTests(unittest.TestCase):
+    def setUp(self):
+        import tempfile
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.cache_path = os.path.join(tmpdir.name, "encoder.json")
+        patcher = mock.patch.object(encoder, "_encoder_cache_path", return_value=self.cache_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # Treat every candidate as built in; these tests are about the probes.
+        patcher = mock.patch.object(encoder, "_registered_encoders", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.dict(os.environ)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        os.environ.pop("PODCLI_PROBE_ALL", None)
+        os.environ.pop("PODCLI_VIDEO_CODEC", None)
+        encoder.detect_encoders.cache_clear()
+        self.addCleanup(encoder.detect_encoders.cache_clear)
+
+    def test_stops_probing_once_the_top_candidate_works(self):
+        with mock.patch.object(encoder.platform, "system", return_value="Windows"), \
+                mock.patch.object(encoder, "_test_encoder", return_value=True) as probe:
+            info = encoder.detect_encoders()
+        probe.assert_called_once_with("h264_nvenc")
+        self.assertEqual(info["available"], ["libx264", "h264_nvenc"])
+        self.assertEqual(info["best"], "h264_nvenc")
+
+    def test_probes_the_rest_when_the_top_candidate_fails(self):
+        with mock.patch.object(encoder.platform, "system", return_value="Windows"), \
+                mock.patch.object(encoder, "_test_encoder", side_effect=lambda e: e == "h264_qsv") as probe:
+            info = encoder.detect_encoders()
+        self.assertEqual(probe.call_count, 3)
+        self.assertEqual(info["best"], "h264_qsv")
+
+    def test_probe_all_tests_candidates_concurrently_and_keeps_priority(self):
+        import threading
+
+        os.environ["PODCLI_PROBE_ALL"] = "1"
+
+        barrier = threading.Barrier(3, timeout=5)
+
+        def probe(enc):
+            # Only returns if all three probes are in flight at once.
+            barrier.wait()
+            return enc != "h264_amf"
+
+        with mock.patch.object(encoder.platform, "system", return_value="Windows"), \
+                mock.patch.object(encoder, "_test_encoder", side_effect=probe):
+            info = encoder.detect_encoders()
+        self.assertEqual(info["available"], ["libx264", "h264_nvenc", "h264_qsv"])
+        self.assertEqual(info["best"], "h264_nvenc")
+
+    def test_hevc_preference_ranks_hevc_above_h264(self):
+        os.environ["PODCLI_VIDEO_CODEC"] = "hevc"
+        with mock.patch.object(encoder.platform, "system", return_value="Darwin"), \
+                mock.patch.object(encoder, "_test_encoder", return_value=True) as probe:
+            info = encoder.detect_encoders()
+        probe.assert_called_once_with("hevc_videotoolbox")
+        self.assertEqual(info["best"], "hevc_videotoolbox")
+        self.assertIn("hvc1", info["best_flags"])
+
+    def test_av1_preference_falls_back_through_hevc_to_h264(self):
+        os.environ["PODCLI_VIDEO_CODEC"] = "av1"
+        with mock.patch.object(encoder.platform, "system", return_value="Linux"), \
+                mock.patch.object(encoder, "_test_encoder", side_effect=lambda e: e.startswith("h264")) as probe:
+            info = encoder.detect_encoders()
+        self.assertEqual(
+            [c.args[0] for c in probe.call_args_list][:3], ["av1_nvenc", "av1_qsv", "hevc_nvenc"],
+        )
+        self.assertEqual(info["best"], "h264_nvenc")
+
+    def test_default_is_h264_only(self):
+        with mock.patch.object(encoder.platform, "system", return_value="Linux"), \
+                mock.patch.object(encoder, "_test_encoder", return_value=False) as probe:
+            info = encoder.detect_encoders()
+        self.assertEqual({c.args[0] for c in probe.call_args_list}, {"h264_nvenc", "h264_vaapi"})
+        self.assertEqual(info["best"], "libx264")
+
+    def test_persisted_result_is_ignored_after_codec_changes(self):
+        with mock.patch.object(encoder, "_test_encoder", return_value=False):
+            encoder.detect_encoders()
+        encoder.detect_encoders.cache_clear()
+        os.environ["PODCLI_VIDEO_CODEC"] = "hevc"
+        with mock.patch.object(encoder, "_test_encoder", return_value=False), \
+                mock.patch.object(encoder, "_probe_encoders", wraps=encoder._probe_encoders) as probe:
+            encoder.detect_encoders()
+        probe.assert_called_once()
+
+    def test_new_process_reads_persisted_result_without_probing(self):
+        with mock.patch.object(encoder.platform, "system", return_value="Linux"), \
+                mock.patch.object(encoder, "_test_encoder", side_effect=lambda e: e == "h264_vaapi"):
+            first = encoder.detect_encoders()
+        encoder.detect_encoders.cache_clear()  # as if in a fresh process
+        with mock.patch.object(encoder.platform, "system", return_value="Linux"), \
+                mock.patch.object(encoder, "_test_encoder") as probe:
+            second = encoder.detect_encoders()
+        probe.assert_not_called()
+        self.assertEqual(second, first)
+        self.assertEqual(second["best_flags"], encoder._get_encoder_flags("h264_vaapi"))
+
+    def test_partial_probe_is_not_reused_for_probe_all(self):
+        with mock.patch.object(encoder.platform, "system", return_value="Windows"), \
+                mock.patch.object(encoder, "_test_encoder", return_value=True):
+            encoder.detect_encoders()
+        encoder.detect_encoders.cache_clear()
+        os.environ["PODCLI_PROBE_ALL"] = "1"
+        with mock.patch.object(encoder.platform, "system", return_value="Windows"), \
+                mock.patch.object(encoder, "_test_encoder", return_value=True):
+            info = encoder.detect_encoders()
+        self.assertEqual(info["available"], ["libx264", "h264_nvenc", "h264_amf", "h264_qsv"])
+
+    def test_full_probe_is_reused_without_probe_all(self):
+        os.environ["PODCLI_PROBE_ALL"] = "1"
+        with mock.patch.object(encoder, "_test_encoder", return_value=False):
+            encoder.detect_encoders()
+        encoder.detect_encoders.cache_clear()
+        del os.environ["PODCLI_PROBE_ALL"]
+        with mock.patch.object(encoder, "_probe_encoders") as probe:
+            encoder.detect_encoders()
+        probe.assert_not_called()
+
+    def test_persisted_result_from_before_audio_detection_is_reprobed(self):
+        import json
+
+        with open(self.cache_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "fingerprint": encoder._ffmpeg_fingerprint(),
+                "system": encoder.platform.system(),
+                "release": encoder.platform.release(),
+                "codec": "h264",
+                "info": {"available": ["libx264"], "best": "libx264"},
+            }, f)
+        with mock.patch.object(encoder, "_test_encoder", return_value=False), \
+                mock.patch.object(encoder, "_probe_encoders", wraps=encoder._probe_encoders) as probe:
+            info = encoder.detect_encoders()
+        probe.assert_called_once()
+        self.assertIn("audio", info)
+
+    def test_threads_write_the_cache_through_separate_temp_files(self):
+        import threading
+
+        sources = []
+        real_replace = os.replace
+        barrier = threading.Barrier(2, timeout=5)
+
+        def replace(src, dst):
+            sources.append(src)
+            barrier.wait()
+            real_replace(src, dst)
+
+        with mock.patch.object(encoder.os, "replace", side_effect=replace):
+            threads = [threading.Thread(target=encoder._write_cached_info, args=({"best": "libx264"},))
+                       for _ in range(2)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        self.assertEqual(len(set(sources)), 2)
+        self.assertEqual(os.listdir(os.path.dirname(self.cache_path)), ["encoder.json"])
+
+    def test_persisted_result_is_ignored_after_ffmpeg_changes(self):
+        with mock.patch.object(encoder, "_ffmpeg_fingerprint", return_value="ffmpeg:1"), \
+                mock.patch.object(encoder, "_test_encoder", return_value=False):
+            encoder.detect_encoders()
+        encoder.detect_encoders.cache_clear()
+        with mock.patch.object(encoder, "_ffmpeg_fingerprint", return_value="ffmpeg:2"), \
+                mock.patch.object(encoder, "_test_encoder", return_value=False), \
+                mock.patch.object(encoder, "_probe_encoders", wraps=encoder._probe_encoders) as probe:
+            encoder.detect_encoders()
+        probe.assert_called_once()
+
+
+class TestEncoderProbeTests(unittest.TestCase):
+    def test_probe_encodes_video_only_and_cleans_up(self):
+        written = []
+
+        def fake_run(cmd, **kwargs):
+            out = cmd[-1]
+            with open(out, "wb") as f:
+                f.write(b"\0" * 200)
+            written.append(out)
+            return mock.Mock(returncode=0, stdout="", stderr="")
+
+        with mock.patch.object(encoder, "proc_run", side_effect=fake_run) as run:
+            self.assertTrue(encoder._test_encoder("h264_nvenc"))
+        cmd = run.call_args.args[0]
+        self.assertNotIn("anullsrc=r=44100:cl=mono", cmd)
+        self.assertNotIn("-c:a", cmd)
+        self.assertIn("h264_nvenc", cmd)
+        self.assertFalse(os.path.exists(written[0]))
+
+    def test_failed_encode_is_unavailable(self):
+        with mock.patch.object(
+            encoder, "proc_run", return_value=mock.Mock(returncode=1, stdout="", stderr="no device"),
+        ):
+            self.assertFalse(encoder._test_encoder("h264_qsv"))
+
+
+class RegisteredEncodersTests(unittest.TestCase):
+    LISTING = (
+        "Encoders:\n"
+        " V..... = Video\n"
+        " ------\n"
+        " V....D libx264              libx264 H.264 / AVC (codec h264)\n"
+        " V....D h264_nvenc           NVIDIA NVENC H.264 encoder (codec h264)\n"
+        " A....D aac                  AAC (Advanced Audio Coding)\n"
+    )
+
+    def _run(self, stdout, returncode=0):
+        return mock.patch.object(
+            encoder, "proc_run", return_value=mock.Mock(returncode=returncode, stdout=stdout),
+        )
+
+    def test_parses_names_after_the_legend(self):
+        with self._run(self.LISTING):
+            self.assertEqual(encoder._registered_encoders(), {"libx264", "h264_nvenc", "aac"})
+
+    def test_unreadable_listing_is_unknown(self):
+        with self._run("", returncode=1):
+            self.assertIsNone(encoder._registered_encoders())
+        with mock.patch.object(encoder, "proc_run", side_effect=FileNotFoundError):
+            self.assertIsNone(encoder._registered_encoders())
+
+    def test_unregistered_candidates_are_not_test_encoded(self):
+        with mock.patch.object(encoder.platform, "system", return_value="Windows"), \
+                mock.patch.object(encoder, "_registered_encoders", return_value={"libx264", "h264_nvenc"}), \
+                mock.patch.object(encoder, "_test_encoder", return_value=True) as probe:
+            info = encoder._probe_encoders()
+        probe.assert_called_once_with("h264_nvenc")
+        self.assertEqual(info["available"], ["libx264", "h264_nvenc"])
+
+
+class GetAudioEncodeFlagsTests(unittest.TestCase):
+    def test_prefers_fdk_aac_when_built_in(self):
+        with mock.patch.object(encoder.platform, "system", return_value="Linux"), \
+                mock.patch.object(encoder, "_registered_encoders", return_value={"libx264", "aac", "libfdk_aac"}), \
+                mock.patch.object(encoder, "_test_encoder", return_value=False):
+            info = encoder._probe_encoders()
+        self.assertEqual(info["audio"], "libfdk_aac")
+        with mock.patch.object(encoder, "detect_encoders", return_value=info):
+            self.assertEqual(encoder.get_audio_encode_flags()[:2], ["-c:a", "libfdk_aac"])
+
+    def test_native_aac_otherwise(self):
+        for info in ({"audio": "aac"}, {}):
+            with mock.patch.object(encoder, "detect_encoders", return_value=info):
+                self.assertEqual(encoder.get_audio_encode_flags(),
+                                 ["-c:a", "aac", "-b:a", "192k", "-ar", "44100"])
+        with mock.patch.object(encoder, "detect_encoders", side_effect=RuntimeError("boom")):
+            self.assertEqual(encoder.get_audio_encode_flags()[1], "aac")
+
+
 class GetEncoderInfoTests(unittest.TestCase):
     def setUp(self):
         # Isolate the on-disk cache so each test exercises detect_encoders directly.
@@ -108,5 +371,30 @@ class GetEncoderInfoTests(unittest.TestCase):
             self.assertEqual(detect.call_count, 1)
 
 
+class GpuScaledCommandTests(unittest.TestCase):
+    BEFORE = ["ffmpeg", "-y", "-i", "in.mp4", "-vf", "crop=607:1080:x='if(gte(t\\,1.000)\\,400\\,80)':y=0,scale=1080:1920"]
+
+    def test_nvenc_scales_on_cuda_after_the_cpu_crop(self):
+        cmd = encoder.gpu_scaled_command(self.BEFORE, encoder._get_encoder_flags("h264_nvenc"))
+        vf = cmd[cmd.index("-vf") + 1]
+        self.assertTrue(vf.startswith("crop=607:1080:x="))
+        self.assertTrue(vf.endswith(",hwupload_cuda,scale_cuda=1080:1920"))
+        self.assertEqual(cmd[:6], ["ffmpeg", "-hwaccel", "cuda", "-y", "-i", "in.mp4"])
+
+    def test_vaapi_uploads_nv12_and_names_the_device(self):
+        with mock.patch.dict(os.environ, {"PODCLI_VAAPI_DEVICE": "/dev/dri/renderD129"}):
+            cmd = encoder.gpu_scaled_command(self.BEFORE, encoder._get_encoder_flags("h264_vaapi"))
+        self.assertEqual(cmd[1:3], ["-vaapi_device", "/dev/dri/renderD129"])
+        self.assertTrue(cmd[cmd.index("-vf") + 1].endswith(",format=nv12,hwupload,scale_vaapi=1080:1920"))
+
+    def test_cpu_encoders_and_other_chains_are_left_alone(self):
+        self.assertIsNone(encoder.gpu_scaled_command(self.BEFORE, encoder._get_encoder_flags("libx264")))
+        self.assertIsNone(encoder.gpu_scaled_command(self.BEFORE, encoder._get_encoder_flags("h264_videotoolbox")))
+        padded = ["ffmpeg", "-y", "-i", "in.mp4", "-vf", "scale=1080:-2,pad=1080:1920:0:0:black"]
+        self.assertIsNone(encoder.gpu_scaled_command(padded, encoder._get_encoder_flags("h264_nvenc")))
+        graph = ["ffmpeg", "-y", "-i", "in.mp4", "-filter_complex", "[0:v]scale=1080:1920[v]"]
+        self.assertIsNone(encoder.gpu_scaled_command(graph, encoder._get_encoder_flags("h264_nvenc")))
+
+
 if __name__ == "__main__":
     unittest.main()
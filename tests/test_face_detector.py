@@ -0,0 +1,76 @@
+"""Tests for backend.services.face_detector detector reuse."""
+
+import os
+import sys
+import threading
+import unittest
+from unittest import mock
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+BACKEND_ROOT = os.path.join(ROOT, "backend")
+if BACKEND_ROOT not in sys.path:
+    sys.path.insert(0, BACKEND_ROOT)
+
+from services import face_detector as fd
+
+
+class CreateDetectorTests(unittest.TestCase):
+    def setUp(self):
+        self.cv2 = mock.MagicMock()
+        self.cv2.FaceDetectorYN.create.side_effect = lambda **kw: object()
+        patcher = mock.patch.dict(sys.modules, {"cv2": self.cv2})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(fd.os.path, "exists", return_value=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        fd._local.__dict__.clear()
+        self.addCleanup(fd._local.__dict__.clear)
+
+    def test_same_size_reuses_the_detector_on_this_thread(self):
+        first = fd.create_detector(1920, 1080)
+        self.assertIs(fd.create_detector(1920, 1080)[0], first[0])
+        self.assertIsNot(fd.create_detector(1080, 1920)[0], first[0])
+        self.assertEqual(self.cv2.FaceDetectorYN.create.call_count, 2)
+
+    def test_other_threads_get_their_own_detector(self):
+        mine = fd.create_detector(1920, 1080)[0]
+        theirs = []
+        t = threading.Thread(target=lambda: theirs.append(fd.create_detector(1920, 1080)[0]))
+        t.start()
+        t.join()
+        self.assertIsNot(theirs[0], mine)
+
+    def test_cuda_backend_is_opt_in_and_needs_a_device(self):
+        self.cv2.cuda.getCudaEnabledDeviceCount.return_value = 1
+        with mock.patch.dict(os.environ, {"PODCLI_FACE_BACKEND": ""}):
+            fd.create_detector(1920, 1080)
+        self.assertNotIn("backend_id", self.cv2.FaceDetectorYN.create.call_args.kwargs)
+
+        with mock.patch.dict(os.environ, {"PODCLI_FACE_BACKEND": "cuda"}):
+            fd.create_detector(1920, 1080)
+            kwargs = self.cv2.FaceDetectorYN.create.call_args.kwargs
+            self.assertEqual(kwargs["backend_id"], self.cv2.dnn.DNN_BACKEND_CUDA)
+            self.assertEqual(kwargs["target_id"], self.cv2.dnn.DNN_TARGET_CUDA)
+
+            self.cv2.cuda.getCudaEnabledDeviceCount.return_value = 0
+            fd._local.__dict__.clear()
+            fd.create_detector(1920, 1080)
+            self.assertNotIn("backend_id", self.cv2.FaceDetectorYN.create.call_args.kwargs)
+
+    def test_opencl_backend_needs_an_opencl_device(self):
+        self.cv2.ocl.haveOpenCL.return_value = True
+        with mock.patch.dict(os.environ, {"PODCLI_FACE_BACKEND": "opencl"}):
+            fd.create_detector(1920, 1080)
+            kwargs = self.cv2.FaceDetectorYN.create.call_args.kwargs
+            self.assertEqual(kwargs["backend_id"], self.cv2.dnn.DNN_BACKEND_OPENCV)
+            self.assertEqual(kwargs["target_id"], self.cv2.dnn.DNN_TARGET_OPENCL)
+
+            self.cv2.ocl.haveOpenCL.return_value = False
+            fd._local.__dict__.clear()
+            fd.create_detector(1920, 1080)
+            self.assertNotIn("backend_id", self.cv2.FaceDetectorYN.create.call_args.kwargs)
+
+
+if __name__ == "__main__":
+    unittest.main()
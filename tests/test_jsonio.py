@@ -0,0 +1,67 @@
+"""Tests for backend.utils.jsonio — orjson fast path and stdlib fallback."""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+BACKEND_ROOT = os.path.join(ROOT, "backend")
+if BACKEND_ROOT not in sys.path:
+    sys.path.insert(0, BACKEND_ROOT)
+
+from utils import jsonio
+
+
+PAYLOAD = {"words": [{"word": "héllo", "start": 0.0, "end": 0.5}], "n": 3, "ok": True, "none": None}
+
+
+class JsonIoTests(unittest.TestCase):
+    def _both_backends(self):
+        yield "default"
+        with mock.patch.object(jsonio, "orjson", None):
+            yield "stdlib"
+
+    def test_round_trip_on_both_backends(self):
+        for backend in self._both_backends():
+            with self.subTest(backend=backend):
+                self.assertEqual(jsonio.loads(jsonio.dumps(PAYLOAD)), PAYLOAD)
+                self.assertEqual(jsonio.loads(jsonio.dumps(PAYLOAD).encode("utf-8")), PAYLOAD)
+
+    def test_indent_produces_multiline_output(self):
+        for backend in self._both_backends():
+            with self.subTest(backend=backend):
+                self.assertIn("\n  ", jsonio.dumps(PAYLOAD, indent=True))
+
+    def test_invalid_json_raises_json_decode_error(self):
+        for backend in self._both_backends():
+            with self.subTest(backend=backend):
+                with self.assertRaises(json.JSONDecodeError):
+                    jsonio.loads("{not json")
+
+    def test_nan_literal_falls_back_to_stdlib(self):
+        value = jsonio.loads('{"rms": NaN}')["rms"]
+        self.assertNotEqual(value, value)
+
+    def test_numpy_values_serialize(self):
+        import numpy as np
+
+        for backend in self._both_backends():
+            with self.subTest(backend=backend):
+                out = jsonio.loads(jsonio.dumps({"rms": np.float64(-20.5), "n": 2}))
+                self.assertEqual(out, {"rms": -20.5, "n": 2})
+
+    def test_non_string_keys_match_stdlib(self):
+        self.assertEqual(jsonio.loads(jsonio.dumps({1: "a"})), {"1": "a"})
+
+    def test_file_helpers(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "p.json")
+            jsonio.dump_file(PAYLOAD, path, indent=True)
+            self.assertEqual(jsonio.load_file(path), PAYLOAD)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -145,5 +145,70 @@ class VideoProcessorReExportsTests(unittest.TestCase):
         self.assertEqual(vp._FFMPEG_TIMEOUT, media_probe.FFMPEG_TIMEOUT)
 
 
+class RunFfmpegWithFallbackTests(unittest.TestCase):
+    BEFORE = ["ffmpeg", "-y", "-i", "in.mp4", "-vf", "crop=607:1080:0:0,scale=1080:1920"]
+    NVENC = ["-c:v", "h264_nvenc", "-preset", "p6", "-cq", "18"]
+
+    def _run(self, returncodes):
+        results = [mock.Mock(returncode=rc, stdout="", stderr="err") for rc in returncodes]
+        with mock.patch.object(media_probe, "get_video_encode_flags", return_value=self.NVENC), \
+             mock.patch.object(media_probe, "proc_run", side_effect=results) as run, \
+             mock.patch("sys.stderr"):
+            media_probe.run_ffmpeg_with_fallback(self.BEFORE, ["-c:a", "aac"], "out.mp4")
+        return [c.args[0] for c in run.call_args_list]
+
+    def test_gpu_scaling_is_tried_first(self):
+        cmds = self._run([0])
+        self.assertIn("scale_cuda=1080:1920", " ".join(cmds[0]))
+
+    def test_gpu_scaling_failure_retries_the_cpu_chain_on_the_same_encoder(self):
+        cmds = self._run([1, 0])
+        self.assertEqual(len(cmds), 2)
+        self.assertIn("crop=607:1080:0:0,scale=1080:1920", cmds[1])
+        self.assertIn("h264_nvenc", cmds[1])
+
+
+class GetVideoInfoCacheTests(unittest.TestCase):
+    def setUp(self):
+        import tempfile
+        media_probe._probe_json.cache_clear()
+        self.addCleanup(media_probe._probe_json.cache_clear)
+        tmp = tempfile.NamedTemporaryFile(suffix=".mp4", delete=False)
+        tmp.write(b"v1")
+        tmp.close()
+        self.path = tmp.name
+        self.addCleanup(os.unlink, self.path)
+
+    def _probe(self):
+        out = '{"streams": [{"codec_type": "video", "width": 1920, "height": 1080}]}'
+        return mock.patch.object(
+            media_probe, "proc_run", return_value=mock.Mock(returncode=0, stdout=out, stderr=""),
+        )
+
+    def test_same_file_is_probed_once(self):
+        with self._probe() as run:
+            self.assertEqual(media_probe.get_dimensions(self.path), (1920, 1080))
+            info = media_probe.get_video_info(self.path)
+            info["streams"].clear()  # callers get their own copy
+            self.assertEqual(media_probe.get_dimensions(self.path), (1920, 1080))
+        run.assert_called_once()
+
+    def test_rewritten_file_is_probed_again(self):
+        with self._probe() as run:
+            media_probe.get_video_info(self.path)
+            with open(self.path, "wb") as f:
+                f.write(b"version 2")
+            media_probe.get_video_info(self.path)
+        self.assertEqual(run.call_count, 2)
+
+    def test_failed_probe_is_not_cached(self):
+        fail = mock.Mock(returncode=1, stdout="", stderr="moov atom not found")
+        with mock.patch.object(media_probe, "proc_run", return_value=fail):
+            with self.assertRaises(RuntimeError):
+                media_probe.get_video_info(self.path)
+        with self._probe():
+            self.assertEqual(media_probe.get_dimensions(self.path), (1920, 1080))
+
+
 if __name__ == "__main__":
     unittest.main()
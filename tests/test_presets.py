@@ -49,6 +49,25 @@ class PresetsTests(unittest.TestCase):
         self.assertEqual(loaded["crop_strategy"], presets.DEFAULT_PRESET["crop_strategy"])
         self.assertEqual(loaded["whisper_model"], presets.DEFAULT_PRESET["whisper_model"])
 
+    def test_repeat_get_skips_reparse(self):
+        presets.save_preset("cached", {"caption_style": "karaoke"})
+        presets.get_preset("cached")
+        with mock.patch.object(presets.jsonio, "load_file", side_effect=AssertionError("re-parsed")):
+            self.assertEqual(presets.get_preset("cached")["caption_style"], "karaoke")
+
+    def test_external_edit_is_picked_up(self):
+        path = presets.save_preset("edited", {"top_clips": 3})
+        self.assertEqual(presets.get_preset("edited")["top_clips"], 3)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"top_clips": 12, "caption_style": "subtle"}, f)
+        self.assertEqual(presets.get_preset("edited")["top_clips"], 12)
+
+    def test_cached_nested_values_are_not_shared(self):
+        presets.save_preset("nested", {"corrections": {"pod cast": "podcast"}})
+        first = presets.get_preset("nested")
+        first["corrections"]["mutated"] = "yes"
+        self.assertNotIn("mutated", presets.get_preset("nested")["corrections"])
+
     def test_get_preset_default_returns_copy(self):
         # "default" is special — returns a fresh copy of DEFAULT_PRESET
         d = presets.get_preset("default")
@@ -94,6 +113,55 @@ class PresetsTests(unittest.TestCase):
         names = {p["name"] for p in listing}
         self.assertEqual(names, {"good"})
 
+    def test_cold_listing_reads_the_index_only(self):
+        presets.save_preset("one", {"caption_style": "a"})
+        presets.save_preset("two", {"caption_style": "b"})
+        presets._cache.clear()
+        real_load = presets.jsonio.load_file
+
+        def only_index(path):
+            self.assertEqual(os.path.basename(path), presets._INDEX_FILE)
+            return real_load(path)
+
+        with mock.patch.object(presets.jsonio, "load_file", side_effect=only_index):
+            listing = presets.list_presets()
+        self.assertEqual([p["name"] for p in listing], ["one", "two"])
+        self.assertEqual(listing[1]["caption_style"], "b")
+
+    def test_index_entry_for_hand_edited_preset_is_ignored(self):
+        path = presets.save_preset("edited", {"top_clips": 3})
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"top_clips": 12}, f)
+        presets._cache.clear()
+        self.assertEqual(presets.list_presets()[0]["top_clips"], 12)
+
+    def test_index_is_not_listed_and_tracks_deletes(self):
+        presets.save_preset("goner", {"caption_style": "x"})
+        presets.delete_preset("goner")
+        self.assertEqual(presets.list_presets(), [])
+        self.assertNotIn("goner", presets._read_index())
+
+    def test_preset_named_like_the_index_is_kept_apart(self):
+        presets.save_preset("_index", {"caption_style": "x"})
+        presets.save_preset("other", {"caption_style": "y"})
+        presets._cache.clear()
+        listing = presets.list_presets()
+        self.assertEqual([p["name"] for p in listing], ["_index", "other"])
+        self.assertEqual(presets.get_preset("_index")["caption_style"], "x")
+
+    def test_dot_names_are_rejected(self):
+        with self.assertRaises(ValueError):
+            presets.save_preset(".index", {})
+
+    def test_corrupt_preset_does_not_rewrite_the_index_each_listing(self):
+        presets.save_preset("good", {"caption_style": "a"})
+        with open(os.path.join(self.tmpdir, "bad.json"), "w") as f:
+            f.write("{not valid")
+        presets.list_presets()
+        with mock.patch.object(presets, "_write_index") as write:
+            self.assertEqual([p["name"] for p in presets.list_presets()], ["good"])
+        write.assert_not_called()
+
     def test_delete_preset_existing(self):
         presets.save_preset("goner", {"caption_style": "x"})
         self.assertTrue(presets.delete_preset("goner"))
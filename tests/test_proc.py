@@ -6,7 +6,9 @@ ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
 
-from backend.utils.proc import ProcError, run
+from backend.utils.proc import (
+    ProcError, ffmpeg_threads, render_pool, run, stream_chunks, stream_lines, usable_cpus,
+)
 
 
 class ProcTests(unittest.TestCase):
@@ -35,6 +37,82 @@ class ProcTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             run([], timeout=1)
 
+    def test_run_without_output_keeps_stderr_tail(self):
+        script = "echo out; head -c 10000 /dev/zero | tr '\\0' x 1>&2; echo END 1>&2; exit 2"
+        result = run(["sh", "-c", script], timeout=5, check=False, output=False)
+        self.assertEqual(result.returncode, 2)
+        self.assertEqual(result.stdout, "")
+        self.assertTrue(result.stderr.endswith("END\n"))
+        self.assertLessEqual(len(result.stderr), 4096)
+
+    def test_run_without_output_times_out_with_stderr_tail(self):
+        with self.assertRaises(ProcError) as ctx:
+            run(["sh", "-c", "echo started 1>&2; exec sleep 5"], timeout=0.3, output=False)
+        self.assertEqual(ctx.exception.returncode, -1)
+        self.assertIn("started", ctx.exception.stderr)
+
+    def test_run_without_output_feeds_input(self):
+        result = run(["sh", "-c", "cat 1>&2"], timeout=5, input_text="hello", output=False)
+        self.assertEqual(result.stderr, "hello")
+
+
+class StreamLinesTests(unittest.TestCase):
+    def test_yields_stdout_lines(self):
+        lines = list(stream_lines(["sh", "-c", "echo a; echo b 1>&2; echo c"], timeout=5))
+        self.assertEqual(lines, ["a\n", "c\n"])
+
+    def test_can_stream_stderr(self):
+        lines = list(stream_lines(["sh", "-c", "echo a; echo b 1>&2"], timeout=5, stderr=True))
+        self.assertEqual(lines, ["b\n"])
+
+    def test_timeout_raises_after_the_partial_output(self):
+        lines = []
+        with self.assertRaises(ProcError) as ctx:
+            for line in stream_lines(["sh", "-c", "echo first; exec sleep 5"], timeout=0.3):
+                lines.append(line)
+        self.assertEqual(lines, ["first\n"])
+        self.assertEqual(ctx.exception.returncode, -1)
+
+    def test_nonzero_exit_raises(self):
+        with self.assertRaises(ProcError) as ctx:
+            list(stream_chunks(["sh", "-c", "printf ab; exit 3"], timeout=5, chunk_size=4))
+        self.assertEqual(ctx.exception.returncode, 3)
+
+    def test_stopping_early_is_not_an_error(self):
+        lines = stream_lines(["sh", "-c", "echo a; echo b; exec sleep 5"], timeout=5)
+        self.assertEqual(next(lines), "a\n")
+        lines.close()
+
+    def test_empty_cmd_rejected(self):
+        with self.assertRaises(ValueError):
+            list(stream_lines([], timeout=1))
+
+    def test_chunks_are_fixed_size_bytes(self):
+        chunks = list(stream_chunks(["sh", "-c", "printf abcdefg"], timeout=5, chunk_size=3))
+        self.assertEqual(chunks, [b"abc", b"def", b"g"])
+
+
+class RenderPoolTests(unittest.TestCase):
+    def test_threads_are_split_only_while_renders_overlap(self):
+        from unittest import mock
+
+        with mock.patch("os.sched_getaffinity", return_value=set(range(8)), create=True):
+            self.assertIsNone(ffmpeg_threads())
+            with render_pool(2):
+                self.assertEqual(ffmpeg_threads(), 4)
+                with render_pool(2):
+                    self.assertEqual(ffmpeg_threads(), 2)
+            self.assertIsNone(ffmpeg_threads())
+
+    def test_usable_cpus_follows_the_affinity_mask(self):
+        from unittest import mock
+
+        with mock.patch("os.sched_getaffinity", return_value={0, 1}, create=True), \
+             mock.patch("os.cpu_count", return_value=64):
+            self.assertEqual(usable_cpus(), 2)
+            with render_pool(2):
+                self.assertEqual(ffmpeg_threads(), 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,14 +2,17 @@
 
 import os
 import sys
+import types
 import unittest
+from unittest import mock
 
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 BACKEND_ROOT = os.path.join(ROOT, "backend")
 if BACKEND_ROOT not in sys.path:
     sys.path.insert(0, BACKEND_ROOT)
 
-from services.speaker_detection import assign_speakers_to_words
+from services import speaker_detection
+from services.speaker_detection import assign_speakers_to_segments, assign_speakers_to_words
 
 
 class AssignSpeakersToWordsTests(unittest.TestCase):
@@ -50,6 +53,16 @@ class AssignSpeakersToWordsTests(unittest.TestCase):
         out = assign_speakers_to_words(words, segments)
         self.assertEqual(out[0]["speaker"], "SPEAKER_01")
 
+    def test_zero_length_word_on_a_turn_end_uses_first_containing_turn(self):
+        words = [{"word": "uh", "start": 12.0, "end": 12.0}]
+        segments = [
+            {"speaker": "SPEAKER_00", "start": 0.0, "end": 20.0},
+            {"speaker": "SPEAKER_01", "start": 5.0, "end": 12.0},
+            {"speaker": "SPEAKER_02", "start": 12.0, "end": 14.0},
+        ]
+        out = assign_speakers_to_words(words, segments)
+        self.assertEqual(out[0]["speaker"], "SPEAKER_00")
+
     def test_word_outside_all_segments_is_none(self):
         words = [{"word": "hm", "start": 50.0, "end": 50.4}]
         segments = [{"speaker": "SPEAKER_00", "start": 0.0, "end": 10.0}]
@@ -57,5 +70,67 @@ class AssignSpeakersToWordsTests(unittest.TestCase):
         self.assertIsNone(out[0]["speaker"])
 
 
+class AssignSpeakersToSegmentsTests(unittest.TestCase):
+    def test_long_crosstalk_turn_still_counts(self):
+        # SPEAKER_00's long turn starts before the short one but outlasts it,
+        # so it overlaps a segment that begins after the short turn ends.
+        segments = [{"start": 20.0, "end": 22.0}]
+        turns = [
+            {"speaker": "SPEAKER_00", "start": 0.0, "end": 30.0},
+            {"speaker": "SPEAKER_01", "start": 5.0, "end": 6.0},
+            {"speaker": "SPEAKER_01", "start": 21.5, "end": 40.0},
+        ]
+        out = assign_speakers_to_segments(segments, turns)
+        self.assertEqual(out[0]["speaker"], "SPEAKER_00")
+
+    def test_segment_between_turns_is_none(self):
+        segments = [{"start": 6.0, "end": 7.0}]
+        turns = [
+            {"speaker": "SPEAKER_00", "start": 0.0, "end": 5.0},
+            {"speaker": "SPEAKER_01", "start": 8.0, "end": 9.0},
+        ]
+        self.assertIsNone(assign_speakers_to_segments(segments, turns)[0]["speaker"])
+
+    def test_out_of_order_turns_are_scanned_in_full(self):
+        segments = [{"start": 1.0, "end": 2.0}]
+        turns = [
+            {"speaker": "SPEAKER_01", "start": 8.0, "end": 9.0},
+            {"speaker": "SPEAKER_00", "start": 0.0, "end": 5.0},
+        ]
+        self.assertEqual(assign_speakers_to_segments(segments, turns)[0]["speaker"], "SPEAKER_00")
+
+
+class LoadPipelineTests(unittest.TestCase):
+    def setUp(self):
+        speaker_detection._load_pipeline.cache_clear()
+        self.addCleanup(speaker_detection._load_pipeline.cache_clear)
+        self.from_pretrained = mock.Mock(side_effect=lambda *a, **k: mock.Mock())
+        pyannote = types.ModuleType("pyannote")
+        audio = types.ModuleType("pyannote.audio")
+        audio.Pipeline = mock.Mock(from_pretrained=self.from_pretrained)
+        pyannote.audio = audio
+        torch = types.ModuleType("torch")
+        torch.cuda = mock.Mock(is_available=mock.Mock(return_value=False))
+        torch.backends = types.SimpleNamespace()
+        modules = mock.patch.dict(sys.modules, {
+            "pyannote": pyannote, "pyannote.audio": audio, "torch": torch,
+        })
+        modules.start()
+        self.addCleanup(modules.stop)
+
+    def test_pipeline_is_loaded_once_per_token(self):
+        first = speaker_detection._load_pipeline("hf_a")
+        self.assertIs(speaker_detection._load_pipeline("hf_a"), first)
+        self.assertEqual(first[1], "cpu")
+        speaker_detection._load_pipeline("hf_b")
+        self.assertEqual(self.from_pretrained.call_count, 2)
+
+    def test_unload_forces_a_reload(self):
+        speaker_detection._load_pipeline("hf_a")
+        speaker_detection.unload_pipeline()
+        speaker_detection._load_pipeline("hf_a")
+        self.assertEqual(self.from_pretrained.call_count, 2)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,27 @@
+"""Tests for backend.utils.timing_utils timestamp formatting."""
+
+import os
+import sys
+import unittest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+BACKEND_ROOT = os.path.join(ROOT, "backend")
+if BACKEND_ROOT not in sys.path:
+    sys.path.insert(0, BACKEND_ROOT)
+
+from utils.timing_utils import seconds_to_ass
+
+
+class SecondsToAssTests(unittest.TestCase):
+    def test_formats_hours_minutes_and_centiseconds(self):
+        self.assertEqual(seconds_to_ass(0.0), "0:00:00.00")
+        self.assertEqual(seconds_to_ass(3723.456), "1:02:03.46")
+
+    def test_rounding_up_to_a_whole_minute_carries(self):
+        self.assertEqual(seconds_to_ass(59.996), "0:01:00.00")
+        self.assertEqual(seconds_to_ass(3599.999), "1:00:00.00")
+        self.assertEqual(seconds_to_ass(59.994), "0:00:59.99")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,9 @@
+import hashlib
 import os
 import sys
+import tempfile
 import unittest
+from unittest import mock
 
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 BACKEND_ROOT = os.path.join(ROOT, "backend")
@@ -44,6 +47,14 @@ class EngineNamespacedCacheTests(unittest.TestCase):
                 f"engine {v!r} not namespaced",
             )
 
+    def test_faster_whisper_is_namespaced(self):
+        for v in ("faster-whisper", "faster_whisper", "faster"):
+            os.environ["PODCLI_ENGINE"] = v
+            self.assertTrue(
+                tp.transcript_json_path("abc123").endswith("abc123-faster-whisper.json"),
+                f"engine {v!r} not namespaced",
+            )
+
     def test_engines_do_not_collide(self):
         os.environ.pop("PODCLI_ENGINE", None)
         py = tp.transcript_json_path("abc123")
@@ -56,5 +67,29 @@ class EngineNamespacedCacheTests(unittest.TestCase):
         self.assertNotEqual(cpp, aai)
 
 
+class CacheHashTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.video = os.path.join(tmp.name, "episode.mp4")
+        with open(self.video, "wb") as f:
+            f.write(b"fake video bytes")
+
+    def test_key_matches_ts_scheme(self):
+        expected = hashlib.sha256(b"fake video bytes" + b"size:16").hexdigest()[:16]
+        self.assertEqual(tp.compute_cache_hash(self.video), expected)
+
+    def test_repeat_lookups_read_the_file_once(self):
+        first = tp.compute_cache_hash(self.video)
+        with mock.patch("builtins.open", side_effect=AssertionError("re-read")):
+            self.assertEqual(tp.compute_cache_hash(self.video), first)
+
+    def test_changed_file_is_rehashed(self):
+        first = tp.compute_cache_hash(self.video)
+        with open(self.video, "wb") as f:
+            f.write(b"other video bytes, longer")
+        self.assertNotEqual(tp.compute_cache_hash(self.video), first)
+
+
 if __name__ == "__main__":
     unittest.main()
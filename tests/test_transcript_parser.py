@@ -135,6 +135,11 @@ class SpeakerTranscriptTests(unittest.TestCase):
         # First word start near 3600s
         self.assertGreaterEqual(result["words"][0]["start"], 3600.0 - 1.0)
 
+    def test_block_text_drops_markers_and_collapses_whitespace(self):
+        raw = "Alice (00:00)\n  so ⁓ we\tstarted⁓\n\nthere ⁓⁓  \nBob (00:05)\n⁓\n"
+        result = tp.parse_speaker_transcript(raw, total_duration=10.0)
+        self.assertEqual([s["text"] for s in result["segments"]], ["so we started there"])
+
 
 if __name__ == "__main__":
     unittest.main()
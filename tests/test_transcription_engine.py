@@ -73,6 +73,39 @@ class TranscriptionEngineTests(unittest.TestCase):
         with self.assertRaises(RuntimeError):
             tr.transcribe_file(self._tmp.name, model_size="base", enable_diarization=False)
 
+    def test_explicit_faster_whisper_shares_post_processing(self):
+        os.environ["PODCLI_ENGINE"] = "faster-whisper"
+        fake = {
+            "text": " Hello there.",
+            "segments": [{"id": 0, "start": 0.0, "end": 1.2, "text": " Hello there.",
+                          "words": [{"word": " Hello", "start": 0.0, "end": 0.5, "probability": 0.9},
+                                    {"word": " there.", "start": 0.5, "end": 1.2, "probability": 0.8}]}],
+            "duration": 1.2,
+            "language": "en",
+        }
+        orig = tr._transcribe_with_faster_whisper
+        tr._transcribe_with_faster_whisper = lambda *a, **k: fake
+        try:
+            result = tr.transcribe_file(self._tmp.name, model_size="base", enable_diarization=False)
+        finally:
+            tr._transcribe_with_faster_whisper = orig
+        self.assertEqual(result["engine"], "faster-whisper")
+        self.assertEqual(result["segments"][0]["text"], "Hello there.")
+        self.assertEqual([w["word"] for w in result["words"]], ["Hello", "there."])
+
+    def test_faster_whisper_missing_package_errors(self):
+        os.environ["PODCLI_ENGINE"] = "faster-whisper"
+        had = sys.modules.get("faster_whisper", "__absent__")
+        sys.modules["faster_whisper"] = None
+        try:
+            with self.assertRaises(RuntimeError):
+                tr.transcribe_file(self._tmp.name, model_size="base", enable_diarization=False)
+        finally:
+            if had == "__absent__":
+                sys.modules.pop("faster_whisper", None)
+            else:
+                sys.modules["faster_whisper"] = had
+
     def test_no_fallback_when_whispercpp_unavailable(self):
         os.environ.pop("PODCLI_ENGINE", None)
         tr._whispercpp_ready = lambda size: False
@@ -80,5 +113,122 @@ class TranscriptionEngineTests(unittest.TestCase):
             tr.transcribe_file(self._tmp.name, model_size="base", enable_diarization=False)
 
 
+class ModelCacheTests(unittest.TestCase):
+    def setUp(self):
+        tr._load_whisper_model.cache_clear()
+        self.addCleanup(tr._load_whisper_model.cache_clear)
+
+    def test_whisper_model_is_loaded_once_per_size(self):
+        import types
+        from unittest import mock
+
+        fake = types.ModuleType("whisper")
+        fake.load_model = mock.Mock(side_effect=lambda size: object())
+        with mock.patch.dict(sys.modules, {"whisper": fake}):
+            first = tr._load_whisper_model("base")
+            self.assertIs(tr._load_whisper_model("base"), first)
+            tr._load_whisper_model("small")
+        self.assertEqual(fake.load_model.call_count, 2)
+
+    def test_failed_import_is_not_cached(self):
+        from unittest import mock
+
+        with mock.patch.dict(sys.modules, {"whisper": None}):
+            with self.assertRaises(ImportError):
+                tr._load_whisper_model("base")
+        self.assertEqual(tr._load_whisper_model.cache_info().currsize, 0)
+
+
+class ParallelDiarizationTests(unittest.TestCase):
+    def setUp(self):
+        tr._load_whisper_model.cache_clear()
+        self.addCleanup(tr._load_whisper_model.cache_clear)
+
+    def test_diarization_runs_while_whisper_transcribes(self):
+        import tempfile
+        import threading
+        import types
+        from unittest import mock
+
+        diarizing = threading.Event()
+
+        def fake_diarize(file_path, num_speakers, progress_callback=None, wav_path=None, cancel=None):
+            diarizing.set()
+            return [{"start": 0.0, "end": 1.0, "speaker": "SPEAKER_00"}]
+
+        def fake_transcribe(path, **kwargs):
+            # Only returns if diarization started before transcription ended.
+            self.assertTrue(diarizing.wait(5))
+            return {
+                "text": "hi",
+                "language": "en",
+                "segments": [{"id": 0, "start": 0.0, "end": 1.0, "text": "hi",
+                              "words": [{"word": " hi", "start": 0.1, "end": 0.5}]}],
+            }
+
+        fake = types.ModuleType("whisper")
+        fake.load_model = lambda size: mock.Mock(transcribe=fake_transcribe)
+        with tempfile.NamedTemporaryFile(suffix=".wav") as media, \
+                mock.patch.dict(sys.modules, {"whisper": fake}), \
+                mock.patch.object(tr, "_diarize", side_effect=fake_diarize):
+            result = tr.transcribe_file(
+                media.name, engine="whisper", enable_diarization=True,
+            )
+        self.assertEqual(result["words"][0]["speaker"], "SPEAKER_00")
+
+    def test_failed_transcription_cancels_and_waits_for_diarization(self):
+        import tempfile
+        import threading
+        import types
+        from unittest import mock
+
+        extracting, finished = threading.Event(), threading.Event()
+        skipped = []
+
+        def fake_diarize(file_path, num_speakers, progress_callback=None, wav_path=None, cancel=None):
+            extracting.set()
+            self.assertTrue(cancel.wait(5))  # still "extracting" when Whisper fails
+            skipped.append(cancel.is_set())
+            finished.set()
+            return []
+
+        def fake_transcribe(path, **kwargs):
+            self.assertTrue(extracting.wait(5))
+            raise RuntimeError("decode failed")
+
+        fake = types.ModuleType("whisper")
+        fake.load_model = lambda size: mock.Mock(transcribe=fake_transcribe)
+        with tempfile.NamedTemporaryFile(suffix=".wav") as media, \
+                mock.patch.dict(sys.modules, {"whisper": fake}), \
+                mock.patch.dict(os.environ, {"PODCLI_DIARIZE_OVERLAP": ""}), \
+                mock.patch.object(tr, "_diarize", side_effect=fake_diarize):
+            with self.assertRaises(RuntimeError):
+                tr.transcribe_file(media.name, engine="whisper", enable_diarization=True)
+            self.assertTrue(finished.is_set())  # joined before the error surfaced
+        self.assertEqual(skipped, [True])
+
+    def test_overlap_can_be_turned_off(self):
+        from unittest import mock
+
+        with mock.patch.dict(os.environ, {"PODCLI_DIARIZE_OVERLAP": "0"}), \
+                mock.patch.object(tr, "ThreadPoolExecutor") as pool:
+            self.assertIsNone(tr._start_diarization("/a.mp4", None))
+        pool.assert_not_called()
+
+
+class DecodeOptionsTests(unittest.TestCase):
+    def test_single_pass_defaults_for_both_engines(self):
+        opts = tr._decode_options("whisper-py", "base", None)
+        self.assertEqual(opts, {"temperature": 0.0, "condition_on_previous_text": False})
+        opts = tr._decode_options("faster-whisper", "small", None)
+        self.assertEqual(opts["beam_size"], 1)
+        self.assertNotIn("beam_size", tr._decode_options("faster-whisper", "large-v3", None))
+
+    def test_caller_overrides_win(self):
+        opts = tr._decode_options("whisper-py", "base", {"temperature": (0.0, 0.2)})
+        self.assertEqual(opts["temperature"], (0.0, 0.2))
+        self.assertFalse(opts["condition_on_previous_text"])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,8 @@
 """Tests for backend.services.video_cut.
 
-Command shapes, the single-segment shortcut path and concat cleanup are
-checked against a mocked proc_run. Cut accuracy is checked against real
-ffmpeg on a synthetic clip with a known GOP structure.
+Command shapes and the single-segment shortcut path are checked against a
+mocked proc_run. Cut accuracy is checked against real ffmpeg on a synthetic
+clip with a known GOP structure.
 """
 
 import os
@@ -42,6 +42,19 @@ class CutSegmentTests(unittest.TestCase):
         self.assertIn("-i /in.mp4", joined)
         self.assertTrue(cmd[-1] == "/out.mp4")
 
+    def test_shares_cores_during_a_render_pool(self):
+        with mock.patch.object(video_cut, "ffmpeg_threads", return_value=3), \
+             mock.patch.object(video_cut, "proc_run", return_value=_ok()) as mocked:
+            video_cut.cut_segment("/in.mp4", "/out.mp4", 0, 5)
+        self.assertIn("-threads 3", " ".join(mocked.call_args.args[0]))
+
+    def test_audio_matches_what_the_crop_copies_through(self):
+        aac = ["-c:a", "aac", "-b:a", "192k", "-ar", "44100"]
+        with mock.patch.object(video_cut, "get_audio_encode_flags", return_value=aac), \
+             mock.patch.object(video_cut, "proc_run", return_value=_ok()) as mocked:
+            video_cut.cut_segment("/in.mp4", "/out.mp4", 0, 5)
+        self.assertIn(" ".join(aac), " ".join(mocked.call_args.args[0]))
+
     def test_raises_on_failure(self):
         with mock.patch.object(video_cut, "proc_run", return_value=_fail()):
             with self.assertRaises(RuntimeError) as ctx:
@@ -58,68 +71,80 @@ class CutMultiSegmentTests(unittest.TestCase):
             self.assertEqual(out, "/out.mp4")
             cs.assert_called_once_with("/in.mp4", "/out.mp4", 0, 5)
 
-    def test_multi_segment_invokes_cut_then_concat(self):
-        # Two-segment flow: two cut_segment calls + one proc_run for concat
-        tmpdir = tempfile.mkdtemp(prefix="podcli-cut-test-")
-        out_path = os.path.join(tmpdir, "out.mp4")
-
-        def fake_cut(input_path, out_path, start, end):
-            # Create a stub file so cleanup works
-            with open(out_path, "w") as f:
-                f.write("stub")
-            return out_path
-
-        try:
-            with mock.patch.object(
-                video_cut, "cut_segment", side_effect=fake_cut
-            ) as cs, mock.patch.object(
-                video_cut, "proc_run", return_value=_ok()
-            ) as mocked:
-                out = video_cut.cut_multi_segment(
-                    "/in.mp4",
-                    out_path,
-                    [
-                        {"start": 0, "end": 5},
-                        {"start": 10, "end": 15},
-                    ],
+    def test_multi_segment_cuts_and_joins_in_one_ffmpeg_run(self):
+        with mock.patch.object(video_cut, "has_audio_stream", return_value=True), \
+             mock.patch.object(video_cut, "cut_segment") as cs, \
+             mock.patch.object(video_cut, "proc_run", return_value=_ok()) as mocked:
+            out = video_cut.cut_multi_segment(
+                "/in.mp4", "/out.mp4",
+                [{"start": 10, "end": 15}, {"start": 20, "end": 25.5}],
+            )
+
+        self.assertEqual(out, "/out.mp4")
+        cs.assert_not_called()
+        self.assertEqual(mocked.call_count, 1)
+        cmd = mocked.call_args.args[0]
+        joined = " ".join(cmd)
+        # One input, seeked to the first range and read through the last.
+        self.assertEqual(cmd.count("-i"), 1)
+        self.assertIn("-ss 10 -t 15.5 -i /in.mp4", joined)
+        graph = cmd[cmd.index("-filter_complex") + 1].split(";")
+        self.assertEqual(graph[:2], ["[0:v]split=2[v0][v1]", "[0:a]asplit=2[a0][a1]"])
+        self.assertIn("[v1]trim=start=10.000:end=15.500,setpts=PTS-STARTPTS[cv1]", graph)
+        self.assertIn("[a0]atrim=start=0.000:end=5.000,asetpts=PTS-STARTPTS[ca0]", graph)
+        self.assertEqual(graph[-1], "[cv0][ca0][cv1][ca1]concat=n=2:v=1:a=1[v][a]")
+        self.assertIn("-map [v] -map [a]", joined)
+        self.assertNotIn("copy", cmd)
+        self.assertEqual(cmd[-1], "/out.mp4")
+
+    def test_multi_segment_without_audio_joins_video_only(self):
+        with mock.patch.object(video_cut, "has_audio_stream", return_value=False), \
+             mock.patch.object(video_cut, "proc_run", return_value=_ok()) as mocked:
+            video_cut.cut_multi_segment(
+                "/in.mp4", "/out.mp4",
+                [{"start": 0, "end": 5}, {"start": 10, "end": 15}],
+            )
+
+        cmd = mocked.call_args.args[0]
+        graph = cmd[cmd.index("-filter_complex") + 1]
+        self.assertTrue(graph.endswith("[cv0][cv1]concat=n=2:v=1:a=0[v]"))
+        self.assertNotIn("asplit", graph)
+        self.assertNotIn("[a]", cmd)
+
+    def test_unsorted_ranges_are_cut_in_source_order(self):
+        with mock.patch.object(video_cut, "has_audio_stream", return_value=False), \
+             mock.patch.object(video_cut, "proc_run", return_value=_ok()) as mocked:
+            video_cut.cut_multi_segment(
+                "/in.mp4", "/out.mp4",
+                [{"start": 30, "end": 35}, {"start": 10, "end": 15}],
+            )
+
+        cmd = mocked.call_args.args[0]
+        self.assertIn("-ss 10 -t 25 -i /in.mp4", " ".join(cmd))
+        graph = cmd[cmd.index("-filter_complex") + 1].split(";")
+        self.assertIn("[v0]trim=start=0.000:end=5.000,setpts=PTS-STARTPTS[cv0]", graph)
+        self.assertIn("[v1]trim=start=20.000:end=25.000,setpts=PTS-STARTPTS[cv1]", graph)
+
+    def test_overlapping_ranges_are_merged(self):
+        with mock.patch.object(video_cut, "cut_segment", return_value="/out.mp4") as cs, \
+             mock.patch.object(video_cut, "proc_run") as mocked:
+            video_cut.cut_multi_segment(
+                "/in.mp4", "/out.mp4",
+                [{"start": 12, "end": 20}, {"start": 10, "end": 14}, {"start": 20, "end": 22}],
+            )
+
+        mocked.assert_not_called()
+        cs.assert_called_once_with("/in.mp4", "/out.mp4", 10, 22)
+
+    def test_multi_segment_raises_on_failure(self):
+        with mock.patch.object(video_cut, "has_audio_stream", return_value=True), \
+             mock.patch.object(video_cut, "proc_run", return_value=_fail()):
+            with self.assertRaises(RuntimeError) as ctx:
+                video_cut.cut_multi_segment(
+                    "/in.mp4", "/out.mp4",
+                    [{"start": 0, "end": 5}, {"start": 10, "end": 15}],
                 )
-                self.assertEqual(out, out_path)
-                self.assertEqual(cs.call_count, 2)
-                # concat call
-                cmd = mocked.call_args.args[0]
-                self.assertIn("concat", cmd)
-                self.assertIn("-c", cmd)
-                self.assertIn("copy", cmd)
-
-            # Temp parts should be cleaned up
-            for i in range(2):
-                self.assertFalse(os.path.exists(os.path.join(tmpdir, f"_part_{i}.mp4")))
-            self.assertFalse(os.path.exists(os.path.join(tmpdir, "_concat_parts.txt")))
-        finally:
-            shutil.rmtree(tmpdir, ignore_errors=True)
-
-    def test_multi_segment_cleans_up_on_failure(self):
-        tmpdir = tempfile.mkdtemp(prefix="podcli-cut-test-")
-        out_path = os.path.join(tmpdir, "out.mp4")
-
-        def fake_cut(input_path, out_path, start, end):
-            with open(out_path, "w") as f:
-                f.write("stub")
-            return out_path
-
-        try:
-            with mock.patch.object(video_cut, "cut_segment", side_effect=fake_cut), \
-                 mock.patch.object(video_cut, "proc_run", return_value=_fail()):
-                with self.assertRaises(RuntimeError):
-                    video_cut.cut_multi_segment(
-                        "/in.mp4", out_path,
-                        [{"start": 0, "end": 5}, {"start": 10, "end": 15}],
-                    )
-            # Even on failure, temp parts are cleaned up
-            for i in range(2):
-                self.assertFalse(os.path.exists(os.path.join(tmpdir, f"_part_{i}.mp4")))
-        finally:
-            shutil.rmtree(tmpdir, ignore_errors=True)
+        self.assertIn("FFmpeg concat failed", str(ctx.exception))
 
 
 class ReExportTests(unittest.TestCase):
@@ -142,6 +167,32 @@ class NoStreamCopyTests(unittest.TestCase):
         self.assertNotIn("ffprobe", joined)
 
 
+class CopySegmentsTests(unittest.TestCase):
+    def test_one_ffmpeg_run_maps_each_input_to_its_output(self):
+        cuts = [("/a.mp4", 1.0, 4.5), ("/b.mp4", 10.0, 12.0)]
+        with mock.patch.object(video_cut, "proc_run", return_value=_ok()) as mocked:
+            out = video_cut.copy_segments("/in.mp4", cuts)
+
+        self.assertEqual(out, ["/a.mp4", "/b.mp4"])
+        self.assertEqual(mocked.call_count, 1)
+        joined = " ".join(mocked.call_args.args[0])
+        self.assertIn("-ss 1.0 -t 3.5 -i /in.mp4 -ss 10.0 -t 2.0 -i /in.mp4", joined)
+        self.assertIn("-map 0:v -map 0:a? -c copy", joined)
+        self.assertIn("-map 1:v -map 1:a? -c copy", joined)
+        self.assertLess(joined.index("/a.mp4"), joined.index("/b.mp4"))
+
+    def test_empty_batch_skips_ffmpeg(self):
+        with mock.patch.object(video_cut, "proc_run") as mocked:
+            self.assertEqual(video_cut.copy_segments("/in.mp4", []), [])
+        mocked.assert_not_called()
+
+    def test_raises_on_failure(self):
+        with mock.patch.object(video_cut, "proc_run", return_value=_fail()):
+            with self.assertRaises(RuntimeError) as ctx:
+                video_cut.copy_segments("/in.mp4", [("/a.mp4", 0, 1)])
+            self.assertIn("FFmpeg copy failed", str(ctx.exception))
+
+
 @unittest.skipUnless(
     shutil.which("ffmpeg") and shutil.which("ffprobe"), "ffmpeg/ffprobe not installed"
 )
@@ -207,6 +258,13 @@ class CutContentAccuracyTests(unittest.TestCase):
         video_cut.cut_segment(self.src, out, 5.5, 7.0)
         self._assert_frame_is(out, "magenta")
 
+    def test_multi_range_cut_starts_at_the_first_range(self):
+        out = os.path.join(self.tmpdir, "cut_multi.mp4")
+        video_cut.cut_multi_segment(
+            self.src, out, [{"start": 3.5, "end": 4.5}, {"start": 6.2, "end": 7.0}],
+        )
+        self._assert_frame_is(out, "yellow")
+
     def test_cut_on_a_keyframe_starts_at_the_requested_second(self):
         out = os.path.join(self.tmpdir, "cut_on_kf.mp4")
         video_cut.cut_segment(self.src, out, 4.0, 5.0)
@@ -1,5 +1,6 @@
 import os
 import sys
+import tempfile
 import unittest
 from unittest import mock
 
@@ -9,6 +10,9 @@ BACKEND_ROOT = os.path.join(ROOT, "backend")
 if BACKEND_ROOT not in sys.path:
     sys.path.insert(0, BACKEND_ROOT)
 
+from PIL import Image
+
+from services import captions_burn as cb
 from services import video_processor as vp
 
 
@@ -41,15 +45,97 @@ class VideoProcessorTests(unittest.TestCase):
              mock.patch.object(vp.os.path, "exists", return_value=False), \
              mock.patch.object(vp, "_run_ffmpeg_with_fallback") as run_ffmpeg, \
              mock.patch.object(vp, "proc_run", return_value=run_fail):
-            run_ffmpeg.side_effect = [
-                "/tmp/outro_scaled.mp4",  # outro scaling
-                "/tmp/out.mp4",           # soft-audio fallback
-            ]
+            run_ffmpeg.return_value = "/tmp/out.mp4"
             out = vp.concat_outro("/tmp/in.mp4", "/tmp/outro.mp4", "/tmp/out.mp4")
 
         self.assertEqual(out, "/tmp/out.mp4")
-        self.assertGreaterEqual(run_ffmpeg.call_count, 2)
-        self.assertEqual(run_ffmpeg.call_args_list[1].kwargs.get("label"), "outro_hardcut_soft_audio")
+        self.assertEqual(run_ffmpeg.call_count, 1)
+        self.assertEqual(run_ffmpeg.call_args.kwargs.get("label"), "outro_hardcut_soft_audio")
+
+    def test_concat_outro_crossfade_uses_the_shared_audio_encoder(self):
+        fdk = ["-c:a", "libfdk_aac", "-vbr", "5", "-ar", "44100"]
+        with mock.patch.object(vp, "get_dimensions", return_value=(1080, 1920)), \
+             mock.patch.object(vp, "_get_media_duration_seconds", side_effect=[20.0, 5.0]), \
+             mock.patch.object(vp, "get_video_encode_flags", return_value=vp.CPU_FLAGS), \
+             mock.patch.object(vp, "get_audio_encode_flags", return_value=fdk), \
+             mock.patch.object(vp, "proc_run", return_value=mock.Mock(returncode=0)) as run:
+            vp.concat_outro("/tmp/in.mp4", "/tmp/outro.mp4", "/tmp/out.mp4")
+
+        cmd = run.call_args.args[0]
+        self.assertIn("xfade", cmd[cmd.index("-filter_complex") + 1])
+        self.assertIn(" ".join(fdk), " ".join(cmd))
+        self.assertNotIn("192k", cmd)
+
+    def test_concat_outro_conforms_outro_rate_and_timebase_to_the_clip(self):
+        infos = {
+            "/tmp/in.mp4": {"streams": [{"codec_type": "video", "avg_frame_rate": "30000/1001",
+                                         "r_frame_rate": "30000/1001", "time_base": "1/30000"}]},
+            "/tmp/outro.mp4": {"streams": [{"codec_type": "video", "avg_frame_rate": "25/1",
+                                            "r_frame_rate": "25/1", "time_base": "1/12800"}]},
+        }
+        with mock.patch.object(vp, "get_dimensions", return_value=(1080, 1920)), \
+             mock.patch.object(vp, "_get_media_duration_seconds", side_effect=[20.0, 5.0]), \
+             mock.patch.object(vp, "get_video_info", side_effect=infos.__getitem__), \
+             mock.patch.object(vp, "get_video_encode_flags", return_value=vp.CPU_FLAGS), \
+             mock.patch.object(vp, "get_audio_encode_flags", return_value=["-c:a", "aac"]), \
+             mock.patch.object(vp, "proc_run", return_value=mock.Mock(returncode=0)) as run:
+            vp.concat_outro("/tmp/in.mp4", "/tmp/outro.mp4", "/tmp/out.mp4")
+
+        graph = run.call_args.args[0][run.call_args.args[0].index("-filter_complex") + 1]
+        self.assertIn("[0:v]fps=30000/1001,settb=AVTB,setsar=1[m]", graph)
+        self.assertIn(":black,fps=30000/1001,settb=AVTB,setsar=1[o]", graph)
+        self.assertNotIn("25/1", graph)
+
+    def test_concat_outro_hard_cut_is_one_pass_with_silence_for_mute_side(self):
+        with mock.patch.object(vp, "get_dimensions", return_value=(1080, 1920)), \
+             mock.patch.object(vp, "_get_media_duration_seconds", side_effect=[20.0, 5.0]), \
+             mock.patch.object(vp, "_has_audio_stream", side_effect=lambda p: p == "/tmp/in.mp4"), \
+             mock.patch.object(vp, "_can_concat_copy", return_value=False), \
+             mock.patch.object(vp, "_run_ffmpeg_with_fallback", return_value="/tmp/out.mp4") as run_ffmpeg, \
+             mock.patch.object(vp, "proc_run") as run:
+            vp.concat_outro("/tmp/in.mp4", "/tmp/outro.mp4", "/tmp/out.mp4", crossfade_duration=0.0)
+
+        run.assert_not_called()
+        run_ffmpeg.assert_called_once()
+        cmd = run_ffmpeg.call_args.kwargs["cmd_parts_before_enc"]
+        self.assertEqual(cmd[cmd.index("-t") + 1], "5.000")
+        graph = cmd[cmd.index("-filter_complex") + 1]
+        self.assertIn("[1:v]scale=1080:1920:force_original_aspect_ratio=decrease", graph)
+        self.assertIn("[2:a]aformat", graph)
+        self.assertTrue(graph.endswith("[m][a0][o][a1]concat=n=2:v=1:a=1[v][a]"))
+
+    def test_concat_outro_hard_cut_stream_copies_matching_files(self):
+        streams = {"streams": [
+            {"codec_type": "video", "codec_name": "h264", "width": 1080, "height": 1920,
+             "pix_fmt": "yuv420p", "r_frame_rate": "30/1", "time_base": "1/15360"},
+            {"codec_type": "audio", "codec_name": "aac", "sample_rate": "44100", "channels": 2},
+        ]}
+        ok = mock.Mock(returncode=0, stdout="", stderr="")
+        with tempfile.TemporaryDirectory() as tmp, \
+             mock.patch.object(vp, "get_dimensions", return_value=(1080, 1920)), \
+             mock.patch.object(vp, "_get_media_duration_seconds", return_value=20.0), \
+             mock.patch.object(vp, "get_video_info", return_value=streams), \
+             mock.patch.object(vp, "_run_ffmpeg_with_fallback") as run_ffmpeg, \
+             mock.patch.object(vp, "proc_run", return_value=ok) as run:
+            out = os.path.join(tmp, "out.mp4")
+            vp.concat_outro("/tmp/in.mp4", "/tmp/outro.mp4", out, crossfade_duration=0.0)
+            self.assertEqual(os.listdir(tmp), [])  # concat list cleaned up
+
+        run_ffmpeg.assert_not_called()
+        cmd = run.call_args.args[0]
+        self.assertEqual(cmd[cmd.index("-c") + 1], "copy")
+
+    def test_can_concat_copy_requires_identical_stream_parameters(self):
+        base = {"codec_type": "video", "codec_name": "h264", "width": 1080, "height": 1920}
+        infos = {
+            "/a.mp4": {"streams": [base]},
+            "/b.mp4": {"streams": [dict(base)]},
+            "/c.mp4": {"streams": [dict(base, height=1080)]},
+        }
+        with mock.patch.object(vp, "get_video_info", side_effect=infos.__getitem__):
+            self.assertTrue(vp._can_concat_copy("/a.mp4", "/b.mp4"))
+            self.assertFalse(vp._can_concat_copy("/a.mp4", "/c.mp4"))
+            self.assertFalse(vp._can_concat_copy("/a.mp4", "/missing.mp4"))
 
     def test_resolve_speaker_sides_does_not_guess_from_transcript_order(self):
         speaker_side = vp._resolve_speaker_sides(
@@ -713,6 +799,164 @@ class VideoProcessorTests(unittest.TestCase):
         track_crop.assert_not_called()
         runner.assert_called_once()
 
+    def _crop_filter(self, **kwargs):
+        with mock.patch.object(vp, "get_dimensions", return_value=(1920, 1080)), \
+             mock.patch.object(vp, "_run_ffmpeg_with_fallback", return_value="ok.mp4") as runner:
+            vp.crop_to_vertical(input_path="in.mp4", output_path="out.mp4", **kwargs)
+        before = runner.call_args.kwargs["cmd_parts_before_enc"]
+        flag = "-vf" if "-vf" in before else "-filter_complex"
+        return flag, before[before.index(flag) + 1]
+
+    def test_frame_filter_graph_matches_standalone_crop(self):
+        keyframes = [{"t": 0.0, "x_pct": 30}, {"t": 2.0, "x_pct": 70}]
+        hardcut = {"strategy": "speaker-hardcut", "face_map": {"clusters": [{"center_x": 400}]}}
+        for kwargs in ({"strategy": "manual", "crop_keyframes": keyframes}, {"strategy": "center"}, hardcut):
+            with self.subTest(strategy=kwargs["strategy"]), \
+                 mock.patch.object(vp, "_use_face_map", return_value="'if(lt(t,2),100,700)'"):
+                flag, standalone = self._crop_filter(**kwargs)
+                with mock.patch.object(vp, "get_dimensions", return_value=(1920, 1080)):
+                    graph = vp.frame_filter_graph("in.mp4", **kwargs)
+                if flag == "-vf":
+                    self.assertEqual(graph, f"[0:v]{standalone}[base]")
+                else:
+                    self.assertEqual(graph, standalone.replace("[v]", "[base]"))
+
+    def test_frame_filter_graph_leaves_face_strategies_to_crop_to_vertical(self):
+        with mock.patch.object(vp, "get_dimensions", return_value=(1920, 1080)):
+            self.assertIsNone(vp.frame_filter_graph("in.mp4", strategy="speaker"))
+            self.assertIsNone(vp.frame_filter_graph("in.mp4", strategy="manual"))
+            with mock.patch.object(vp, "_use_face_map", return_value=None):
+                self.assertIsNone(vp.frame_filter_graph(
+                    "in.mp4", strategy="speaker-hardcut", face_map={"clusters": []},
+                ))
+
+    def test_burn_applies_input_filter_before_overlays(self):
+        ok = mock.Mock(returncode=0, stdout="", stderr="")
+        with mock.patch.object(cb, "proc_run", return_value=ok) as run, \
+             mock.patch.object(cb, "gradient_png") as gradient, \
+             mock.patch.object(cb, "get_dimensions") as dims, \
+             mock.patch.object(cb, "has_audio_stream", return_value=True), \
+             mock.patch.object(cb, "get_video_encode_flags", return_value=cb.CPU_FLAGS):
+            cb.burn_captions(
+                "/seg.mp4", "/c.ass", "/out.mp4",
+                gradient_overlay=True,
+                input_filter="[0:v]crop=607:1080:0:0,scale=1080:1920[base]",
+                frame_dims=(1080, 1920),
+            )
+        cmd = run.call_args.args[0]
+        graph = cmd[cmd.index("-filter_complex") + 1]
+        self.assertTrue(graph.startswith("[0:v]crop=607:1080:0:0,scale=1080:1920[base];[base][1:v]overlay"))
+        dims.assert_not_called()
+        self.assertEqual(gradient.call_args.args[:2], (1080, 1920))
+
+    def test_intermediate_crop_skips_faststart(self):
+        for faststart in (True, False):
+            with mock.patch.object(vp, "get_dimensions", return_value=(1080, 1920)), \
+                 mock.patch.object(vp, "_crop_audio_flags", return_value=["-c:a", "copy"]), \
+                 mock.patch.object(vp, "_run_ffmpeg_with_fallback", return_value="/out.mp4") as run:
+                vp.crop_to_vertical("/seg.mp4", "/out.mp4", strategy="center", faststart=faststart)
+            after = run.call_args.kwargs["cmd_parts_after_enc"]
+            self.assertEqual("+faststart" in after, faststart)
+
+    def test_crop_copies_audio_that_is_already_aac_44k(self):
+        def info(codec, rate):
+            return {"streams": [{"codec_type": "video", "codec_name": "h264"},
+                                {"codec_type": "audio", "codec_name": codec, "sample_rate": rate}]}
+
+        encode = ["-c:a", "aac", "-b:a", "192k", "-ar", "44100"]
+        cases = [
+            (info("aac", "44100"), ["-c:a", "copy"]),
+            (info("aac", "48000"), encode),
+            (info("opus", "44100"), encode),
+            ({"streams": []}, encode),
+        ]
+        for probe, expected in cases:
+            with mock.patch.object(vp, "get_video_info", return_value=probe), \
+                 mock.patch.object(vp, "get_audio_encode_flags", return_value=encode):
+                self.assertEqual(vp._crop_audio_flags("/seg.mp4"), expected)
+
+    def test_gradient_png_ramps_bottom_half_and_is_reused(self):
+        with tempfile.TemporaryDirectory() as tmp, \
+             mock.patch.dict("config.paths.paths", {"cache": tmp}):
+            path = cb.gradient_png(4, 8, 0.5)
+            with Image.open(path) as img:
+                self.assertEqual(img.size, (4, 8))
+                alpha = [img.getpixel((0, y))[3] for y in range(8)]
+            self.assertEqual(alpha, [0, 0, 0, 0, 0, 31, 63, 95])
+            with mock.patch.object(cb, "create_gradient_png") as create:
+                self.assertEqual(cb.gradient_png(4, 8, 0.5), path)
+            create.assert_not_called()
+
+    def test_filter_path_escapes_both_parser_levels(self):
+        self.assertEqual(cb.escape_filter_path("/tmp/c.ass"), "/tmp/c.ass")
+        self.assertEqual(cb.escape_filter_path("C:/clips/c.ass"), r"C\\:/clips/c.ass")
+        self.assertEqual(
+            cb.escape_filter_path("/Joe's [live], 1;2.ass"),
+            r"/Joe\\\'s \[live\]\, 1\;2.ass",
+        )
+
+    def test_burn_uploads_rasterized_frames_for_nvenc(self):
+        nvenc = ["-c:v", "h264_nvenc", "-cq", "18"]
+        results = [mock.Mock(returncode=1, stdout="", stderr="no cuda"),
+                   mock.Mock(returncode=0, stdout="", stderr="")]
+        with mock.patch.object(cb, "proc_run", side_effect=results) as run, \
+             mock.patch.object(cb, "has_audio_stream", return_value=False), \
+             mock.patch.object(cb, "get_video_encode_flags", return_value=nvenc), \
+             mock.patch("sys.stderr"):
+            cb.burn_captions("/in.mp4", "/c.ass", "/out.mp4")
+        first, second = (c.args[0] for c in run.call_args_list)
+        self.assertEqual(first[first.index("-filter_complex") + 1], "[0:v]ass=filename=/c.ass,hwupload_cuda[out]")
+        self.assertEqual(second[second.index("-filter_complex") + 1], "[0:v]ass=filename=/c.ass[out]")
+        self.assertEqual(first[1:3], ["-hwaccel", "cuda"])
+        self.assertNotIn("-hwaccel", second)
+        self.assertIn("h264_nvenc", second)
+
+    def test_prefetch_yields_in_order_and_stops_the_producer_early(self):
+        self.assertEqual(list(vp._prefetch(iter(range(50)), depth=4)), list(range(50)))
+
+        produced = []
+
+        def items():
+            for i in range(1000):
+                produced.append(i)
+                yield i
+
+        gen = vp._prefetch(items(), depth=2)
+        self.assertEqual([next(gen) for _ in range(3)], [0, 1, 2])
+        gen.close()
+        self.assertLess(len(produced), 10)
+
+    def test_prefetch_reraises_producer_errors(self):
+        def items():
+            yield 1
+            raise RuntimeError("decode failed")
+
+        with self.assertRaises(RuntimeError):
+            list(vp._prefetch(items()))
+
+    def test_frames_at_times_decodes_sequentially_without_seeking(self):
+        class FakeCap:
+            def __init__(self, n):
+                self.n, self.pos, self.retrieved = n, -1, []
+
+            def grab(self):
+                if self.pos + 1 >= self.n:
+                    return False
+                self.pos += 1
+                return True
+
+            def retrieve(self):
+                self.retrieved.append(self.pos)
+                return True, self.pos
+
+            def set(self, *args):
+                raise AssertionError("seeked")
+
+        cap = FakeCap(n=100)
+        got = list(vp._frames_at_times(cap, [0.0, 0.25, 0.5, 3.0, 5.0], fps=30))
+        self.assertEqual(got, [(0.0, 0), (0.25, 8), (0.5, 15), (3.0, 90)])
+        self.assertEqual(cap.pos, 99)  # stopped at the end of the stream
+
 
 if __name__ == "__main__":
     unittest.main()